@@ -1,12 +1,17 @@
 from django.contrib import admin
 from django.utils import timezone
 
+from myApp import facets
+from myApp.utils import page_cache
+from myApp.utils.paginator import EstimatedCountPaginator
 from .models import Announcement
 
 
 # Register your models here.
 @admin.register(Announcement)
 class AnnouncementAdmin(admin.ModelAdmin):
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
     list_display = (
         'title',
         'place',
@@ -34,7 +39,10 @@ class AnnouncementAdmin(admin.ModelAdmin):
         Sets the announcement status to archived.
         Updates 'archive_date' only.
         """
+        keys = page_cache.queryset_keys(queryset)
         queryset.update(archive_date=timezone.now())
+        facets.rebuild(Announcement)
+        page_cache.purge(*keys)
     archive_selected.short_description = 'Archiwizuj wybrane ogłoszenia'
 
     def unarchive_selected(self, request, queryset):
@@ -42,7 +50,10 @@ class AnnouncementAdmin(admin.ModelAdmin):
         Sets the announcement status to unarchived.
         Updates 'archive_date' only
         """
+        keys = page_cache.queryset_keys(queryset)
         queryset.update(archive_date=None)
+        facets.rebuild(Announcement)
+        page_cache.purge(*keys)
     unarchive_selected.short_description = 'Odarchiwizuj wybrane ogłoszenia'
 
     def verify_selected(self, request, queryset):
@@ -50,7 +61,10 @@ class AnnouncementAdmin(admin.ModelAdmin):
         Verifies announcements made by non logged-in users.
         Updates is_verified only.
         """
+        keys = page_cache.queryset_keys(queryset)
         queryset.update(is_verified=True)
+        facets.rebuild(Announcement)
+        page_cache.purge(*keys)
     verify_selected.short_description = 'Zweryfikuj ogłoszenia'
 
     def hide_selected(self, request, queryset):
@@ -58,5 +72,8 @@ class AnnouncementAdmin(admin.ModelAdmin):
         Uses is_verified to hide announcements.
         Updates is_verified only.
         """
+        keys = page_cache.queryset_keys(queryset)
         queryset.update(is_verified=False)
+        facets.rebuild(Announcement)
+        page_cache.purge(*keys)
     hide_selected.short_description = 'Ukryj ogłoszenia'
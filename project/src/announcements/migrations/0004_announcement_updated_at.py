@@ -0,0 +1,18 @@
+# Generated by Django 5.2.18 on 2026-10-17 19:05
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('announcements', '0003_merge_20250528_1406'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='announcement',
+            name='updated_at',
+            field=models.DateTimeField(auto_now=True, verbose_name='data edycji ogłoszenia'),
+        ),
+    ]
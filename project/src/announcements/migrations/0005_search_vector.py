@@ -0,0 +1,67 @@
+# Generated by Django 5.2.18 on 2026-10-17 19:06
+
+import django.contrib.postgres.indexes
+import django.contrib.postgres.search
+from django.conf import settings
+from django.db import migrations
+
+
+# Polish is not a built-in text search configuration; fall back to
+# a copy of 'simple' when the server does not provide one.
+CREATE_SEARCH_CONFIG = """
+DO $$
+BEGIN
+    IF NOT EXISTS (SELECT 1 FROM pg_ts_config WHERE cfgname = 'polish') THEN
+        CREATE TEXT SEARCH CONFIGURATION polish (COPY = simple);
+    END IF;
+END
+$$;
+"""
+
+SEARCH_TRIGGER = """
+CREATE FUNCTION announcements_announcement_search_vector_update() RETURNS trigger AS $$
+BEGIN
+    NEW.search_vector :=
+        setweight(to_tsvector('polish', coalesce(NEW.title, '')), 'A') ||
+        setweight(to_tsvector('polish', coalesce(NEW.place, '')), 'B') ||
+        setweight(to_tsvector('polish', coalesce(NEW.description, '')), 'C');
+    RETURN NEW;
+END
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER announcements_announcement_search_vector_update
+    BEFORE INSERT OR UPDATE ON announcements_announcement
+    FOR EACH ROW EXECUTE FUNCTION announcements_announcement_search_vector_update();
+
+UPDATE announcements_announcement SET search_vector =
+    setweight(to_tsvector('polish', coalesce(title, '')), 'A') ||
+    setweight(to_tsvector('polish', coalesce(place, '')), 'B') ||
+    setweight(to_tsvector('polish', coalesce(description, '')), 'C');
+"""
+
+DROP_SEARCH_TRIGGER = """
+DROP TRIGGER IF EXISTS announcements_announcement_search_vector_update ON announcements_announcement;
+DROP FUNCTION IF EXISTS announcements_announcement_search_vector_update();
+"""
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('announcements', '0004_announcement_updated_at'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='announcement',
+            name='search_vector',
+            field=django.contrib.postgres.search.SearchVectorField(editable=False, null=True),
+        ),
+        migrations.AddIndex(
+            model_name='announcement',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['search_vector'], name='announcement_search_vector'),
+        ),
+        migrations.RunSQL(CREATE_SEARCH_CONFIG, migrations.RunSQL.noop),
+        migrations.RunSQL(SEARCH_TRIGGER, DROP_SEARCH_TRIGGER),
+    ]
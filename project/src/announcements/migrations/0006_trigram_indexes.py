@@ -0,0 +1,26 @@
+# Generated by Django 5.2.18 on 2026-10-17 19:08
+
+import django.contrib.postgres.indexes
+from django.conf import settings
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        # pg_trgm is created there.
+        ('events', '0008_trigram_indexes'),
+        ('announcements', '0005_search_vector'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='announcement',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['title'], name='announcement_title_trigram', opclasses=['gin_trgm_ops']),
+        ),
+        migrations.AddIndex(
+            model_name='announcement',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['place'], name='announcement_place_trigram', opclasses=['gin_trgm_ops']),
+        ),
+    ]
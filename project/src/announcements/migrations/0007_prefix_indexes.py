@@ -0,0 +1,26 @@
+# Generated by Django 5.2.18 on 2026-10-17 19:12
+
+import django.contrib.postgres.indexes
+import django.db.models.functions.comparison
+import django.db.models.functions.text
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('announcements', '0006_trigram_indexes'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='announcement',
+            index=models.Index(django.contrib.postgres.indexes.OpClass(django.db.models.functions.text.Upper(django.db.models.functions.comparison.Cast('title', models.TextField())), name='text_pattern_ops'), name='announcement_title_prefix'),
+        ),
+        migrations.AddIndex(
+            model_name='announcement',
+            index=models.Index(django.contrib.postgres.indexes.OpClass(django.db.models.functions.text.Upper(django.db.models.functions.comparison.Cast('place', models.TextField())), name='text_pattern_ops'), name='announcement_place_prefix'),
+        ),
+    ]
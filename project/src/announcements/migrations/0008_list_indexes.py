@@ -0,0 +1,39 @@
+# Generated by Django 5.2.18 on 2026-10-17 19:18
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('announcements', '0007_prefix_indexes'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='announcement',
+            index=models.Index(condition=models.Q(('archive_date__isnull', True), ('is_verified', True)), fields=['date', 'id'], name='announcement_active_date'),
+        ),
+        migrations.AddIndex(
+            model_name='announcement',
+            index=models.Index(condition=models.Q(('archive_date__isnull', True), ('is_verified', True)), fields=['price', 'id'], name='announcement_active_price'),
+        ),
+        migrations.AddIndex(
+            model_name='announcement',
+            index=models.Index(condition=models.Q(('archive_date__isnull', True), ('is_verified', True)), fields=['rooms', 'id'], name='announcement_active_rooms'),
+        ),
+        migrations.AddIndex(
+            model_name='announcement',
+            index=models.Index(condition=models.Q(('archive_date__isnull', False), ('is_verified', True)), fields=['date', 'id'], name='announcement_archived_date'),
+        ),
+        migrations.AddIndex(
+            model_name='announcement',
+            index=models.Index(condition=models.Q(('archive_date__isnull', False), ('is_verified', True)), fields=['price', 'id'], name='announcement_archived_price'),
+        ),
+        migrations.AddIndex(
+            model_name='announcement',
+            index=models.Index(condition=models.Q(('archive_date__isnull', False), ('is_verified', True)), fields=['rooms', 'id'], name='announcement_archived_rooms'),
+        ),
+    ]
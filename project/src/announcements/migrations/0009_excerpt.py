@@ -0,0 +1,33 @@
+# Generated by Django 5.2.18 on 2026-10-17 19:21
+
+from django.db import migrations, models
+
+from myApp.utils.excerpt import make_excerpt
+
+
+def fill_excerpts(apps, schema_editor):
+    Announcement = apps.get_model('announcements', 'Announcement')
+    rows = []
+    for row in Announcement.objects.only('description').iterator(chunk_size=1000):
+        row.excerpt = make_excerpt(row.description)
+        rows.append(row)
+        if len(rows) == 1000:
+            Announcement.objects.bulk_update(rows, ['excerpt'])
+            rows = []
+    Announcement.objects.bulk_update(rows, ['excerpt'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('announcements', '0008_list_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='announcement',
+            name='excerpt',
+            field=models.CharField(blank=True, editable=False, max_length=200, verbose_name='skrót opisu'),
+        ),
+        migrations.RunPython(fill_excerpts, migrations.RunPython.noop),
+    ]
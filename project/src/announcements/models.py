@@ -1,10 +1,15 @@
 from django.contrib.auth import get_user_model
 from django.contrib.contenttypes.fields import GenericRelation
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import SearchVectorField
 from django.db import models
 from django.urls import reverse
+from django.utils.functional import cached_property
 from django.utils import timezone
 
-from comments_and_ratings.models import Rating
+from comments_and_ratings.models import Rating, RatingSummary
+from myApp.utils.autocomplete import prefix_index
+from myApp.utils.excerpt import EXCERPT_LENGTH, update_excerpt
 from myApp.utils.upload_pather import dynamic_image_upload_pather
 
 
@@ -21,6 +26,8 @@ class Announcement(models.Model):
         - (max 10 digits).
         - date (DateTimeField): The date of announcement creation.
         - description (TextField): The description of the announcement.
+        - excerpt (CharField): Beginning of the description shown on the
+        list cards.
         - banner (ImageField): Image of the announcement.
         - creator (ForeignKey): Creator of the announcement
         (associated with the user model). Can be None for
@@ -41,6 +48,7 @@ class Announcement(models.Model):
         auto_now_add=True, verbose_name="data utworzenia ogłoszenia"
     )
     description = models.TextField(verbose_name="opis ogłoszenia")
+    excerpt = models.CharField(max_length=EXCERPT_LENGTH, blank=True, editable=False, verbose_name="skrót opisu")
     banner = models.ImageField(
         upload_to=dynamic_image_upload_pather,
         blank=True,
@@ -53,15 +61,28 @@ class Announcement(models.Model):
         blank=True,
         verbose_name="twórca ogłoszenia",
     )
+    updated_at = models.DateTimeField(
+        auto_now=True, verbose_name="data edycji ogłoszenia"
+    )
     archive_date = models.DateTimeField(
         null=True, blank=True, verbose_name="data archiwizacji"
     )
     is_verified = models.BooleanField(default=False,
                                       verbose_name="status weryfikacji")
     is_pinned = models.BooleanField(default=False, verbose_name="czy przypięte")
+    search_vector = SearchVectorField(null=True, editable=False)
 
     ratings = GenericRelation('comments_and_ratings.Rating')
     comments = GenericRelation('comments_and_ratings.Comment')
+    rating_summaries = GenericRelation('comments_and_ratings.RatingSummary')
+
+    def save(self, *args, **kwargs):
+        """
+        Overrides the default save method to keep the stored excerpt of the
+        description, shown on the list cards, up to date.
+        """
+        kwargs['update_fields'] = update_excerpt(self, kwargs.get('update_fields'))
+        super().save(*args, **kwargs)
 
     def archive_announcement(self):
         """
@@ -113,11 +134,32 @@ class Announcement(models.Model):
     class Meta:
         verbose_name = "ogłoszenie"
         verbose_name_plural = "ogłoszenia"
+        indexes = [
+            GinIndex(fields=['search_vector'], name='announcement_search_vector'),
+            GinIndex(fields=['title'], opclasses=['gin_trgm_ops'], name='announcement_title_trigram'),
+            GinIndex(fields=['place'], opclasses=['gin_trgm_ops'], name='announcement_place_trigram'),
+            prefix_index('title', 'announcement_title_prefix'),
+            prefix_index('place', 'announcement_place_prefix'),
+            # Pages of the active and archived lists for every sort option,
+            # seeking on (sort column, id) in either direction.
+            *[
+                models.Index(
+                    fields=[column, 'id'],
+                    condition=models.Q(is_verified=True, archive_date__isnull=not archived),
+                    name=f'announcement_{scope}_{column}',
+                )
+                for scope, archived in [('active', False), ('archived', True)]
+                for column in ['date', 'price', 'rooms']
+            ],
+        ]
+
+    @cached_property
+    def rating_summary(self):
+        return RatingSummary.objects.for_object(self)
 
     @property
     def average_rating(self):
-        result = self.ratings.aggregate(models.Avg('rating'))
-        return round(result['rating__avg'], 1) if result['rating__avg'] else None
+        return self.rating_summary.average
 
     def get_user_rating(self, user):
         try:
@@ -23,6 +23,16 @@ urlpatterns = [
         {'filter': 'all_archived'},
         name='list_archived_announcement',
     ),
+    path(
+        'cards/<str:filter>/',
+        views.AnnouncementCardsView.as_view(),
+        name='announcement_cards',
+    ),
+    path(
+        'autocomplete/',
+        views.AnnouncementAutocompleteView.as_view(),
+        name='autocomplete_announcement',
+    ),
     path(
         'announcement_detail/<int:pk>/',
         views.AnnouncementDetailView.as_view(),
@@ -1,23 +1,33 @@
 from django.contrib import messages
 from django.contrib.auth.mixins import LoginRequiredMixin
-from django.contrib.contenttypes.models import ContentType
 from django.db import models
-from django.db.models import Q, Case, When, IntegerField
+from django.db.models import Case, When, IntegerField
 from django.shortcuts import get_object_or_404, redirect
 from django.urls import reverse_lazy
 from django.views import View
 from django.views.generic import (CreateView, DeleteView, DetailView, ListView,
                                   UpdateView)
 
-from comments_and_ratings.forms import CommentForm
+from comments_and_ratings.views import EngagementContextMixin, EngagementListMixin
+from myApp.models import Facet
+from myApp.utils.autocomplete import AutocompleteView
+from myApp.utils.conditional_get import ConditionalGetMixin
+from myApp.utils.infinite_scroll import ListFragmentMixin
+from myApp.utils.keyset import KeysetPaginationMixin
+from myApp.utils.paginator import EstimatedCountPaginator
+from myApp.utils.page_cache import AnonymousPageCacheMixin
+from myApp.utils.search import full_text_search, suggest
 from .forms import AnnouncementForm
 from .models import Announcement
 
 
-class AnnouncementListView(ListView):
+class AnnouncementListView(AnonymousPageCacheMixin, ConditionalGetMixin, KeysetPaginationMixin, EngagementListMixin, ListView):
     model = Announcement
     context_object_name = 'announcements'
+    card_fields = ['title', 'place', 'rooms', 'price', 'date', 'banner', 'excerpt', 'archive_date']
     paginate_by = 10
+    paginator_class = EstimatedCountPaginator
+    fuzzy_search_fields = ['title', 'place']
 
     def get_queryset(self):
         queryset = super().get_queryset().filter(is_verified=True)
@@ -32,11 +42,8 @@ class AnnouncementListView(ListView):
             queryset = queryset.filter(creator=self.request.user)
 
         if search_for := self.request.GET.get('keyword'):
-            queryset = queryset.filter(
-                Q(title__icontains=search_for) |
-                Q(description__icontains=search_for) |
-                Q(place__icontains=search_for)
-            )
+            self.unsearched_queryset = queryset
+            queryset = full_text_search(queryset, search_for, self.fuzzy_search_fields)
 
         if filter_place := self.request.GET.get('place'):
             queryset = queryset.filter(place=filter_place)
@@ -72,26 +79,36 @@ class AnnouncementListView(ListView):
                     sort_options[sort_by]
                 )
         else:
+            default_order = ['-date']
+            if 'search_rank' in queryset.query.annotations:
+                # Search results are ordered by relevance first.
+                default_order.insert(0, '-search_rank')
             if self.kwargs['filter'] == 'my':
                 queryset = queryset.order_by(
                     'is_archived_flag',
-                    '-date'
+                    *default_order
                 )
             else:
                 queryset = queryset.order_by(
-                    '-date'
+                    *default_order
                 )
 
         return queryset
 
+    def get_card_context(self, object_list):
+        context = super().get_card_context(object_list)
+        context['is_my_announcements'] = self.kwargs.get('filter') == 'my'
+        return context
+
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
+        if (search_text := self.request.GET.get('keyword')) and not context['object_list']:
+            context['search_suggestion'] = suggest(self.unsearched_queryset, search_text, self.fuzzy_search_fields)
         current_filter = self.kwargs.get('filter')
 
         context.update({
             'is_all_announcements': current_filter in ['all_non_archived', 'all_archived'],
             'is_archived': current_filter == 'all_archived',
-            'is_my_announcements': current_filter == 'my',
             'request': self.request,
             'page_param': "page",
             'selected_place': self.request.GET.get('place', ''),
@@ -132,69 +149,31 @@ class AnnouncementListView(ListView):
             }
         ]
 
+        # Places with their announcement counts, from the precomputed facet.
         if context['is_my_announcements']:
-            context['available_places'] = (Announcement.objects
-                                           .filter(creator=self.request.user)
-                                           .order_by('place')
-                                           .values_list('place', flat=True)
-                                           .distinct())
+            context['available_places'] = Facet.objects.counts(Announcement, creator=self.request.user)
         else:
-            context['available_places'] = (Announcement.objects
-                                           .order_by('place')
-                                           .values_list('place', flat=True)
-                                           .distinct())
+            context['available_places'] = Facet.objects.counts(Announcement, archived=context['is_archived'])
 
         return context
 
 
-class AnnouncementDetailView(DetailView):
-    """View showing announcement details:"""
+class AnnouncementCardsView(ListFragmentMixin, AnnouncementListView):
+    """Cards of the next page of an announcement list, appended while the list is scrolled."""
+    cards_template_name = 'announcements/includes/announcement_cards.html'
+    filters = ('all_non_archived', 'all_archived', 'my')
 
-    model = Announcement
-    context_object_name = 'announcement'
 
-    def get_context_data(self, **kwargs):
-        context = super().get_context_data(**kwargs)
-        announcement = self.object
+class AnnouncementAutocompleteView(AutocompleteView):
+    queryset = Announcement.objects.filter(is_verified=True)
+    fields = ['title', 'place']
 
-        content_type = ContentType.objects.get_for_model(announcement)
-        object_id = announcement.id
 
-        context['content_type'] = content_type
-        context['object_id'] = object_id
-        context['comments'] = announcement.comments.filter(parent_comment__isnull=True).order_by('-created_at')
-        context['comment_form'] = CommentForm()
-        context['average_rating'] = announcement.average_rating
-        context['ratings_count'] = announcement.ratings.count()
-
-        if self.request.user.is_authenticated:
-            rating_obj = announcement.ratings.filter(user=self.request.user).first()
-            context['user_rating'] = rating_obj.rating if rating_obj else None
-            context['user_rating_id'] = rating_obj.id if rating_obj else None
-
-        if announcement.average_rating is not None:
-            average = float(context['average_rating'])
-            full_stars = int(average)
-            has_half = (average - full_stars) >= 0.5
-            empty_stars = 10 - full_stars - (1 if has_half else 0)
-
-            context.update({
-                'stars_data': {
-                    'full': full_stars,
-                    'half': has_half,
-                    'empty': empty_stars
-                }
-            })
-        else:
-            context.update({
-                'stars_data': {
-                    'full': 0,
-                    'half': False,
-                    'empty': 10
-                }
-            })
+class AnnouncementDetailView(AnonymousPageCacheMixin, ConditionalGetMixin, EngagementContextMixin, DetailView):
+    """View showing announcement details:"""
 
-        return context
+    model = Announcement
+    context_object_name = 'announcement'
 
 
 class AnnouncementCreateView(CreateView):
@@ -0,0 +1,27 @@
+"""
+Urls of the read-only JSON API (version 1) - listing events, announcements,
+galleries, photos of a gallery and polls with the filters of the list pages.
+"""
+from django.urls import path
+
+from . import views
+
+app_name = 'api'
+
+urlpatterns = [
+    path('events/', views.EventApiView.as_view(), {'filter': 'all_non_archived'}, name='event_list'),
+    path('events/archived/', views.EventApiView.as_view(), {'filter': 'all_archived'}, name='archived_event_list'),
+    path('events/my/', views.EventApiView.as_view(), {'filter': 'my'}, name='user_event_list'),
+    path('announcements/', views.AnnouncementApiView.as_view(), {'filter': 'all_non_archived'},
+         name='announcement_list'),
+    path('announcements/archived/', views.AnnouncementApiView.as_view(), {'filter': 'all_archived'},
+         name='archived_announcement_list'),
+    path('announcements/my/', views.AnnouncementApiView.as_view(), {'filter': 'my'},
+         name='user_announcement_list'),
+    path('galleries/', views.GalleryApiView.as_view(), {'filter': 'all'}, name='gallery_list'),
+    path('galleries/my/', views.GalleryApiView.as_view(), {'filter': 'my'}, name='user_gallery_list'),
+    path('galleries/<slug:slug>/photos/', views.PhotoApiView.as_view(), name='photo_list'),
+    path('polls/', views.PollApiView.as_view(), {'filter': 'all_non_archived'}, name='poll_list'),
+    path('polls/archived/', views.PollApiView.as_view(), {'filter': 'all_archived'}, name='archived_poll_list'),
+    path('polls/my/', views.PollApiView.as_view(), {'filter': 'my'}, name='user_poll_list'),
+]
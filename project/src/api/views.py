@@ -0,0 +1,226 @@
+from django.core.exceptions import FieldDoesNotExist
+from django.core.paginator import InvalidPage
+from django.db.models import FileField
+from django.http import JsonResponse
+from django.views.generic import ListView
+
+from announcements.views import AnnouncementListView
+from events.views import EventListView
+from myApp.utils.conditional_get import ConditionalGetMixin
+from myApp.utils.keyset import keyset_ordering, keyset_page
+from myApp.utils.paginator import EstimatedCountPaginator
+from photo_gallery.models import Photo
+from photo_gallery.views import GalleryListView
+from polls.views import PollListView
+
+# Seconds shared caches may reuse an anonymous response without revalidating.
+API_MAX_AGE = 60
+MAX_PAGE_SIZE = 100
+
+
+class ApiError(Exception):
+    """Error of an API request, answered with a JSON message and the status code."""
+
+    def __init__(self, message, status=400):
+        super().__init__(message)
+        self.message = message
+        self.status = status
+
+
+class ApiListMixin(ConditionalGetMixin):
+    """
+    Mixin turning a list view into a read-only JSON endpoint with the same
+    filters, search and sort options (the list view's `get_queryset`).
+
+    Rows are serialized straight from a `values()` queryset of the
+    `api_fields` (API name: field lookup); the `fields` parameter selects
+    a subset of them. Pages are fetched by cursors (`after`, `before`),
+    or by number (`page`) for lists that can't be keyed, e.g. search
+    results ordered by rank; `limit` sets the page size. Responses carry
+    an ETag and may be cached by shared caches for a while.
+    """
+    api_fields = {}
+    max_age = API_MAX_AGE
+
+    def dispatch(self, request, *args, **kwargs):
+        try:
+            return super().dispatch(request, *args, **kwargs)
+        except ApiError as error:
+            return JsonResponse({'error': error.message}, status=error.status)
+
+    def handle_no_permission(self):
+        raise ApiError("Wymagane zalogowanie", status=403)
+
+    def get_api_fields(self):
+        return self.api_fields
+
+    def get_fields(self):
+        """Returns the API names of the requested fields."""
+        api_fields = self.get_api_fields()
+        fields = [name.strip() for name in self.request.GET.get('fields', '').split(',') if name.strip()]
+        if not fields:
+            return list(api_fields)
+
+        unknown = [name for name in fields if name not in api_fields]
+        if unknown:
+            raise ApiError(f"Nieznane pola: {', '.join(unknown)}. Dostępne pola: {', '.join(api_fields)}")
+        return fields
+
+    def get_page_size(self):
+        try:
+            limit = int(self.request.GET.get('limit', self.paginate_by))
+        except ValueError:
+            raise ApiError("Nieprawidłowy rozmiar strony")
+        if limit < 1:
+            raise ApiError("Nieprawidłowy rozmiar strony")
+        return min(limit, MAX_PAGE_SIZE)
+
+    def get_page_url(self, **params):
+        """Returns the URL of the current request with the parameters replaced (None removes one)."""
+        query = self.request.GET.copy()
+        for name, value in params.items():
+            query.pop(name, None)
+            if value is not None:
+                query[name] = value
+        return self.request.build_absolute_uri(f'{self.request.path}?{query.urlencode()}')
+
+    def get(self, request, *args, **kwargs):
+        fields = self.get_fields()
+        api_fields = self.get_api_fields()
+        queryset = self.get_queryset()
+        page_size = self.get_page_size()
+
+        keys = keyset_ordering(queryset)
+        lookups = {api_fields[name] for name in fields}
+        if keys is not None:
+            # The cursors are made of the sort columns.
+            lookups.update(name for name, _, _ in keys)
+        rows = queryset.prefetch_related(None).values(*lookups)
+
+        if keys is not None and self.page_kwarg not in request.GET:
+            try:
+                page = keyset_page(rows, keys, page_size, request.GET.get('after'), request.GET.get('before'))
+            except ValueError:
+                raise ApiError("Nieprawidłowy kursor strony")
+            next_url = page.next_cursor and self.get_page_url(after=page.next_cursor, before=None)
+            previous_url = page.previous_cursor and self.get_page_url(before=page.previous_cursor, after=None)
+        else:
+            paginator = self.get_paginator(rows, page_size)
+            try:
+                page = paginator.page(request.GET.get(self.page_kwarg) or 1)
+            except InvalidPage:
+                raise ApiError("Nieprawidłowy numer strony", status=404)
+            next_url = page.has_next() and self.get_page_url(**{self.page_kwarg: page.next_page_number()})
+            previous_url = page.has_previous() and self.get_page_url(**{self.page_kwarg: page.previous_page_number()})
+
+        return JsonResponse({
+            'results': self.serialize(page.object_list, fields),
+            'next': next_url or None,
+            'previous': previous_url or None,
+        })
+
+    def serialize(self, rows, fields):
+        """Returns the rows as dicts of the requested fields; files are given as their URLs."""
+        api_fields = self.get_api_fields()
+        storages = {}
+        for name in fields:
+            try:
+                field = self.model._meta.get_field(api_fields[name])
+            except FieldDoesNotExist:
+                continue
+            if isinstance(field, FileField):
+                storages[name] = field.storage
+
+        results = []
+        for row in rows:
+            item = {name: row[api_fields[name]] for name in fields}
+            for name, storage in storages.items():
+                item[name] = storage.url(item[name]) if item[name] else None
+            results.append(item)
+        return results
+
+
+class EventApiView(ApiListMixin, EventListView):
+    api_fields = {
+        'id': 'id',
+        'name': 'event_name',
+        'date': 'event_date',
+        'location': 'location',
+        'excerpt': 'excerpt',
+        'image': 'image',
+        'is_archived': 'is_archived',
+        'creator': 'creator__username',
+        'created_at': 'created_at',
+        'updated_at': 'updated_at',
+        'ratings_count': 'engagement_rating_count',
+        'comments_count': 'engagement_comments_count',
+    }
+
+
+class AnnouncementApiView(ApiListMixin, AnnouncementListView):
+    api_fields = {
+        'id': 'id',
+        'title': 'title',
+        'place': 'place',
+        'rooms': 'rooms',
+        'price': 'price',
+        'date': 'date',
+        'excerpt': 'excerpt',
+        'banner': 'banner',
+        'archive_date': 'archive_date',
+        'creator': 'creator__username',
+        'updated_at': 'updated_at',
+        'ratings_count': 'engagement_rating_count',
+        'comments_count': 'engagement_comments_count',
+    }
+
+
+class GalleryApiView(ApiListMixin, GalleryListView):
+    api_fields = {
+        'id': 'id',
+        'title': 'title',
+        'slug': 'slug',
+        'excerpt': 'excerpt',
+        'thumbnail': 'thumbnail',
+        'creator': 'creator__username',
+        'created_at': 'created_at',
+        'updated_at': 'updated_at',
+        'ratings_count': 'engagement_rating_count',
+        'comments_count': 'engagement_comments_count',
+    }
+
+
+class PhotoApiView(ApiListMixin, ListView):
+    """Photos of a gallery, newest first, as on the gallery page."""
+    model = Photo
+    paginate_by = 20
+    paginator_class = EstimatedCountPaginator
+    api_fields = {
+        'id': 'id',
+        'title': 'title',
+        'description': 'description',
+        'image': 'image',
+        'uploaded_at': 'uploaded_at',
+        'updated_at': 'updated_at',
+    }
+
+    def get_queryset(self):
+        return Photo.objects.filter(gallery__slug=self.kwargs['slug']).order_by('-uploaded_at')
+
+
+class PollApiView(ApiListMixin, PollListView):
+    api_fields = {
+        'id': 'id',
+        'question': 'question',
+        'creation_date': 'creation_date',
+        'end_date': 'end_date',
+        'archive_date': 'archive_date',
+        'creator': 'creator__username',
+        'choice_count': 'choice_count',
+    }
+
+    def get_api_fields(self):
+        """Add whether the current user has voted, known for logged-in users only."""
+        if self.request.user.is_authenticated:
+            return {**self.api_fields, 'user_has_voted': 'user_has_voted'}
+        return self.api_fields
@@ -5,11 +5,14 @@ allowing administrators to manage comments/ratings through the built-in admin in
 """
 
 from django.contrib import admin
+from myApp.utils.paginator import EstimatedCountPaginator
 from .models import Rating, Comment
 
 
 @admin.register(Rating)
 class EventAdmin(admin.ModelAdmin):
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
     list_display = ('content_type',
                     'object_id',
                     'user',
@@ -20,6 +23,8 @@ class EventAdmin(admin.ModelAdmin):
 
 @admin.register(Comment)
 class EventAdmin(admin.ModelAdmin):
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
     list_display = ('content_type',
                     'object_id',
                     'user',
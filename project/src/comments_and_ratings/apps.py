@@ -4,3 +4,6 @@ from django.apps import AppConfig
 class CommentsAndRatingsConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'comments_and_ratings'
+
+    def ready(self):
+        from . import signals
@@ -0,0 +1,182 @@
+from django.contrib.auth import get_user_model
+from django.contrib.contenttypes.models import ContentType
+from django.db import connection
+from django.db.models import Count, IntegerField, OuterRef, Subquery, Value
+from django.db.models.functions import Coalesce
+from django.utils.dateparse import parse_datetime
+
+from myApp.utils.keyset import decode_cursor, encode_cursor
+
+from .models import Comment, Rating, RatingSummary, empty_histogram
+
+
+def with_engagement(queryset, user=None):
+    """
+    Annotates a queryset of rated and commented objects with their rating
+    summary, the given user's rating and the number of top-level comments,
+    as subqueries of the same SELECT. Read the result with `engagement_for`.
+    """
+    content_type = ContentType.objects.get_for_model(queryset.model)
+    summaries = RatingSummary.objects.filter(content_type=content_type, object_id=OuterRef('pk'))
+    top_level_comments = (Comment.objects
+                          .filter(content_type=content_type, object_id=OuterRef('pk'),
+                                  parent_comment__isnull=True)
+                          .order_by()
+                          .values('object_id')
+                          .annotate(count=Count('id'))
+                          .values('count'))
+
+    annotations = {
+        'engagement_rating_count': Coalesce(Subquery(summaries.values('rating_count')), 0),
+        'engagement_rating_sum': Coalesce(Subquery(summaries.values('rating_sum')), 0),
+        'engagement_histogram': Subquery(summaries.values('histogram')),
+        'engagement_comments_count': Coalesce(Subquery(top_level_comments), 0),
+    }
+    if user is not None and user.is_authenticated:
+        user_ratings = Rating.objects.filter(content_type=content_type, object_id=OuterRef('pk'), user=user)
+        annotations['engagement_user_rating'] = Subquery(user_ratings.values('rating'))
+        annotations['engagement_user_rating_id'] = Subquery(user_ratings.values('id'))
+    else:
+        annotations['engagement_user_rating'] = Value(None, output_field=IntegerField())
+        annotations['engagement_user_rating_id'] = Value(None, output_field=IntegerField())
+    return queryset.annotate(**annotations)
+
+
+def engagement_for(obj):
+    """
+    Returns the engagement of an object fetched with `with_engagement` as
+    a dict with 'summary', 'ratings_count', 'average_rating', 'stars_data',
+    'rating_histogram', 'user_rating', 'user_rating_id' and 'comments_count'
+    (top-level comments). The summary is also cached as `rating_summary`.
+    """
+    summary = RatingSummary(
+        content_type=ContentType.objects.get_for_model(obj),
+        object_id=obj.pk,
+        rating_count=obj.engagement_rating_count,
+        rating_sum=obj.engagement_rating_sum,
+        histogram=obj.engagement_histogram or empty_histogram(),
+    )
+    obj.rating_summary = summary
+    return {
+        'summary': summary,
+        'ratings_count': summary.rating_count,
+        'average_rating': summary.average,
+        'stars_data': summary.stars_data,
+        'rating_histogram': summary.histogram,
+        'user_rating': obj.engagement_user_rating,
+        'user_rating_id': obj.engagement_user_rating_id,
+        'comments_count': obj.engagement_comments_count,
+    }
+
+
+COMMENTS_PER_PAGE = 20
+
+COMMENT_THREAD_SQL = """
+    WITH RECURSIVE thread AS (
+        (SELECT c.id, 0 AS depth
+         FROM {comment} c
+         WHERE c.content_type_id = %s
+           AND c.object_id = %s
+           AND c.parent_comment_id IS NULL
+           {after}
+         ORDER BY c.created_at DESC, c.id DESC
+         LIMIT %s)
+        UNION ALL
+        SELECT c.id, thread.depth + 1
+        FROM {comment} c
+        JOIN thread ON c.parent_comment_id = thread.id
+        WHERE c.is_active
+    )
+    SELECT c.*, thread.depth AS thread_depth, u.{username} AS thread_username
+    FROM thread
+    JOIN {comment} c ON c.id = thread.id
+    JOIN {user} u ON u.{user_pk} = c.user_id
+    ORDER BY c.created_at DESC, c.id DESC
+"""
+
+
+def load_comment_thread(obj, after=None, limit=None):
+    """
+    Returns the top-level comments of an object with their whole reply tree.
+
+    The tree is fetched with one recursive query joined with the authors.
+    Active replies are attached in memory, so `get_replies` and `user`
+    of every comment in the thread no longer hit the database.
+
+    Args:
+        obj: The commented object.
+        after (tuple): Optional (created_at, id) keyset of the last top-level
+            comment already shown; only older comments are returned.
+        limit (int): Optional maximum number of top-level comments.
+    """
+    User = get_user_model()
+    quote = connection.ops.quote_name
+    sql = COMMENT_THREAD_SQL.format(
+        comment=quote(Comment._meta.db_table),
+        user=quote(User._meta.db_table),
+        user_pk=quote(User._meta.pk.column),
+        username=quote(User._meta.get_field('username').column),
+        after='AND (c.created_at, c.id) < (%s, %s)' if after else '',
+    )
+    content_type = ContentType.objects.get_for_model(obj)
+    params = [content_type.id, obj.pk, *(after or ()), limit]
+    comments = list(Comment.objects.raw(sql, params))
+
+    by_id = {}
+    for comment in comments:
+        comment.user = User.from_db(
+            Comment.objects.db, ['id', 'username'], [comment.user_id, comment.thread_username]
+        )
+        comment.thread_replies = []
+        by_id[comment.id] = comment
+
+    top_level = []
+    for comment in comments:
+        if comment.parent_comment_id is None:
+            top_level.append(comment)
+        else:
+            parent = by_id[comment.parent_comment_id]
+            comment.parent_comment = parent
+            parent.thread_replies.append(comment)
+    return top_level
+
+
+def load_comment_page(obj, cursor=None, per_page=COMMENTS_PER_PAGE):
+    """
+    Returns a page of top-level comments (with replies) of an object and
+    the cursor of the next page, or None on the last page.
+
+    Pages are keyed on (created_at, id) of the last comment, so every page
+    costs the same regardless of how many comments the object has.
+
+    Raises:
+        ValueError: If the cursor is malformed.
+    """
+    after = decode_cursor(cursor, parse_datetime, int) if cursor else None
+    comments = load_comment_thread(obj, after=after, limit=per_page + 1)
+
+    next_cursor = None
+    if len(comments) > per_page:
+        comments = comments[:per_page]
+        next_cursor = encode_cursor(comments[-1].created_at, comments[-1].id)
+    return comments, next_cursor
+
+
+def comment_list_context(obj, count=None):
+    """
+    Returns the context of `comment_list.html` for an object:
+    the first page of its comments, the next page cursor
+    and the number of top-level comments (counted unless given).
+    """
+    comments, next_cursor = load_comment_page(obj)
+    if count is None:
+        count = Comment.objects.filter(
+            content_type=ContentType.objects.get_for_model(obj),
+            object_id=obj.pk,
+            parent_comment__isnull=True,
+        ).count()
+    return {
+        'comments': comments,
+        'comments_cursor': next_cursor,
+        'comments_count': count,
+    }
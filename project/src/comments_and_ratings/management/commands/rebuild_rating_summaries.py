@@ -0,0 +1,11 @@
+from django.core.management.base import BaseCommand
+
+from comments_and_ratings.models import RatingSummary
+
+
+class Command(BaseCommand):
+    help = "Recomputes all rating summaries (counts, sums, histograms and scores) from the ratings table."
+
+    def handle(self, *args, **options):
+        built = RatingSummary.objects.rebuild()
+        self.stdout.write(self.style.SUCCESS(f"Przebudowano podsumowania ocen: {built}"))
@@ -0,0 +1,57 @@
+# Generated by Django 5.2.18 on 2026-10-17 18:51
+
+import django.db.models.deletion
+from django.db import migrations, models
+from django.db.models import Count, Sum
+
+PRIOR_MEAN = 5.5
+PRIOR_WEIGHT = 5
+
+
+def build_rating_summaries(apps, schema_editor):
+    Rating = apps.get_model('comments_and_ratings', 'Rating')
+    RatingSummary = apps.get_model('comments_and_ratings', 'RatingSummary')
+
+    totals = (Rating.objects
+              .values('content_type_id', 'object_id')
+              .annotate(count=Count('id'), total=Sum('rating'))
+              .order_by())
+    RatingSummary.objects.bulk_create(
+        RatingSummary(
+            content_type_id=row['content_type_id'],
+            object_id=row['object_id'],
+            rating_count=row['count'],
+            rating_sum=row['total'],
+            score=(PRIOR_MEAN * PRIOR_WEIGHT + row['total']) / (PRIOR_WEIGHT + row['count']),
+        )
+        for row in totals
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('comments_and_ratings', '0001_squashed_0003_alter_rating_rating'),
+        ('contenttypes', '0002_remove_content_type_name'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='RatingSummary',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('object_id', models.PositiveIntegerField(verbose_name='id obiektu')),
+                ('rating_count', models.PositiveIntegerField(default=0, verbose_name='liczba ocen')),
+                ('rating_sum', models.PositiveIntegerField(default=0, verbose_name='suma ocen')),
+                ('score', models.FloatField(default=0, verbose_name='wynik rankingu')),
+                ('content_type', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='contenttypes.contenttype', verbose_name='oceniana zawartosc')),
+            ],
+            options={
+                'verbose_name': 'Podsumowanie ocen',
+                'verbose_name_plural': 'Podsumowania ocen',
+                'indexes': [models.Index(fields=['content_type', '-score'], name='rating_summary_leaderboard')],
+                'constraints': [models.UniqueConstraint(fields=('content_type', 'object_id'), name='unique_rating_summary')],
+            },
+        ),
+        migrations.RunPython(build_rating_summaries, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,41 @@
+# Generated by Django 5.2.18 on 2026-10-17 18:56
+
+import comments_and_ratings.models
+import django.contrib.postgres.fields
+from django.db import migrations, models
+from django.db.models import Count
+
+
+def fill_histograms(apps, schema_editor):
+    Rating = apps.get_model('comments_and_ratings', 'Rating')
+    RatingSummary = apps.get_model('comments_and_ratings', 'RatingSummary')
+
+    histograms = {}
+    buckets = (Rating.objects
+               .values_list('content_type_id', 'object_id', 'rating')
+               .annotate(count=Count('id'))
+               .order_by())
+    for content_type_id, object_id, rating, count in buckets:
+        histogram = histograms.setdefault((content_type_id, object_id), [0] * 10)
+        histogram[rating - 1] = count
+
+    summaries = list(RatingSummary.objects.all())
+    for summary in summaries:
+        summary.histogram = histograms.get((summary.content_type_id, summary.object_id), [0] * 10)
+    RatingSummary.objects.bulk_update(summaries, ['histogram'], batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('comments_and_ratings', '0004_ratingsummary'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='ratingsummary',
+            name='histogram',
+            field=django.contrib.postgres.fields.ArrayField(base_field=models.PositiveIntegerField(), default=comments_and_ratings.models.empty_histogram, size=10, verbose_name='rozkład ocen'),
+        ),
+        migrations.RunPython(fill_histograms, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,32 @@
+# Generated by Django 5.2.18 on 2026-10-17 19:01
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('comments_and_ratings', '0005_ratingsummary_histogram'),
+        ('contenttypes', '0002_remove_content_type_name'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='comment',
+            index=models.Index(fields=['content_type', 'object_id'], name='comment_object'),
+        ),
+        migrations.AddIndex(
+            model_name='comment',
+            index=models.Index(condition=models.Q(('parent_comment__isnull', True)), fields=['content_type', 'object_id', '-created_at', '-id'], name='comment_top_level_page'),
+        ),
+        migrations.AddIndex(
+            model_name='comment',
+            index=models.Index(condition=models.Q(('is_active', True)), fields=['parent_comment', '-created_at'], name='comment_active_replies'),
+        ),
+        migrations.AddIndex(
+            model_name='rating',
+            index=models.Index(fields=['content_type', 'object_id'], include=('rating', 'user'), name='rating_object_covering'),
+        ),
+    ]
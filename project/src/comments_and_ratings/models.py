@@ -3,10 +3,75 @@ from django.contrib.contenttypes.fields import GenericForeignKey
 from django.contrib.contenttypes.models import ContentType
 from django.contrib.auth import get_user_model
 from django.core.validators import MinValueValidator, MaxValueValidator
+from django.contrib.postgres.fields import ArrayField
+from django.db import connections, transaction
+from django.db.models import Count, F
+from django.db.models.signals import post_save
+from django.utils import timezone
 
 User = get_user_model()
 
 
+RATING_UPSERT_SQL = """
+    WITH previous AS (
+        SELECT rating FROM {table}
+        WHERE content_type_id = %s AND object_id = %s AND user_id = %s
+    )
+    INSERT INTO {table} (content_type_id, object_id, user_id, rating, created_at, updated_at)
+    VALUES (%s, %s, %s, %s, %s, %s)
+    ON CONFLICT (content_type_id, object_id, user_id)
+    DO UPDATE SET rating = EXCLUDED.rating, updated_at = EXCLUDED.updated_at
+    RETURNING id, created_at, xmax = 0, (SELECT rating FROM previous)
+"""
+
+
+class RatingManager(models.Manager):
+    """Manager providing the single-statement write path of ratings."""
+
+    def upsert(self, content_type, object_id, user, rating):
+        """
+        Creates or updates the rating of a user for an object with one
+        INSERT ... ON CONFLICT DO UPDATE statement, safe under concurrent
+        submissions of the same user.
+
+        Sends post_save like a regular save, with the replaced value known,
+        so the rating summary is adjusted by delta in the same transaction.
+
+        Returns:
+            tuple: (rating instance, whether it was created, previous rating or None)
+        """
+        now = timezone.now()
+        key = [content_type.pk, object_id, user.pk]
+        with transaction.atomic(using=self.db):
+            with connections[self.db].cursor() as cursor:
+                cursor.execute(
+                    RATING_UPSERT_SQL.format(table=connections[self.db].ops.quote_name(self.model._meta.db_table)),
+                    key + key + [rating, now, now],
+                )
+                pk, created_at, created, previous = cursor.fetchone()
+
+            instance = self.model(
+                id=pk,
+                content_type=content_type,
+                object_id=object_id,
+                user=user,
+                rating=rating,
+                created_at=created_at,
+                updated_at=now,
+            )
+            instance._state.adding = False
+            instance._state.db = self.db
+            # A row inserted by a concurrent request after this statement's
+            # snapshot has no visible previous value; the summary is then
+            # recomputed instead of adjusted.
+            if created or previous is not None:
+                instance._loaded_rating = previous
+
+            post_save.send(sender=self.model, instance=instance, created=created,
+                           update_fields=None, raw=False, using=self.db)
+        return instance, created, previous
+
+
 class Rating(models.Model):
     """
     A model representing a user rating associated with any content type.
@@ -38,14 +103,31 @@ class Rating(models.Model):
         verbose_name="data edycji oceny"
     )
 
+    objects = RatingManager()
+
     class Meta:
         verbose_name = "Ocena"
         verbose_name_plural = "Oceny"
         unique_together = ('content_type', 'object_id', 'user')
+        indexes = [
+            # Covers the grouped counters and averages of rated objects.
+            models.Index(
+                fields=['content_type', 'object_id'],
+                include=['rating', 'user'],
+                name='rating_object_covering',
+            ),
+        ]
 
     def __str__(self):
         return f"{self.rating}/10 by {self.user.username} for {self.content_object}"
 
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        """Remembers the stored rating, so summaries can be updated by delta."""
+        instance = super().from_db(db, field_names, values)
+        instance._loaded_rating = instance.__dict__.get('rating')
+        return instance
+
 
 class Comment(models.Model):
     """
@@ -93,15 +175,242 @@ class Comment(models.Model):
         verbose_name = "Komentarz"
         verbose_name_plural = "Komentarze"
         ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['content_type', 'object_id'], name='comment_object'),
+            # Pages of top-level comments, seeking on (created_at, id).
+            models.Index(
+                fields=['content_type', 'object_id', '-created_at', '-id'],
+                condition=models.Q(parent_comment__isnull=True),
+                name='comment_top_level_page',
+            ),
+            # Active replies of a comment, newest first.
+            models.Index(
+                fields=['parent_comment', '-created_at'],
+                condition=models.Q(is_active=True),
+                name='comment_active_replies',
+            ),
+        ]
 
     def __str__(self):
         return f"Komentarz {self.id} przez {self.user.username}"
 
     def get_replies(self):
-        """Returns all active replies to this comment."""
+        """
+        Returns all active replies to this comment, taken from memory
+        when the comment was fetched by the thread loader.
+        """
+        if hasattr(self, 'thread_replies'):
+            return self.thread_replies
         return self.replies.filter(is_active=True)
 
     @property
     def is_reply(self):
         """Check if this comment is a reply to another comment."""
         return self.parent_comment is not None
+
+
+def empty_histogram():
+    """Returns a histogram with a zero count for every rating from 1 to 10."""
+    return [0] * 10
+
+
+class RatingSummaryManager(models.Manager):
+    """
+    Manager keeping the per-object rating summaries (the leaderboard store)
+    in sync with the ratings table.
+    """
+
+    def for_object(self, obj):
+        """
+        Returns the summary of an object, or an empty unsaved summary
+        if the object has not been rated yet.
+        """
+        content_type = ContentType.objects.get_for_model(obj)
+        return (
+            self.filter(content_type=content_type, object_id=obj.pk).first()
+            or self.model(content_type=content_type, object_id=obj.pk)
+        )
+
+    def record(self, content_type_id, object_id, added=None, removed=None):
+        """
+        Applies a single rating change to the summary of an object.
+        `added` is the new rating value and `removed` the replaced
+        or deleted one. The summary row is locked for the update.
+        """
+        with transaction.atomic():
+            summary, _ = self.select_for_update().get_or_create(
+                content_type_id=content_type_id,
+                object_id=object_id,
+            )
+            if removed is not None:
+                summary.rating_count -= 1
+                summary.rating_sum -= removed
+                summary.histogram[removed - 1] -= 1
+            if added is not None:
+                summary.rating_count += 1
+                summary.rating_sum += added
+                summary.histogram[added - 1] += 1
+
+            if summary.rating_count > 0:
+                summary.score = RatingSummary.bayesian_score(summary.rating_count, summary.rating_sum)
+                summary.save()
+            else:
+                summary.delete()
+
+    def refresh(self, content_type_id, object_id):
+        """
+        Recomputes the summary of a single rated object from its ratings.
+        Removes the summary once the object has no ratings left.
+        """
+        histogram = empty_histogram()
+        buckets = (Rating.objects
+                   .filter(content_type_id=content_type_id, object_id=object_id)
+                   .values_list('rating')
+                   .annotate(count=Count('id'))
+                   .order_by())
+        for rating, count in buckets:
+            histogram[rating - 1] = count
+
+        count = sum(histogram)
+        if not count:
+            self.filter(content_type_id=content_type_id, object_id=object_id).delete()
+            return None
+
+        total = sum(rating * votes for rating, votes in enumerate(histogram, 1))
+        summary, _ = self.update_or_create(
+            content_type_id=content_type_id,
+            object_id=object_id,
+            defaults={
+                'rating_count': count,
+                'rating_sum': total,
+                'histogram': histogram,
+                'score': RatingSummary.bayesian_score(count, total),
+            },
+        )
+        return summary
+
+    def rebuild(self):
+        """
+        Recomputes all summaries from the ratings table with one grouped query.
+        Returns the number of summaries built.
+        """
+        summaries = {}
+        buckets = (Rating.objects
+                   .values_list('content_type_id', 'object_id', 'rating')
+                   .annotate(count=Count('id'))
+                   .order_by())
+        for content_type_id, object_id, rating, count in buckets:
+            summary = summaries.get((content_type_id, object_id))
+            if summary is None:
+                summary = summaries[content_type_id, object_id] = self.model(
+                    content_type_id=content_type_id,
+                    object_id=object_id,
+                )
+            summary.rating_count += count
+            summary.rating_sum += rating * count
+            summary.histogram[rating - 1] = count
+
+        for summary in summaries.values():
+            summary.score = RatingSummary.bayesian_score(summary.rating_count, summary.rating_sum)
+
+        with transaction.atomic():
+            self.all().delete()
+            self.bulk_create(summaries.values(), batch_size=1000)
+        return len(summaries)
+
+    def top_rated(self, queryset, limit):
+        """
+        Returns up to `limit` (object, average rating) pairs from the given
+        queryset, best scored first. The queryset model has to declare
+        a `rating_summaries` generic relation.
+        """
+        objects = (
+            queryset
+            .filter(rating_summaries__rating_count__gt=0)
+            .annotate(
+                summary_count=F('rating_summaries__rating_count'),
+                summary_sum=F('rating_summaries__rating_sum'),
+            )
+            .order_by('-rating_summaries__score', '-pk')[:limit]
+        )
+        return [
+            (obj, round(obj.summary_sum / obj.summary_count, 1))
+            for obj in objects
+        ]
+
+
+class RatingSummary(models.Model):
+    """
+    Denormalized rating totals of a single rated object: number of
+    ratings, their sum and a histogram of values 1-10. Serves the
+    average rating, counters and stars of detail pages and is the
+    leaderboard store for the top rated widgets.
+
+    The score is a count-weighted (Bayesian) average: every object starts
+    with PRIOR_WEIGHT virtual ratings equal to PRIOR_MEAN, so a single 10
+    does not outrank many 9s.
+    """
+    PRIOR_MEAN = 5.5
+    PRIOR_WEIGHT = 5
+
+    content_type = models.ForeignKey(
+        ContentType,
+        on_delete=models.CASCADE,
+        verbose_name="oceniana zawartosc"
+    )
+    object_id = models.PositiveIntegerField(verbose_name="id obiektu")
+    content_object = GenericForeignKey('content_type', 'object_id')
+
+    rating_count = models.PositiveIntegerField(default=0, verbose_name="liczba ocen")
+    rating_sum = models.PositiveIntegerField(default=0, verbose_name="suma ocen")
+    histogram = ArrayField(
+        models.PositiveIntegerField(),
+        size=10,
+        default=empty_histogram,
+        verbose_name="rozkład ocen"
+    )
+    score = models.FloatField(default=0, verbose_name="wynik rankingu")
+
+    objects = RatingSummaryManager()
+
+    class Meta:
+        verbose_name = "Podsumowanie ocen"
+        verbose_name_plural = "Podsumowania ocen"
+        constraints = [
+            models.UniqueConstraint(
+                fields=['content_type', 'object_id'], name='unique_rating_summary'
+            )
+        ]
+        indexes = [
+            models.Index(fields=['content_type', '-score'], name='rating_summary_leaderboard'),
+        ]
+
+    def __str__(self):
+        return f"{self.content_type} {self.object_id}: {self.score:.2f}"
+
+    @classmethod
+    def bayesian_score(cls, count, total):
+        """Returns the count-weighted average used for ranking."""
+        return (cls.PRIOR_MEAN * cls.PRIOR_WEIGHT + total) / (cls.PRIOR_WEIGHT + count)
+
+    @property
+    def average(self):
+        """Returns the average rating rounded to one decimal, or None."""
+        if not self.rating_count:
+            return None
+        return round(self.rating_sum / self.rating_count, 1)
+
+    @property
+    def stars_data(self):
+        """Returns the number of full, half and empty stars of the average."""
+        average = self.average
+        if average is None:
+            return {'full': 0, 'half': False, 'empty': 10}
+
+        full_stars = int(average)
+        has_half = (average - full_stars) >= 0.5
+        return {
+            'full': full_stars,
+            'half': has_half,
+            'empty': 10 - full_stars - (1 if has_half else 0),
+        }
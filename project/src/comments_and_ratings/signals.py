@@ -0,0 +1,38 @@
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from .models import Rating, RatingSummary
+
+
+@receiver(post_save, sender=Rating)
+def record_saved_rating(sender, instance, created, raw=False, **kwargs):
+    """
+    Signal receiver that applies a written rating to the rating summary
+    of the rated object, replacing the previously stored value.
+    Ratings saved without a known stored value trigger a full refresh.
+    """
+    if raw or (not created and not hasattr(instance, '_loaded_rating')):
+        RatingSummary.objects.refresh(instance.content_type_id, instance.object_id)
+    else:
+        removed = None if created else instance._loaded_rating
+        if removed != instance.rating:
+            RatingSummary.objects.record(
+                instance.content_type_id,
+                instance.object_id,
+                added=instance.rating,
+                removed=removed,
+            )
+    instance._loaded_rating = instance.rating
+
+
+@receiver(post_delete, sender=Rating)
+def record_deleted_rating(sender, instance, **kwargs):
+    """
+    Signal receiver that removes a deleted rating from the rating summary
+    of the rated object.
+    """
+    RatingSummary.objects.record(
+        instance.content_type_id,
+        instance.object_id,
+        removed=getattr(instance, '_loaded_rating', instance.rating),
+    )
@@ -1,6 +1,6 @@
 """
 Urls for comments and ratings operations - adding rating, comments and replies,
-editing existing comments (or replIes), deleting  comments or replies and ratings.
+loading further pages of comments, editing existing comments (or replIes), deleting  comments or replies and ratings.
 Directs users to the appropriate page where they can perform the activity they are interested in.
 """
 from django.urls import path
@@ -10,6 +10,7 @@ from .views import (
     AddRatingView,
     AddCommentView,
     AddReplyView,
+    CommentPageView,
     DeleteRatingOrCommentView,
     EditCommentView,
 )
@@ -27,6 +28,11 @@ urlpatterns = [
         AddCommentView.as_view(),
         name='add_comment',
     ),
+    path(
+        '<str:app_label>/<str:model_name>/<int:object_id>/comments/',
+        CommentPageView.as_view(),
+        name='comment_page',
+    ),
     path(
         'comment/<int:comment_id>/reply/',
         AddReplyView.as_view(),
@@ -1,10 +1,78 @@
-from django.shortcuts import get_object_or_404, redirect
+from django.core.exceptions import BadRequest
+from django.http import Http404
+from django.shortcuts import get_object_or_404, redirect, render
+from django.views import View
 from django.views.generic import CreateView, DeleteView, UpdateView
 from django.contrib import messages
 from django.contrib.auth.mixins import LoginRequiredMixin
 from django.contrib.contenttypes.models import ContentType
+from django.db import transaction
+from django.db.models import Q
 from .models import Rating, Comment
 from .forms import RatingForm, CommentForm, ReplyForm
+from .loaders import comment_list_context, engagement_for, load_comment_page, with_engagement
+
+
+class EngagementContextMixin:
+    """
+    Mixin for detail views of rated and commented objects.
+
+    The object is fetched together with its rating summary, the current
+    user's rating and its number of top-level comments in a single query,
+    and the context of the rating form and comment list is built from it.
+    """
+
+    def get_queryset(self):
+        """Annotate the objects with their engagement."""
+        return with_engagement(super().get_queryset(), self.request.user)
+
+    def get_context_data(self, **kwargs):
+        """Add the rating, rating form and comment list context of the object."""
+        context = super().get_context_data(**kwargs)
+        engagement = engagement_for(self.object)
+
+        context.update({
+            'content_type': engagement['summary'].content_type,
+            'object_id': self.object.pk,
+            'average_rating': engagement['average_rating'],
+            'ratings_count': engagement['ratings_count'],
+            'stars_data': engagement['stars_data'],
+            'rating_histogram': engagement['rating_histogram'],
+            'user_rating': engagement['user_rating'],
+            'user_rating_id': engagement['user_rating_id'],
+            'comment_form': CommentForm(),
+        })
+        context.update(comment_list_context(self.object, count=engagement['comments_count']))
+        return context
+
+
+class EngagementListMixin:
+    """
+    Mixin for list views of rated and commented objects.
+
+    Every listed object is fetched with its creator, its rating summary and
+    its number of top-level comments in the page query itself, so a page
+    costs the same number of queries whatever it contains. Only the
+    `card_fields` the list cards show (and the list is sorted by) are
+    selected. The engagement of an object is available to the template as
+    `object.engagement`.
+    """
+    card_fields = ()
+
+    def get_queryset(self):
+        queryset = super().get_queryset().select_related('creator').only(*self.card_fields, 'creator__username')
+        return with_engagement(queryset, self.request.user)
+
+    def get_card_context(self, object_list):
+        """Prepare the listed objects for their cards and return extra context the cards need."""
+        for obj in object_list:
+            obj.engagement = engagement_for(obj)
+        return {}
+
+    def get_context_data(self, **kwargs):
+        context = super().get_context_data(**kwargs)
+        context.update(self.get_card_context(context['object_list']))
+        return context
 
 
 class AddRatingView(LoginRequiredMixin, CreateView):
@@ -23,12 +91,15 @@ class AddRatingView(LoginRequiredMixin, CreateView):
         return super().dispatch(request, *args, **kwargs)
 
     def form_valid(self, form):
-        """Create or update the rating, then redirect with a message."""
-        rating, created = Rating.objects.update_or_create(
+        """
+        Create or update the rating in a single statement, then redirect
+        with a message. The rating summary is updated in the same transaction.
+        """
+        rating, created, _ = Rating.objects.upsert(
             content_type=self.content_type,
             object_id=self.object_id,
             user=self.request.user,
-            defaults={'rating': form.cleaned_data['rating']},
+            rating=form.cleaned_data['rating'],
         )
 
         if created:
@@ -136,9 +207,11 @@ class DeleteRatingOrCommentView(LoginRequiredMixin, DeleteView):
     is_comment = True
 
     def form_valid(self, form):
+        """Delete the object; a rating is removed from its summary in the same transaction."""
         self.content_object = self.object.content_object
         messages.success(self.request, self.success_message)
-        return super().form_valid(form)
+        with transaction.atomic():
+            return super().form_valid(form)
 
     def get_success_url(self):
         return self.content_object.get_absolute_url()
@@ -147,3 +220,49 @@ class DeleteRatingOrCommentView(LoginRequiredMixin, DeleteView):
         context = super().get_context_data(**kwargs)
         context['is_comment'] = self.is_comment
         return context
+
+
+class CommentPageView(View):
+    """
+    Returns the next page of top-level comments of an object as an HTML
+    fragment, used by the "load more" button of the comment list.
+
+    Only objects of the `commentable_models` are served. Objects awaiting
+    verification are shown to their creators and staff only.
+    """
+    template_name = 'comments_and_ratings/comment_page.html'
+    commentable_models = (
+        'events.event',
+        'announcements.announcement',
+        'photo_gallery.gallery',
+        'photo_gallery.photo',
+    )
+
+    def get_queryset(self, model):
+        """Return the objects of the model whose comments the user may see."""
+        queryset = model._default_manager.all()
+        if not any(field.name == 'is_verified' for field in model._meta.get_fields()) or self.request.user.is_staff:
+            return queryset
+        visible = Q(is_verified=True)
+        if self.request.user.is_authenticated:
+            visible |= Q(creator=self.request.user)
+        return queryset.filter(visible)
+
+    def get(self, request, app_label, model_name, object_id):
+        """Render the comments that follow the cursor from the query string."""
+        if f'{app_label}.{model_name}' not in self.commentable_models:
+            raise Http404("Nieznany typ obiektu.")
+        content_type = get_object_or_404(ContentType, app_label=app_label, model=model_name)
+        obj = get_object_or_404(self.get_queryset(content_type.model_class()), pk=object_id)
+
+        try:
+            comments, next_cursor = load_comment_page(obj, request.GET.get('cursor'))
+        except ValueError:
+            raise BadRequest("Nieprawidłowy kursor komentarzy.")
+
+        return render(request, self.template_name, {
+            'content_type': content_type,
+            'object_id': object_id,
+            'comments': comments,
+            'comments_cursor': next_cursor,
+        })
@@ -5,11 +5,16 @@ allowing administrators to manage events through the built-in admin interface.
 """
 
 from django.contrib import admin
+from myApp import facets
+from myApp.utils import page_cache
+from myApp.utils.paginator import EstimatedCountPaginator
 from .models import Event
 
 
 @admin.register(Event)
 class EventAdmin(admin.ModelAdmin):
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
     list_display = ('event_name',
                     'event_date',
                     'location',
@@ -26,9 +31,15 @@ class EventAdmin(admin.ModelAdmin):
     actions = ['verify_selected', 'archive_selected']
 
     def verify_selected(self, request, queryset):
+        keys = page_cache.queryset_keys(queryset)
         queryset.update(is_verified=True)
+        facets.rebuild(Event)
+        page_cache.purge(*keys)
     verify_selected.short_description = "Zaznacz jako zweryfikowane"
 
     def archive_selected(self, request, queryset):
+        keys = page_cache.queryset_keys(queryset)
         queryset.update(is_archived=True)
+        facets.rebuild(Event)
+        page_cache.purge(*keys)
     archive_selected.short_description = 'Archiwizuj wybrane wydarzenia'
\ No newline at end of file
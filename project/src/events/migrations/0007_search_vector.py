@@ -0,0 +1,67 @@
+# Generated by Django 5.2.18 on 2026-10-17 19:06
+
+import django.contrib.postgres.indexes
+import django.contrib.postgres.search
+from django.conf import settings
+from django.db import migrations
+
+
+# Polish is not a built-in text search configuration; fall back to
+# a copy of 'simple' when the server does not provide one.
+CREATE_SEARCH_CONFIG = """
+DO $$
+BEGIN
+    IF NOT EXISTS (SELECT 1 FROM pg_ts_config WHERE cfgname = 'polish') THEN
+        CREATE TEXT SEARCH CONFIGURATION polish (COPY = simple);
+    END IF;
+END
+$$;
+"""
+
+SEARCH_TRIGGER = """
+CREATE FUNCTION events_event_search_vector_update() RETURNS trigger AS $$
+BEGIN
+    NEW.search_vector :=
+        setweight(to_tsvector('polish', coalesce(NEW.event_name, '')), 'A') ||
+        setweight(to_tsvector('polish', coalesce(NEW.location, '')), 'B') ||
+        setweight(to_tsvector('polish', coalesce(NEW.description, '')), 'C');
+    RETURN NEW;
+END
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER events_event_search_vector_update
+    BEFORE INSERT OR UPDATE ON events_event
+    FOR EACH ROW EXECUTE FUNCTION events_event_search_vector_update();
+
+UPDATE events_event SET search_vector =
+    setweight(to_tsvector('polish', coalesce(event_name, '')), 'A') ||
+    setweight(to_tsvector('polish', coalesce(location, '')), 'B') ||
+    setweight(to_tsvector('polish', coalesce(description, '')), 'C');
+"""
+
+DROP_SEARCH_TRIGGER = """
+DROP TRIGGER IF EXISTS events_event_search_vector_update ON events_event;
+DROP FUNCTION IF EXISTS events_event_search_vector_update();
+"""
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('events', '0006_alter_event_city_alter_event_location'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='event',
+            name='search_vector',
+            field=django.contrib.postgres.search.SearchVectorField(editable=False, null=True),
+        ),
+        migrations.AddIndex(
+            model_name='event',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['search_vector'], name='event_search_vector'),
+        ),
+        migrations.RunSQL(CREATE_SEARCH_CONFIG, migrations.RunSQL.noop),
+        migrations.RunSQL(SEARCH_TRIGGER, DROP_SEARCH_TRIGGER),
+    ]
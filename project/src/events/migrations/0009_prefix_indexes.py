@@ -0,0 +1,26 @@
+# Generated by Django 5.2.18 on 2026-10-17 19:12
+
+import django.contrib.postgres.indexes
+import django.db.models.functions.comparison
+import django.db.models.functions.text
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('events', '0008_trigram_indexes'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='event',
+            index=models.Index(django.contrib.postgres.indexes.OpClass(django.db.models.functions.text.Upper(django.db.models.functions.comparison.Cast('event_name', models.TextField())), name='text_pattern_ops'), name='event_name_prefix'),
+        ),
+        migrations.AddIndex(
+            model_name='event',
+            index=models.Index(django.contrib.postgres.indexes.OpClass(django.db.models.functions.text.Upper(django.db.models.functions.comparison.Cast('location', models.TextField())), name='text_pattern_ops'), name='event_location_prefix'),
+        ),
+    ]
@@ -0,0 +1,39 @@
+# Generated by Django 5.2.18 on 2026-10-17 19:18
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('events', '0009_prefix_indexes'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='event',
+            index=models.Index(condition=models.Q(('is_archived', False), ('is_verified', True)), fields=['event_date', 'id'], name='event_active_event_date'),
+        ),
+        migrations.AddIndex(
+            model_name='event',
+            index=models.Index(condition=models.Q(('is_archived', False), ('is_verified', True)), fields=['created_at', 'id'], name='event_active_created_at'),
+        ),
+        migrations.AddIndex(
+            model_name='event',
+            index=models.Index(condition=models.Q(('is_archived', False), ('is_verified', True)), fields=['updated_at', 'id'], name='event_active_updated_at'),
+        ),
+        migrations.AddIndex(
+            model_name='event',
+            index=models.Index(condition=models.Q(('is_archived', True), ('is_verified', True)), fields=['event_date', 'id'], name='event_archived_event_date'),
+        ),
+        migrations.AddIndex(
+            model_name='event',
+            index=models.Index(condition=models.Q(('is_archived', True), ('is_verified', True)), fields=['created_at', 'id'], name='event_archived_created_at'),
+        ),
+        migrations.AddIndex(
+            model_name='event',
+            index=models.Index(condition=models.Q(('is_archived', True), ('is_verified', True)), fields=['updated_at', 'id'], name='event_archived_updated_at'),
+        ),
+    ]
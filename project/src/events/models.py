@@ -1,11 +1,16 @@
 from django.contrib.auth import get_user_model
 from django.contrib.contenttypes.fields import GenericRelation
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import SearchVectorField
 from django.db import models
 from django.urls import reverse
+from django.utils.functional import cached_property
 from django.utils import timezone
 from django.contrib.gis.db import models
 
-from comments_and_ratings.models import Rating
+from comments_and_ratings.models import Rating, RatingSummary
+from myApp.utils.autocomplete import prefix_index
+from myApp.utils.excerpt import EXCERPT_LENGTH, update_excerpt
 from myApp.utils.upload_pather import dynamic_image_upload_pather
 
 
@@ -19,6 +24,7 @@ class Event(models.Model):
         city (CharField): Map where the event is taking place (max 100 characters)
         location (CharField): Location of the event (max 100 characters)
         description (TextField): Description of the event (max 500 characters)
+        excerpt (CharField): Beginning of the description shown on the list cards
         creator (ForeignKey): Creator of the event (associated with the user model)
                               Can be None for events with anonymous creators
     """
@@ -27,11 +33,13 @@ class Event(models.Model):
     location = models.CharField(max_length=100, verbose_name="miasto wydarzenia")
     city = models.PointField(help_text = "<br>", verbose_name="miejsce wydarzenia", null=True, blank=True)
     description = models.TextField(max_length=500, verbose_name="opis wydarzenia")
+    excerpt = models.CharField(max_length=EXCERPT_LENGTH, blank=True, editable=False, verbose_name="skrót opisu")
     image = models.ImageField(
         upload_to=dynamic_image_upload_pather,
         blank=True,
         verbose_name="zdjęcie wydarzenia",
     )
+    search_vector = SearchVectorField(null=True, editable=False)
     created_at = models.DateTimeField(auto_now_add=True, verbose_name="data stworzenia wydarzenia")
     updated_at = models.DateTimeField(auto_now=True, verbose_name="data edycji wydarzenia")
     creator = models.ForeignKey(
@@ -47,10 +55,37 @@ class Event(models.Model):
 
     ratings = GenericRelation('comments_and_ratings.Rating')
     comments = GenericRelation('comments_and_ratings.Comment')
+    rating_summaries = GenericRelation('comments_and_ratings.RatingSummary')
 
     class Meta:
         verbose_name = "Wydarzenie"
         verbose_name_plural = "Wydarzenia"
+        indexes = [
+            GinIndex(fields=['search_vector'], name='event_search_vector'),
+            GinIndex(fields=['event_name'], opclasses=['gin_trgm_ops'], name='event_name_trigram'),
+            GinIndex(fields=['location'], opclasses=['gin_trgm_ops'], name='event_location_trigram'),
+            prefix_index('event_name', 'event_name_prefix'),
+            prefix_index('location', 'event_location_prefix'),
+            # Pages of the active and archived lists for every sort option,
+            # seeking on (sort column, id) in either direction.
+            *[
+                models.Index(
+                    fields=[column, 'id'],
+                    condition=models.Q(is_verified=True, is_archived=archived),
+                    name=f'event_{scope}_{column}',
+                )
+                for scope, archived in [('active', False), ('archived', True)]
+                for column in ['event_date', 'created_at', 'updated_at']
+            ],
+        ]
+
+    def save(self, *args, **kwargs):
+        """
+        Overrides the default save method to keep the stored excerpt of the
+        description, shown on the list cards, up to date.
+        """
+        kwargs['update_fields'] = update_excerpt(self, kwargs.get('update_fields'))
+        super().save(*args, **kwargs)
 
     def get_creator_name(self):
         """
@@ -70,10 +105,13 @@ class Event(models.Model):
         """
         return self.event_name
 
+    @cached_property
+    def rating_summary(self):
+        return RatingSummary.objects.for_object(self)
+
     @property
     def average_rating(self):
-        result = self.ratings.aggregate(models.Avg('rating'))
-        return round(result['rating__avg'], 1) if result['rating__avg'] else None
+        return self.rating_summary.average
 
     def get_user_rating(self, user):
         try:
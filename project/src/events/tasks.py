@@ -1,11 +1,20 @@
 from celery import shared_task
 from django.utils import timezone
+from myApp import facets
+from myApp.utils import page_cache
 from .models import Event
 
 @shared_task
 def archive_past_events():
     """Task to archive all past events."""
-    Event.objects.filter(
+    past = Event.objects.filter(
         event_date__lt=timezone.now(),
         is_archived=False
-    ).update(is_archived=True)
\ No newline at end of file
+    )
+    # The bulk update bypasses the signals purging cached pages and validators.
+    keys = page_cache.queryset_keys(past)
+    archived = past.update(is_archived=True)
+
+    if archived:
+        facets.rebuild(Event)
+        page_cache.purge(*keys)
\ No newline at end of file
@@ -12,6 +12,8 @@ urlpatterns = [
     path('user_event_list/', views.EventListView.as_view(), {'filter': 'my'}, name='user_event_list'),
     path('event_list/', views.EventListView.as_view(), {'filter': 'all_non_archived'}, name='list_event'),
     path('events/archive/', views.EventListView.as_view(), {'filter': 'all_archived'}, name='list_archived_event'),
+    path('cards/<str:filter>/', views.EventCardsView.as_view(), name='event_cards'),
+    path('autocomplete/', views.EventAutocompleteView.as_view(), name='autocomplete_event'),
     path('create_event/', views.EventCreateView.as_view(), name='create_event'),
     path('edit_event/<int:pk>/', views.EventUpdateView.as_view(), name='edit_event'),
     path('delete_event/<int:pk>/', views.EventDeleteView.as_view(), name='delete_event'),
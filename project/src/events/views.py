@@ -1,19 +1,30 @@
-from django.contrib.contenttypes.models import ContentType
 from django.views.generic import ListView, CreateView, UpdateView, DeleteView, DetailView
 from django.contrib import messages
 from django.urls import reverse_lazy
 from django.contrib.auth.mixins import LoginRequiredMixin, AccessMixin
 
-from comments_and_ratings.forms import CommentForm
+from comments_and_ratings.views import EngagementContextMixin, EngagementListMixin
+from myApp.models import Facet
+from myApp.utils.autocomplete import AutocompleteView
+from myApp.utils.conditional_get import ConditionalGetMixin
+from myApp.utils.infinite_scroll import ListFragmentMixin
+from myApp.utils.keyset import KeysetPaginationMixin
+from myApp.utils.paginator import EstimatedCountPaginator
+from myApp.utils.page_cache import AnonymousPageCacheMixin
+from myApp.utils.search import full_text_search, suggest
 from .models import Event
 from .forms import EventForm
-from django.db.models import Q, Case, When, IntegerField
+from django.db.models import Case, When, IntegerField
 
 
-class EventListView(ListView):
+class EventListView(AnonymousPageCacheMixin, ConditionalGetMixin, KeysetPaginationMixin, EngagementListMixin, ListView):
     model = Event
     context_object_name = 'events'
+    card_fields = ['event_name', 'event_date', 'location', 'image', 'excerpt',
+                   'created_at', 'updated_at', 'is_archived']
     paginate_by = 10
+    paginator_class = EstimatedCountPaginator
+    fuzzy_search_fields = ['event_name', 'location']
 
     def get_queryset(self):
         queryset = super().get_queryset().filter(is_verified=True)
@@ -29,11 +40,8 @@ class EventListView(ListView):
                 queryset = queryset.filter(creator=self.request.user)
 
         if search_for := self.request.GET.get('keyword'):
-            queryset = queryset.filter(
-                Q(event_name__icontains=search_for) |
-                Q(description__icontains=search_for) |
-                Q(location__icontains=search_for)
-            )
+            self.unsearched_queryset = queryset
+            queryset = full_text_search(queryset, search_for, self.fuzzy_search_fields)
 
         if filter_location := self.request.GET.get('location'):
             queryset = queryset.filter(location=filter_location)
@@ -68,26 +76,36 @@ class EventListView(ListView):
                     sort_options[sort_by]
                 )
         else:
+            default_order = ['-event_date']
+            if 'search_rank' in queryset.query.annotations:
+                # Search results are ordered by relevance first.
+                default_order.insert(0, '-search_rank')
             if self.kwargs['filter'] == 'my':
                 queryset = queryset.order_by(
                     'is_archived_flag',
-                    '-event_date'
+                    *default_order
                 )
             else:
                 queryset = queryset.order_by(
-                    '-event_date'
+                    *default_order
                 )
 
         return queryset
 
+    def get_card_context(self, object_list):
+        context = super().get_card_context(object_list)
+        context['is_my_events'] = self.kwargs.get('filter') == 'my'
+        return context
+
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
+        if (search_text := self.request.GET.get('keyword')) and not context['object_list']:
+            context['search_suggestion'] = suggest(self.unsearched_queryset, search_text, self.fuzzy_search_fields)
         current_filter = self.kwargs.get('filter')
 
         context.update({
             'is_all_events': current_filter == 'all_non_archived',
             'is_archived': current_filter == 'all_archived',
-            'is_my_events': current_filter == 'my',
             'request': self.request,
             'page_param': "page",
             'selected_location': self.request.GET.get('location', ''),
@@ -128,69 +146,30 @@ class EventListView(ListView):
             }
         ]
 
+        # Locations with their event counts, from the precomputed facet.
         if context['is_my_events']:
-            context['available_locations'] = (Event.objects
-                                           .filter(creator=self.request.user)
-                                           .order_by('location')
-                                           .values_list('location', flat=True)
-                                           .distinct())
+            context['available_locations'] = Facet.objects.counts(Event, creator=self.request.user)
         else:
-            context['available_locations'] = (Event.objects
-                                           .order_by('location')
-                                           .values_list('location', flat=True)
-                                           .distinct())
+            context['available_locations'] = Facet.objects.counts(Event, archived=context['is_archived'])
 
         return context
 
 
+class EventCardsView(ListFragmentMixin, EventListView):
+    """Cards of the next page of an event list, appended while the list is scrolled."""
+    cards_template_name = 'events/includes/event_cards.html'
+    filters = ('all_non_archived', 'all_archived', 'my')
 
-class EventDetailView(DetailView):
-    """View showing event details: """
-    model = Event
-    context_object_name = 'event'
-
-    def get_context_data(self, **kwargs):
-        context = super().get_context_data(**kwargs)
-        event = self.object
-
-        content_type = ContentType.objects.get_for_model(event)
-        object_id = event.id
 
-        context['content_type'] = content_type
-        context['object_id'] = object_id
-        context['comments'] = event.comments.filter(parent_comment__isnull=True).order_by('-created_at')
-        context['comment_form'] = CommentForm()
-        context['average_rating'] = event.average_rating
-        context['ratings_count'] = event.ratings.count()
+class EventAutocompleteView(AutocompleteView):
+    queryset = Event.objects.filter(is_verified=True)
+    fields = ['event_name', 'location']
 
-        if self.request.user.is_authenticated:
-            rating_obj = event.ratings.filter(user=self.request.user).first()
-            context['user_rating'] = rating_obj.rating if rating_obj else None
-            context['user_rating_id'] = rating_obj.id if rating_obj else None
-
-        if event.average_rating is not None:
-            average = float(context['average_rating'])
-            full_stars = int(average)
-            has_half = (average - full_stars) >= 0.5
-            empty_stars = 10 - full_stars - (1 if has_half else 0)
-
-            context.update({
-                'stars_data': {
-                    'full': full_stars,
-                    'half': has_half,
-                    'empty': empty_stars
-                }
-            })
-        else:
-            context.update({
-                'stars_data': {
-                    'full': 0,
-                    'half': False,
-                    'empty': 10
-                }
-            })
 
-        return context
+class EventDetailView(AnonymousPageCacheMixin, ConditionalGetMixin, EngagementContextMixin, DetailView):
+    """View showing event details: """
+    model = Event
+    context_object_name = 'event'
 
 
 class EventCreateView(CreateView):
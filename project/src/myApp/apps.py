@@ -0,0 +1,9 @@
+from django.apps import AppConfig
+
+
+class MyAppConfig(AppConfig):
+    default_auto_field = 'django.db.models.BigAutoField'
+    name = 'myApp'
+
+    def ready(self):
+        from . import signals
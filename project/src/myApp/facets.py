@@ -0,0 +1,56 @@
+from django.contrib.contenttypes.models import ContentType
+from django.db.models import BooleanField, ExpressionWrapper, Q
+
+from announcements.models import Announcement
+from events.models import Event
+from .models import Facet
+
+
+class FacetSpec:
+    """
+    Describes the facet of a model: the field whose values are counted
+    (only verified rows are listed) and how archived rows are told apart,
+    in SQL (a Q object) and in Python (a function of the row).
+    """
+
+    def __init__(self, model, field, archived, is_archived):
+        self.model = model
+        self.field = field
+        self.archived = archived
+        self.is_archived = is_archived
+
+    def queryset(self):
+        return self.model._base_manager.filter(is_verified=True)
+
+    def state(self, instance):
+        """Returns the facet key `(value, is_archived, creator_id)` of a row, or None if it isn't counted."""
+        if not instance.is_verified:
+            return None
+        return getattr(instance, self.field), self.is_archived(instance), instance.creator_id
+
+    def stored_state(self, instance):
+        """Returns the facet key of the stored version of a row, or None."""
+        if instance._state.adding or instance.pk is None:
+            return None
+        stored = self.model._base_manager.filter(pk=instance.pk).first()
+        return self.state(stored) if stored is not None else None
+
+    def record(self, state, delta):
+        if state is not None:
+            Facet.objects.record(ContentType.objects.get_for_model(self.model), *state, delta)
+
+    def rebuild(self):
+        archived = ExpressionWrapper(self.archived, output_field=BooleanField())
+        return Facet.objects.rebuild(self.model, self.queryset(), self.field, archived)
+
+
+FACETS = {
+    Event: FacetSpec(Event, 'location', Q(is_archived=True), lambda event: event.is_archived),
+    Announcement: FacetSpec(Announcement, 'place', Q(archive_date__isnull=False),
+                            lambda announcement: announcement.archive_date is not None),
+}
+
+
+def rebuild(model):
+    """Recomputes the facet of a model, e.g. after a bulk update."""
+    return FACETS[model].rebuild()
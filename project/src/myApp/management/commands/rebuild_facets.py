@@ -0,0 +1,12 @@
+from django.core.management.base import BaseCommand
+
+from myApp.facets import FACETS
+
+
+class Command(BaseCommand):
+    help = "Recomputes the facet counts (events per location, announcements per place) of the list filters."
+
+    def handle(self, *args, **options):
+        for model, spec in FACETS.items():
+            built = spec.rebuild()
+            self.stdout.write(self.style.SUCCESS(f"Przebudowano liczniki filtra {model._meta.verbose_name_plural}: {built}"))
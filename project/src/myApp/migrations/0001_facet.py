@@ -0,0 +1,67 @@
+# Generated by Django 5.2.18 on 2026-10-17 19:17
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models import BooleanField, Count, ExpressionWrapper, F, Q
+
+
+# Faceted models: (app label, model, field, archived rows).
+FACETED = [
+    ('events', 'event', 'location', Q(is_archived=True)),
+    ('announcements', 'announcement', 'place', Q(archive_date__isnull=False)),
+]
+
+
+def count_facets(apps, schema_editor):
+    ContentType = apps.get_model('contenttypes', 'ContentType')
+    Facet = apps.get_model('myApp', 'Facet')
+    for app_label, model_name, field, archived in FACETED:
+        content_type, _ = ContentType.objects.get_or_create(app_label=app_label, model=model_name)
+        rows = (apps.get_model(app_label, model_name).objects
+                .filter(is_verified=True)
+                .order_by()
+                .annotate(facet_value=F(field),
+                          facet_archived=ExpressionWrapper(archived, output_field=BooleanField())))
+        totals = rows.values('facet_value', 'facet_archived').annotate(count=Count('pk'))
+        per_creator = (rows
+                       .filter(creator__isnull=False)
+                       .values('facet_value', 'facet_archived', 'creator')
+                       .annotate(count=Count('pk')))
+        Facet.objects.bulk_create(
+            Facet(content_type=content_type, value=row['facet_value'], is_archived=row['facet_archived'],
+                  creator_id=row.get('creator'), count=row['count'])
+            for row in [*totals, *per_creator]
+        )
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        ('announcements', '0007_prefix_indexes'),
+        ('contenttypes', '0002_remove_content_type_name'),
+        ('events', '0009_prefix_indexes'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Facet',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('value', models.CharField(max_length=100)),
+                ('is_archived', models.BooleanField()),
+                ('count', models.PositiveIntegerField(default=0)),
+                ('content_type', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='contenttypes.contenttype')),
+                ('creator', models.ForeignKey(null=True, on_delete=django.db.models.deletion.CASCADE, related_name='+', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'verbose_name': 'Licznik filtra',
+                'verbose_name_plural': 'Liczniki filtrów',
+                'constraints': [models.UniqueConstraint(condition=models.Q(('creator__isnull', True)), fields=('content_type', 'is_archived', 'value'), name='facet_total'), models.UniqueConstraint(condition=models.Q(('creator__isnull', False)), fields=('content_type', 'creator', 'value', 'is_archived'), name='facet_creator')],
+            },
+        ),
+        migrations.RunPython(count_facets, migrations.RunPython.noop),
+    ]
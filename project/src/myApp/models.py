@@ -0,0 +1,119 @@
+from django.conf import settings
+from django.contrib.contenttypes.models import ContentType
+from django.db import models, transaction
+from django.db.models import Count, Sum
+
+
+class FacetManager(models.Manager):
+    """
+    Manager keeping the facet counts (e.g. events per location) in sync
+    with the faceted tables.
+    """
+
+    def counts(self, model, archived=None, creator=None):
+        """
+        Returns `(value, count)` pairs of a model's facet sorted by value:
+        of all rows, or only of the (not) archived ones, or of one creator.
+        """
+        facets = self.filter(content_type=ContentType.objects.get_for_model(model))
+        if creator is None:
+            facets = facets.filter(creator__isnull=True)
+        else:
+            facets = facets.filter(creator=creator)
+        if archived is not None:
+            facets = facets.filter(is_archived=archived)
+        return list(facets
+                    .values_list('value')
+                    .annotate(total=Sum('count'))
+                    .order_by('value'))
+
+    def record(self, content_type, value, is_archived, creator_id, delta):
+        """
+        Adds `delta` rows to the count of a facet value, both in the totals
+        and in the counts of the creator (if any). The counter rows are
+        locked for the update; rows dropping to zero are removed.
+        """
+        with transaction.atomic():
+            for creator in {None, creator_id}:
+                facet, _ = self.select_for_update().get_or_create(
+                    content_type=content_type,
+                    value=value,
+                    is_archived=is_archived,
+                    creator_id=creator,
+                )
+                facet.count += delta
+                if facet.count > 0:
+                    facet.save(update_fields=['count'])
+                else:
+                    facet.delete()
+
+    def rebuild(self, model, queryset, field, archived):
+        """
+        Recomputes all facet counts of a model with two grouped queries.
+
+        Args:
+            model: The faceted model.
+            queryset: The rows counted in the facet.
+            field (str): The faceted field.
+            archived: Expression telling whether a row is archived.
+
+        Returns:
+            int: The number of counter rows built.
+        """
+        content_type = ContentType.objects.get_for_model(model)
+        rows = queryset.order_by().annotate(facet_value=models.F(field), facet_archived=archived)
+        totals = rows.values('facet_value', 'facet_archived').annotate(count=Count('pk'))
+        per_creator = (rows
+                       .filter(creator__isnull=False)
+                       .values('facet_value', 'facet_archived', 'creator')
+                       .annotate(count=Count('pk')))
+
+        facets = [
+            self.model(content_type=content_type, value=row['facet_value'],
+                       is_archived=row['facet_archived'], creator_id=row.get('creator'), count=row['count'])
+            for row in [*totals, *per_creator]
+        ]
+        with transaction.atomic():
+            self.filter(content_type=content_type).delete()
+            self.bulk_create(facets)
+        return len(facets)
+
+
+class Facet(models.Model):
+    """
+    Number of rows of a faceted model (e.g. verified events) having a value
+    of its facet field (e.g. location), for the list filter dropdowns.
+    Rows without a creator hold the totals, the others the counts of
+    every creator.
+    """
+    content_type = models.ForeignKey(ContentType, on_delete=models.CASCADE)
+    value = models.CharField(max_length=100)
+    is_archived = models.BooleanField()
+    creator = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        null=True,
+        related_name='+',
+    )
+    count = models.PositiveIntegerField(default=0)
+
+    objects = FacetManager()
+
+    class Meta:
+        verbose_name = "Licznik filtra"
+        verbose_name_plural = "Liczniki filtrów"
+        constraints = [
+            models.UniqueConstraint(
+                fields=['content_type', 'is_archived', 'value'],
+                condition=models.Q(creator__isnull=True),
+                name='facet_total',
+            ),
+            models.UniqueConstraint(
+                fields=['content_type', 'creator', 'value', 'is_archived'],
+                condition=models.Q(creator__isnull=False),
+                name='facet_creator',
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.value}: {self.count}"
@@ -0,0 +1,80 @@
+from django.contrib.contenttypes.models import ContentType
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save, pre_save
+
+from announcements.models import Announcement
+from comments_and_ratings.models import Comment, Rating
+from events.models import Event
+from photo_gallery.models import Gallery, Photo
+from polls.models import Choice, Poll, Vote
+from .facets import FACETS
+from .utils import fragment_cache, page_cache
+
+FRAGMENT_MODELS = [Event, Announcement, Gallery, Photo, Rating, Comment, Poll, Choice, Vote]
+PAGE_MODELS = [Event, Announcement, Gallery, Photo, Rating, Comment]
+
+
+def invalidate_fragments(sender, **kwargs):
+    """
+    Signal receiver that invalidates the cached layout fragments (and page
+    validators) depending on the changed model, once the change is committed.
+    """
+    label = sender._meta.label_lower
+    transaction.on_commit(lambda: fragment_cache.invalidate(label))
+
+
+for model in FRAGMENT_MODELS:
+    post_save.connect(invalidate_fragments, sender=model)
+    post_delete.connect(invalidate_fragments, sender=model)
+
+
+def purge_pages(sender, instance, **kwargs):
+    """
+    Signal receiver that purges the cached pages showing the changed
+    object, once the change is committed. Ratings and comments purge
+    the pages of the rated object, photos also those of their gallery.
+    Pages of whole lists are purged by the model label (see above).
+    """
+    keys = [page_cache.instance_key(instance)]
+    if isinstance(instance, (Rating, Comment)):
+        content_type = ContentType.objects.get_for_id(instance.content_type_id)
+        keys.append(page_cache.object_key(f'{content_type.app_label}.{content_type.model}', instance.object_id))
+    if isinstance(instance, Photo):
+        keys.append(page_cache.object_key(Gallery._meta.label_lower, instance.gallery_id))
+    transaction.on_commit(lambda: page_cache.purge(*keys))
+
+
+for model in PAGE_MODELS:
+    post_save.connect(purge_pages, sender=model)
+    post_delete.connect(purge_pages, sender=model)
+
+
+def remember_facet(sender, instance, raw=False, **kwargs):
+    """Signal receiver that remembers the facet key of the stored row before a save."""
+    instance._stored_facet = None if raw else FACETS[sender].stored_state(instance)
+
+
+def count_saved_facet(sender, instance, raw=False, **kwargs):
+    """
+    Signal receiver that moves a saved row between the facet counts when
+    its value, archive status, verification or creator changed.
+    """
+    if raw:
+        return
+    spec = FACETS[sender]
+    stored, current = getattr(instance, '_stored_facet', None), spec.state(instance)
+    if stored != current:
+        spec.record(stored, -1)
+        spec.record(current, 1)
+    instance._stored_facet = current
+
+
+def count_deleted_facet(sender, instance, **kwargs):
+    """Signal receiver that removes a deleted row from the facet counts."""
+    FACETS[sender].record(FACETS[sender].state(instance), -1)
+
+
+for model in FACETS:
+    pre_save.connect(remember_facet, sender=model)
+    post_save.connect(count_saved_facet, sender=model)
+    post_delete.connect(count_deleted_facet, sender=model)
@@ -0,0 +1,9 @@
+from celery import shared_task
+
+from .utils.paginator import load_query, store_exact_count
+
+
+@shared_task
+def refresh_count(key, model_label, db, query):
+    """Task to cache the exact row count of a paginated list."""
+    store_exact_count(key, load_query(model_label, db, query))
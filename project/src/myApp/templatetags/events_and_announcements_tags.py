@@ -1,4 +1,5 @@
 from django import template
+from comments_and_ratings.models import RatingSummary
 from events.models import Event
 from announcements.models import Announcement
 
@@ -18,29 +19,16 @@ def latest_announcements(limit=5):
 
 @register.inclusion_tag('includes/top_rated_events.html')
 def top_rated_events(limit=5):
-    events = Event.objects.filter(is_verified=True)
-    events_with_ratings = []
-
-    for event in events:
-        avg_rating = event.average_rating
-        if avg_rating is not None:
-            events_with_ratings.append({'event': event, 'rating': avg_rating})
-
-    events_with_ratings.sort(key=lambda x: x['rating'], reverse=True)
-
-    return {'events': events_with_ratings[:limit]}
+    events = RatingSummary.objects.top_rated(Event.objects.filter(is_verified=True), limit)
+    return {'events': [{'event': event, 'rating': rating} for event, rating in events]}
 
 
 @register.inclusion_tag('includes/top_rated_announcements.html')
 def top_rated_announcements(limit=5):
-    announcements = Announcement.objects.filter(is_verified=True)
-    announcements_with_ratings = []
-
-    for announcement in announcements:
-        avg_rating = announcement.average_rating
-        if avg_rating is not None:
-            announcements_with_ratings.append({'announcement': announcement, 'rating': avg_rating})
-
-    announcements_with_ratings.sort(key=lambda x: x['rating'] or 0, reverse=True)
-
-    return {'announcements': announcements_with_ratings[:limit]}
+    announcements = RatingSummary.objects.top_rated(Announcement.objects.filter(is_verified=True), limit)
+    return {
+        'announcements': [
+            {'announcement': announcement, 'rating': rating}
+            for announcement, rating in announcements
+        ]
+    }
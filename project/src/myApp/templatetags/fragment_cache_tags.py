@@ -0,0 +1,52 @@
+from django import template
+from django.utils.safestring import mark_safe
+
+from myApp.utils import fragment_cache
+
+register = template.Library()
+
+
+class FragmentNode(template.Node):
+    def __init__(self, nodelist, name, dependencies, vary):
+        self.nodelist = nodelist
+        self.name = name
+        self.dependencies = dependencies
+        self.vary = vary
+
+    def render(self, context):
+        return mark_safe(fragment_cache.get_or_render(
+            self.name.resolve(context),
+            [dependency.resolve(context) for dependency in self.dependencies],
+            lambda: self.nodelist.render(context),
+            vary=[value.resolve(context) for value in self.vary],
+        ))
+
+
+@register.tag('fragment')
+def do_fragment(parser, token):
+    """
+    Caches the enclosed template fragment until one of the listed models
+    changes. Optional values after 'vary' are added to the cache key.
+
+    Usage:
+        {% fragment "latest_events" "events.event" %}...{% endfragment %}
+        {% fragment "pinned_events" "events.event" vary page %}...{% endfragment %}
+    """
+    bits = token.split_contents()[1:]
+    if not bits:
+        raise template.TemplateSyntaxError("'fragment' tag requires a fragment name.")
+
+    nodelist = parser.parse(('endfragment',))
+    parser.delete_first_token()
+
+    vary = []
+    if 'vary' in bits:
+        index = bits.index('vary')
+        bits, vary = bits[:index], bits[index + 1:]
+
+    return FragmentNode(
+        nodelist,
+        parser.compile_filter(bits[0]),
+        [parser.compile_filter(bit) for bit in bits[1:]],
+        [parser.compile_filter(bit) for bit in vary],
+    )
@@ -1,14 +1,25 @@
 from django import template
-import random
+from comments_and_ratings.models import RatingSummary
 from photo_gallery.models import Photo, Gallery
+from photo_gallery.pools import photo_pool
 
 register = template.Library()
 
 
+@register.simple_tag
+def random_gallery_photo_id():
+    """Returns the id of a random photo, or None if there are no photos."""
+    return photo_pool.pick_pk()
+
+
 @register.inclusion_tag('includes/random_gallery_photo.html')
-def random_gallery_photo():
-    photos = list(Photo.objects.all())
-    photo = random.choice(photos) if photos else None
+def random_gallery_photo(photo_id=None):
+    if photo_id is None:
+        photo = photo_pool.pick(Photo.objects.select_related('gallery'))
+    else:
+        photo = Photo.objects.select_related('gallery').filter(pk=photo_id).first()
+        if photo is None:
+            photo_pool.remove(photo_id)
     return {'photo': photo}
 
 @register.inclusion_tag('includes/latest_galleries.html')
@@ -19,14 +30,5 @@ def latest_galleries(limit=5):
 
 @register.inclusion_tag('includes/top_rated_galleries.html')
 def top_rated_galleries(limit=5):
-    galleries = Gallery.objects.all()
-    galleries_with_ratings = []
-
-    for gallery in galleries:
-        avg_rating = gallery.average_rating
-        if avg_rating is not None:
-            galleries_with_ratings.append({'gallery': gallery, 'rating': avg_rating})
-
-    galleries_with_ratings.sort(key=lambda x: x['rating'] or 0, reverse=True)
-
-    return {'galleries': galleries_with_ratings[:limit]}
+    galleries = RatingSummary.objects.top_rated(Gallery.objects.all(), limit)
+    return {'galleries': [{'gallery': gallery, 'rating': rating} for gallery, rating in galleries]}
@@ -1,40 +1,33 @@
 from django import template
-import random
-from django.db.models import Count
-from polls.models import Poll
+from polls.pools import poll_pool
+from polls.results import get_results
 
 register = template.Library()
 
+@register.simple_tag
+def random_poll_id():
+    """Returns the id of a random active poll, or None if there is none."""
+    return poll_pool.pick_pk()
+
+
 @register.inclusion_tag('includes/random_poll.html')
-def random_poll():
+def random_poll(poll_id=None):
     """
-    Method getting random poll with its total votes,
-    vote percentages. Only polls that have total votes
-    greater than 1 and no archive date are chosen
+    Method getting random poll with its total votes and
+    vote percentages. Only polls with no archive date are chosen.
+    The poll is drawn from the random poll pool (unless given)
+    and its results come from the cached results snapshot.
     """
-    queryset = (
-        Poll.objects
-            .annotate(num_votes=Count('poll_votes'))
-            .filter(archive_date__isnull=True)
-    )
-
-    polls_list = list(queryset)
-    if not polls_list:
-        return {'poll': None, 'choices': None, 'total_votes': 0}
-
-    poll = random.choice(polls_list)
+    empty = {'poll': None, 'choices': None, 'total_votes': 0}
 
-    choices_queryset = poll.choices.annotate(votes_count=Count('choice_votes'))
-    total_votes = poll.total_votes()
+    if poll_id is None:
+        poll_id = poll_pool.pick_pk()
+    if poll_id is None:
+        return empty
 
-    for choice in choices_queryset:
-        if total_votes:
-            choice.percentage = round((choice.votes_count / total_votes) * 100, 1)
-        else:
-            choice.percentage = 0.0
+    results = get_results(poll_id)
+    if results is None:
+        poll_pool.remove(poll_id)
+        return empty
 
-    return {
-        'poll': poll,
-        'choices': choices_queryset,
-        'total_votes': total_votes,
-    }
\ No newline at end of file
+    return results
@@ -9,7 +9,12 @@ def querystring(request, **params):
     """
     Returns the current URL query string updated with the given parameters.
     For use in templates for building links with modified query parameters.
+    Parameters set to None are removed.
     """
     query_dict = request.GET.copy()
-    query_dict.update(params)
+    for key, value in params.items():
+        if value is None:
+            query_dict.pop(key, None)
+        else:
+            query_dict[key] = value
     return query_dict.urlencode()
\ No newline at end of file
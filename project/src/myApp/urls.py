@@ -30,11 +30,13 @@ urlpatterns = [
     path('events/', include('events.urls')),
     path('user_profile/', include('user_profile.urls')),
     path('photo_gallery/', include('photo_gallery.urls')),
+    path('szukaj/', views.GlobalSearchView.as_view(), name='search'),
     path('o-nas/', views.about, name='about'),
     path('uslugi-platne/', views.paid_service, name='paid_service'),
     path('informacje-pomoc/', views.info_help, name='info_help'),
     path('comments_and_ratings/', include('comments_and_ratings.urls')),
-    path('polls/', include('polls.urls'))
+    path('polls/', include('polls.urls')),
+    path('api/v1/', include('api.urls')),
 ]
 
 
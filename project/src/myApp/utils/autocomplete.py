@@ -0,0 +1,70 @@
+import hashlib
+
+from django.contrib.postgres.indexes import OpClass
+from django.core.cache import cache
+from django.db.models import Index, TextField
+from django.db.models.functions import Cast, Upper
+from django.http import JsonResponse
+from django.views import View
+
+from . import fragment_cache
+
+AUTOCOMPLETE_TIMEOUT = 60 * 10
+MIN_PREFIX_LENGTH = 2
+SUGGESTIONS_LIMIT = 8
+
+
+def prefix_index(field, name):
+    """
+    Returns an index serving case-insensitive prefix lookups of a text
+    field (`field__istartswith`), whatever the database collation is.
+    """
+    return Index(OpClass(Upper(Cast(field, TextField())), name='text_pattern_ops'), name=name)
+
+
+def normalize_prefix(text):
+    return ' '.join(text.split()).casefold()
+
+
+def complete(queryset, fields, prefix, limit=SUGGESTIONS_LIMIT):
+    """
+    Returns up to `limit` distinct values of the fields starting with the
+    prefix, sorted alphabetically. Every field is looked up through its
+    prefix index with one query.
+    """
+    values = {}
+    for field in fields:
+        matches = (queryset
+                   .filter(**{f'{field}__istartswith': prefix})
+                   .order_by(field)
+                   .values_list(field, flat=True)
+                   .distinct()[:limit])
+        for value in matches:
+            values.setdefault(value.casefold(), value)
+    return [values[key] for key in sorted(values)][:limit]
+
+
+class AutocompleteView(View):
+    """
+    Returns JSON suggestions for the text typed into a search box (the `q`
+    parameter). Suggestions are cached per prefix; a change of the model
+    bumps its fragment generation, which invalidates them.
+    """
+    queryset = None
+    fields = ()
+
+    def get(self, request, *args, **kwargs):
+        prefix = normalize_prefix(request.GET.get('q', ''))
+        if len(prefix) < MIN_PREFIX_LENGTH:
+            return JsonResponse([], safe=False)
+
+        label = self.queryset.model._meta.label_lower
+        generation, = fragment_cache.get_generations([label])
+        digest = hashlib.md5(prefix.encode()).hexdigest()
+        key = f'autocomplete:{label}:{self.__class__.__name__}:{digest}:{generation}'
+
+        suggestions = cache.get(key)
+        if suggestions is None:
+            suggestions = complete(self.queryset.all(), self.fields, prefix)
+            cache.set(key, suggestions, AUTOCOMPLETE_TIMEOUT)
+        return JsonResponse(suggestions, safe=False)
@@ -0,0 +1,159 @@
+import hashlib
+
+from django.contrib.contenttypes.models import ContentType
+from django.contrib.messages import get_messages
+from django.db.models import Count, Max, OuterRef, Subquery
+from django.utils.cache import get_conditional_response, patch_cache_control
+from django.utils.http import http_date, quote_etag
+from django.views.generic.detail import SingleObjectMixin
+
+from comments_and_ratings.models import Comment, Rating
+from . import fragment_cache
+
+# Labels the cached layout fragments depend on (see layout.html), so a
+# changed sidebar also changes the validators of every page.
+LAYOUT_DEPENDENCIES = [
+    'events.event',
+    'announcements.announcement',
+    'photo_gallery.gallery',
+    'photo_gallery.photo',
+    'polls.poll',
+    'polls.choice',
+]
+# Labels behind the sidebar's poll results and top-rated lists. They are
+# left out of the validators and page keys of other pages, so a vote or
+# rating doesn't invalidate the whole site: those pages may show older
+# results and top-rated lists until another change of their content or
+# layout. The home page, which shows the sidebar only, follows them.
+LAYOUT_ENGAGEMENT_DEPENDENCIES = ['polls.vote', 'comments_and_ratings.rating']
+# Labels behind the rating and comment counters of list cards.
+ENGAGEMENT_DEPENDENCIES = ['comments_and_ratings.rating', 'comments_and_ratings.comment']
+
+
+def _latest(*values):
+    values = [value for value in values if value is not None]
+    return max(values) if values else None
+
+
+def _engagement_stamps(content_type, model):
+    """Returns subqueries of the latest change and count of related comments or ratings."""
+    related = (model.objects
+               .filter(content_type=content_type, object_id=OuterRef('pk'))
+               .order_by()
+               .values('object_id'))
+    return (
+        Subquery(related.annotate(latest=Max('updated_at')).values('latest')),
+        Subquery(related.annotate(count=Count('id')).values('count')),
+    )
+
+
+class ConditionalGetMixin:
+    """
+    Answers repeated GET requests of list and detail views with
+    304 Not Modified, before any context or template work.
+
+    The ETag is built from a cheap version stamp of the shown content (for
+    a single object its `updated_at` and the latest change and count of its
+    comments and ratings, for a list the generation of its model and the
+    request parameters), the generations of the layout fragments, and the
+    current user, whose rating, comments and permissions change the page.
+    The latest change of an object is also sent as Last-Modified.
+
+    Requests with pending flash messages are always answered in full, so
+    the messages are shown.
+
+    Responses must be revalidated, unless `max_age` is set: then anonymous
+    responses may be reused by shared caches for that many seconds.
+    """
+    version_field = 'updated_at'
+    max_age = None
+
+    def dispatch(self, request, *args, **kwargs):
+        if request.method not in ('GET', 'HEAD') or len(get_messages(request)):
+            return super().dispatch(request, *args, **kwargs)
+
+        last_modified, version = self.get_version_stamp()
+        if version is None:
+            return super().dispatch(request, *args, **kwargs)
+
+        etag = self.make_etag(version)
+        timestamp = int(last_modified.timestamp()) if last_modified else None
+        response = get_conditional_response(request, etag=etag, last_modified=timestamp)
+        if response is not None:
+            return response
+
+        response = super().dispatch(request, *args, **kwargs)
+        if response.status_code == 200:
+            response.headers.setdefault('ETag', etag)
+            if timestamp is not None:
+                response.headers.setdefault('Last-Modified', http_date(timestamp))
+            patch_cache_control(response, **self.get_cache_control())
+        return response
+
+    def get_cache_control(self):
+        if self.max_age and not self.request.user.is_authenticated:
+            return {'public': True, 'max_age': self.max_age}
+        return {'no_cache': True, 'private': self.request.user.is_authenticated}
+
+    def make_etag(self, version):
+        dependencies = LAYOUT_DEPENDENCIES
+        if not isinstance(self, SingleObjectMixin):
+            dependencies = dependencies + ENGAGEMENT_DEPENDENCIES
+
+        user = self.request.user
+        parts = [
+            *version,
+            *fragment_cache.get_generations(dependencies),
+            user.pk,
+            user.is_staff,
+        ]
+        return quote_etag(hashlib.md5(repr(parts).encode()).hexdigest())
+
+    def get_version_stamp(self):
+        """
+        Returns the latest change of the shown content (or None) and a list
+        of values identifying its version, or (None, None) to skip the check.
+        """
+        if isinstance(self, SingleObjectMixin):
+            return self.get_object_version_stamp()
+        return self.get_list_version_stamp()
+
+    def get_object_version_stamp(self):
+        queryset = self.model._default_manager.all()
+        pk = self.kwargs.get(self.pk_url_kwarg)
+        slug = self.kwargs.get(self.slug_url_kwarg)
+        if pk is not None:
+            queryset = queryset.filter(pk=pk)
+        elif slug is not None:
+            queryset = queryset.filter(**{self.get_slug_field(): slug})
+        else:
+            return None, None
+
+        content_type = ContentType.objects.get_for_model(self.model)
+        comments_changed, comments_count = _engagement_stamps(content_type, Comment)
+        ratings_changed, ratings_count = _engagement_stamps(content_type, Rating)
+        row = (queryset
+               .annotate(comments_changed=comments_changed, comments_count=comments_count,
+                         ratings_changed=ratings_changed, ratings_count=ratings_count)
+               .values_list(self.version_field, 'comments_changed', 'comments_count',
+                            'ratings_changed', 'ratings_count')
+               .first())
+        if row is None:
+            return None, None
+
+        changed, comments_changed, comments_count, ratings_changed, ratings_count = row
+        return _latest(changed, comments_changed, ratings_changed), list(row)
+
+    def get_list_version_stamp(self):
+        """
+        Stamps a list with the generation of its model, bumped by every
+        change of it, and with the list's URL arguments and parameters
+        (filter, search, sort, cursor). No query of the list is run.
+        """
+        generation, = fragment_cache.get_generations([self.model._meta.label_lower])
+        params = sorted(
+            (name, value)
+            for name, values in self.request.GET.lists()
+            for value in values
+        )
+        return None, [generation, sorted(self.kwargs.items()), params]
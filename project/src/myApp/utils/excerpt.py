@@ -0,0 +1,22 @@
+from django.utils.text import Truncator
+
+EXCERPT_LENGTH = 200
+
+
+def make_excerpt(text, length=EXCERPT_LENGTH):
+    """Returns the beginning of a text on a single line, shortened to `length` characters."""
+    return Truncator(' '.join(text.split())).chars(length)
+
+
+def update_excerpt(instance, update_fields=None):
+    """
+    Recomputes the stored `excerpt` of an instance from its `description`
+    before it's saved. Returns the update fields of the save, extended with
+    the excerpt when they include the description.
+    """
+    if 'description' in instance.get_deferred_fields():
+        return update_fields
+    instance.excerpt = make_excerpt(instance.description)
+    if update_fields is not None and 'description' in update_fields:
+        update_fields = {*update_fields, 'excerpt'}
+    return update_fields
@@ -0,0 +1,73 @@
+from django.core.cache import cache
+
+FRAGMENT_TIMEOUT = 60 * 10
+STALE_TIMEOUT = 60 * 60 * 24
+LOCK_TIMEOUT = 30
+
+
+def generation_key(label):
+    return f'fragment_generation:{label}'
+
+
+def get_generations(labels):
+    """
+    Returns the current generation of every dependency label.
+    Labels seen for the first time start at generation 1.
+    """
+    keys = [generation_key(label) for label in labels]
+    generations = cache.get_many(keys)
+
+    for key in keys:
+        if key not in generations:
+            cache.add(key, 1, None)
+            generations[key] = cache.get(key, 1)
+
+    return [generations[key] for key in keys]
+
+
+def invalidate(label):
+    """
+    Bumps the generation of a dependency label, which invalidates every
+    fragment depending on it. Labels are model labels, e.g. 'events.event'.
+    """
+    key = generation_key(label)
+    try:
+        cache.incr(key)
+    except ValueError:
+        cache.add(key, 2, None)
+
+
+def get_or_render(name, dependencies, render, vary=()):
+    """
+    Returns the cached HTML of a fragment, rendering it on a miss.
+
+    The cache key contains the generations of all dependency labels, so a
+    change of any dependency makes the fragment miss. Only the worker that
+    wins the rebuild lock renders it; the others serve the last rendered
+    (stale) copy meanwhile, or render it themselves if there is none yet.
+
+    Args:
+        name (str): Name of the fragment.
+        dependencies (list): Labels of the models the fragment shows.
+        render (callable): Returns the fragment HTML.
+        vary (iterable): Values the fragment depends on, e.g. page number.
+    """
+    base_key = ':'.join(['fragment', name, *map(str, vary)])
+    key = ':'.join([base_key, *map(str, get_generations(dependencies))])
+
+    html = cache.get(key)
+    if html is not None:
+        return html
+
+    lock_key = f'{base_key}:lock'
+    if cache.add(lock_key, 1, LOCK_TIMEOUT):
+        try:
+            html = render()
+            cache.set(key, html, FRAGMENT_TIMEOUT)
+            cache.set(f'{base_key}:stale', html, STALE_TIMEOUT)
+        finally:
+            cache.delete(lock_key)
+        return html
+
+    stale = cache.get(f'{base_key}:stale')
+    return stale if stale is not None else render()
@@ -0,0 +1,33 @@
+from django.core.exceptions import PermissionDenied
+from django.http import Http404
+from django.views.generic.list import MultipleObjectMixin
+
+
+class ListFragmentMixin:
+    """
+    Mixin for list views serving only the cards of a cursor page, which
+    the list page appends as it is scrolled (see `load_more_cards.html`).
+
+    The fragment isn't wrapped in the layout and skips the list page's own
+    context (filters, sort options, facet counts): it is rendered from the
+    page, its objects and the list view's `get_card_context`. The filter
+    of the list (the `filter` URL argument) must be one of `filters`.
+    """
+    cards_template_name = None
+    filters = ()
+
+    def dispatch(self, request, *args, **kwargs):
+        if kwargs.get('filter') not in self.filters:
+            raise Http404("Nieznana lista")
+        return super().dispatch(request, *args, **kwargs)
+
+    def handle_no_permission(self):
+        raise PermissionDenied
+
+    def get_template_names(self):
+        return [self.cards_template_name]
+
+    def get_context_data(self, **kwargs):
+        context = MultipleObjectMixin.get_context_data(self, **kwargs)
+        context.update(self.get_card_context(context['object_list']))
+        return context
@@ -0,0 +1,213 @@
+import base64
+import datetime
+import decimal
+import json
+
+from django.core.exceptions import FieldDoesNotExist
+from django.db.models import FloatField, Q
+from django.db.models.constants import LOOKUP_SEP
+from django.http import Http404
+
+
+def _default(value):
+    # Unlike DjangoJSONEncoder, keep microseconds: a truncated key would
+    # skip rows sharing the millisecond of the last row of the page.
+    if isinstance(value, (datetime.date, datetime.time)):
+        return value.isoformat()
+    if isinstance(value, decimal.Decimal):
+        return str(value)
+    raise TypeError(f"Object of type {type(value).__name__} is not a cursor value")
+
+
+def encode_cursor(*values):
+    """
+    Encodes the sort key of the last row of a page as an opaque,
+    URL-safe cursor. Dates and datetimes are stored in full ISO format.
+    """
+    payload = json.dumps(values, default=_default, separators=(',', ':'))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip('=')
+
+
+def decode_cursor(cursor, *parsers):
+    """
+    Decodes a cursor made by `encode_cursor`, converting every value with
+    the matching parser (e.g. `parse_datetime`, `int`).
+
+    Raises:
+        ValueError: If the cursor is malformed or does not match the parsers.
+    """
+    try:
+        padded = cursor + '=' * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode()))
+    except (TypeError, ValueError) as exc:
+        raise ValueError(f"Invalid cursor: {cursor!r}") from exc
+
+    if not isinstance(values, list) or len(values) != len(parsers):
+        raise ValueError(f"Invalid cursor: {cursor!r}")
+
+    parsed = []
+    for parser, value in zip(parsers, values):
+        try:
+            value = parser(value)
+        except (TypeError, ValueError) as exc:
+            raise ValueError(f"Invalid cursor: {cursor!r}") from exc
+        if value is None:
+            raise ValueError(f"Invalid cursor: {cursor!r}")
+        parsed.append(value)
+    return tuple(parsed)
+
+
+def keyset_ordering(queryset):
+    """
+    Returns the ordering of a queryset as `(name, field, descending)`
+    triples ending with the primary key, which makes it a unique key.
+
+    Returns None if the ordering can't be used as a keyset: it is empty,
+    contains expressions, relations or nullable columns, or float values
+    (e.g. search ranks) that don't survive the round trip through a cursor.
+    """
+    query = queryset.query
+    opts = queryset.model._meta
+    ordering = query.order_by or (opts.ordering if query.default_ordering else ())
+
+    keys = []
+    for item in ordering:
+        if not isinstance(item, str) or item == '?' or LOOKUP_SEP in item:
+            return None
+        descending = item.startswith('-')
+        name = item.lstrip('-')
+        if name == 'pk':
+            name = opts.pk.name
+
+        if name in query.annotations:
+            field = query.annotations[name].output_field
+        else:
+            try:
+                field = opts.get_field(name)
+            except FieldDoesNotExist:
+                return None
+            if field.is_relation or field.null:
+                return None
+        if isinstance(field, FloatField):
+            return None
+
+        keys.append((name, field, descending))
+        if field is opts.pk:
+            return keys
+
+    if not keys:
+        return None
+    return keys + [(opts.pk.name, opts.pk, keys[-1][2])]
+
+
+def _beyond(keys, values, backwards):
+    """
+    Returns the condition matching rows after (or before) the key values.
+    The redundant bound on the first key lets the database seek an index
+    on the sort columns to the cursor instead of filtering from the start.
+    """
+    condition = None
+    equal = Q()
+    for (name, _, descending), value in zip(keys, values):
+        lookup = 'lt' if descending != backwards else 'gt'
+        step = equal & Q(**{f'{name}__{lookup}': value})
+        condition = step if condition is None else condition | step
+        equal &= Q(**{name: value})
+
+    (name, _, descending), value = keys[0], values[0]
+    return Q(**{f"{name}__{'lte' if descending != backwards else 'gte'}": value}) & condition
+
+
+class KeysetPage:
+    """
+    A page of a list paginated by cursors. Unlike Django's Page it knows
+    neither its number nor the total count, only the cursors of the
+    neighbouring pages.
+    """
+    is_keyset = True
+
+    def __init__(self, object_list, next_cursor=None, previous_cursor=None):
+        self.object_list = object_list
+        self.next_cursor = next_cursor
+        self.previous_cursor = previous_cursor
+
+    def __len__(self):
+        return len(self.object_list)
+
+    def __iter__(self):
+        return iter(self.object_list)
+
+    def __getitem__(self, index):
+        return self.object_list[index]
+
+    def has_next(self):
+        return self.next_cursor is not None
+
+    def has_previous(self):
+        return self.previous_cursor is not None
+
+    def has_other_pages(self):
+        return self.has_next() or self.has_previous()
+
+
+def keyset_page(queryset, keys, per_page, after=None, before=None):
+    """
+    Returns the page of `per_page` rows following the `after` cursor, or
+    preceding the `before` one, or the first page. One query fetches an
+    extra row to tell whether there is a further page; nothing is counted.
+    The rows may be model instances or dicts of a `values()` queryset
+    selecting the key columns.
+
+    Raises:
+        ValueError: If the cursor is malformed.
+    """
+    backwards = bool(before)
+    cursor = before if backwards else after
+    if cursor:
+        values = decode_cursor(cursor, *(field.to_python for _, field, _ in keys))
+        queryset = queryset.filter(_beyond(keys, values, backwards))
+
+    queryset = queryset.order_by(*(
+        ('-' if descending != backwards else '') + name for name, _, descending in keys
+    ))
+    rows = list(queryset[:per_page + 1])
+    further = len(rows) > per_page
+    rows = rows[:per_page]
+    if backwards:
+        rows.reverse()
+
+    def cursor_of(row):
+        if isinstance(row, dict):
+            return encode_cursor(*(row[name] for name, _, _ in keys))
+        return encode_cursor(*(getattr(row, name) for name, _, _ in keys))
+
+    has_next = True if backwards else further
+    has_previous = further if backwards else bool(cursor)
+    return KeysetPage(
+        rows,
+        next_cursor=cursor_of(rows[-1]) if rows and has_next else None,
+        previous_cursor=cursor_of(rows[0]) if rows and has_previous else None,
+    )
+
+
+class KeysetPaginationMixin:
+    """
+    ListView mixin paginating by cursors (the `after` and `before`
+    parameters) keyed on the list's ordering plus the primary key, instead
+    of OFFSET and a COUNT(*) of the whole list.
+
+    Lists whose ordering can't be keyed (e.g. search results ordered by
+    rank) and requests for a numbered page use the regular paginator.
+    """
+
+    def paginate_queryset(self, queryset, page_size):
+        keys = keyset_ordering(queryset)
+        if keys is None or self.page_kwarg in self.request.GET:
+            return super().paginate_queryset(queryset, page_size)
+
+        try:
+            page = keyset_page(queryset, keys, page_size,
+                               self.request.GET.get('after'), self.request.GET.get('before'))
+        except ValueError:
+            raise Http404("Nieprawidłowy kursor strony")
+        return None, page, page.object_list, page.has_other_pages()
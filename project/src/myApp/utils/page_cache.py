@@ -0,0 +1,140 @@
+import hashlib
+from urllib.parse import urlencode
+
+from django.contrib.messages import get_messages
+from django.core.cache import cache
+from django.http import HttpResponse
+from django.middleware.csrf import get_token
+from django.utils.cache import get_conditional_response
+from django.utils.http import parse_http_date_safe
+
+from . import fragment_cache
+from .conditional_get import LAYOUT_DEPENDENCIES
+
+PAGE_TIMEOUT = 60 * 5
+CSRF_PLACEHOLDER = '__page_cache_csrf_token__'
+IGNORED_PARAMETERS = {'fbclid', 'gclid'}
+VALIDATOR_HEADERS = ('ETag', 'Last-Modified', 'Cache-Control')
+
+
+def object_key(label, pk):
+    """Returns the surrogate key of a single object, e.g. 'events.event:12'."""
+    return f'{label}:{pk}'
+
+
+def instance_key(instance):
+    return object_key(instance._meta.label_lower, instance.pk)
+
+
+def page_key(request):
+    """
+    Returns the cache key of a page. The query string is normalized:
+    parameters are sorted, and empty and tracking parameters are dropped.
+    """
+    params = sorted(
+        (name, value)
+        for name, values in request.GET.lists()
+        if name not in IGNORED_PARAMETERS and not name.startswith('utm_')
+        for value in values
+        if value
+    )
+    url = f'{request.path}?{urlencode(params)}'
+    return f'page:{hashlib.md5(url.encode()).hexdigest()}'
+
+
+def is_cacheable(request):
+    """
+    Only anonymous GET and HEAD requests without pending flash messages
+    get cached pages, as all others see content specific to them.
+    """
+    return (
+        request.method in ('GET', 'HEAD')
+        and not request.user.is_authenticated
+        and not len(get_messages(request))
+    )
+
+
+def purge(*keys):
+    """Purges every cached page tagged with any of the surrogate keys."""
+    for key in keys:
+        fragment_cache.invalidate(key)
+
+
+def queryset_keys(queryset):
+    """
+    Returns the surrogate keys of the objects of a queryset and of its model.
+    Collect them before a bulk update, which bypasses the purging signals.
+    """
+    label = queryset.model._meta.label_lower
+    return [label, *(object_key(label, pk) for pk in queryset.values_list('pk', flat=True))]
+
+
+def _with_csrf_token(request, content):
+    # The cached page is shared by all visitors, so it holds a placeholder
+    # instead of the token of the visitor it was rendered for.
+    return content.replace(CSRF_PLACEHOLDER.encode(), get_token(request).encode())
+
+
+class AnonymousPageCacheMixin:
+    """
+    Caches whole rendered pages of a view for anonymous visitors.
+
+    Every page is tagged with surrogate keys of the models and objects it
+    shows (see `get_surrogate_keys`). Surrogate keys share the generations
+    of the fragment cache, so a change of a tagged object or model purges
+    exactly the pages that reference it. Votes and ratings shown only by
+    the sidebar don't purge pages (see `LAYOUT_ENGAGEMENT_DEPENDENCIES`).
+    """
+    page_cache_timeout = PAGE_TIMEOUT
+
+    def dispatch(self, request, *args, **kwargs):
+        if not is_cacheable(request):
+            return super().dispatch(request, *args, **kwargs)
+
+        key = page_key(request)
+        entry = cache.get(key)
+        if entry is not None and fragment_cache.get_generations(entry['keys']) == entry['generations']:
+            response = HttpResponse(
+                _with_csrf_token(request, entry['content']),
+                content_type=entry['content_type'],
+                headers=entry['headers'],
+            )
+            return get_conditional_response(
+                request,
+                etag=response.get('ETag'),
+                last_modified=parse_http_date_safe(response.get('Last-Modified', '')),
+                response=response,
+            )
+
+        response = super().dispatch(request, *args, **kwargs)
+        if response.status_code != 200 or not hasattr(response, 'render'):
+            return response
+
+        response.context_data['csrf_token'] = CSRF_PLACEHOLDER
+        response.render()
+        keys = sorted(set(self.get_surrogate_keys(response.context_data)))
+        cache.set(key, {
+            'keys': keys,
+            'generations': fragment_cache.get_generations(keys),
+            'content': response.content,
+            'content_type': response['Content-Type'],
+            'headers': {name: response[name] for name in VALIDATOR_HEADERS if name in response},
+        }, self.page_cache_timeout)
+
+        response.content = _with_csrf_token(request, response.content)
+        return response
+
+    def get_surrogate_keys(self, context):
+        """
+        Returns the surrogate keys of a rendered page: the labels of the
+        models the layout sidebar shows, the shown object, or the model
+        label of a list (any change may reorder it) and each of the objects
+        on the current page.
+        """
+        keys = list(LAYOUT_DEPENDENCIES)
+        if context.get('object') is not None:
+            keys.append(instance_key(context['object']))
+        if context.get('object_list') is not None:
+            keys.append(self.model._meta.label_lower)
+            keys.extend(instance_key(obj) for obj in context['object_list'])
+        return keys
@@ -0,0 +1,117 @@
+import base64
+import hashlib
+import json
+import pickle
+
+from django.apps import apps
+from django.core import signing
+from django.core.cache import cache
+from django.core.paginator import EmptyPage, PageNotAnInteger, Paginator
+from django.db import connections
+from django.db.models.query import QuerySet
+from django.utils.functional import cached_property
+
+# Querysets the planner expects to return fewer rows are counted exactly.
+EXACT_COUNT_LIMIT = 1000
+COUNT_TIMEOUT = 60 * 60 * 24
+REFRESH_INTERVAL = 60 * 5
+
+
+def estimate_count(queryset):
+    """Returns the planner's estimate of the number of rows of a queryset."""
+    sql, params = queryset.query.sql_with_params()
+    with connections[queryset.db].cursor() as cursor:
+        cursor.execute(f'EXPLAIN (FORMAT JSON) {sql}', params)
+        plan = cursor.fetchone()[0]
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return int(plan[0]['Plan']['Plan Rows'])
+
+
+def count_key(sql, params):
+    digest = hashlib.md5(repr((sql, params)).encode()).hexdigest()
+    return f'paginator_count:{digest}'
+
+
+def dump_query(queryset):
+    """
+    Returns the query of a queryset as a signed string, which can be sent
+    to a task with any serializer (parameters keep their types).
+    """
+    data = base64.b64encode(pickle.dumps(queryset.query)).decode()
+    return signing.Signer(salt=__name__).sign(data)
+
+
+def load_query(model_label, db, query):
+    """
+    Rebuilds a queryset from a model label and a query made by `dump_query`.
+    Raises `BadSignature` for a query which wasn't signed by this project.
+    """
+    data = signing.Signer(salt=__name__).unsign(query)
+    queryset = apps.get_model(model_label)._base_manager.using(db).all()
+    queryset.query = pickle.loads(base64.b64decode(data))
+    return queryset
+
+
+def store_exact_count(key, queryset):
+    """Counts the rows of a queryset exactly and caches the result under the key."""
+    count = queryset.count()
+    cache.set(key, count, COUNT_TIMEOUT)
+    return count
+
+
+class EstimatedCountPaginator(Paginator):
+    """
+    Paginator which doesn't run COUNT(*) over big querysets.
+
+    Querysets the planner expects to be small are counted exactly. Bigger
+    ones use an exact count cached by a background task, refreshed every
+    few minutes, and the planner's estimate until the first count is
+    stored. As the count may be approximate, pages past it are served too
+    (and are empty if there are no such rows).
+    """
+    exact_count_limit = EXACT_COUNT_LIMIT
+
+    @cached_property
+    def estimate(self):
+        if not isinstance(self.object_list, QuerySet):
+            return None
+        return estimate_count(self.object_list)
+
+    @cached_property
+    def is_estimated(self):
+        return self.estimate is not None and self.estimate >= self.exact_count_limit
+
+    @cached_property
+    def count(self):
+        if not self.is_estimated:
+            return super().count
+
+        queryset = self.object_list.order_by()
+        sql, params = queryset.query.sql_with_params()
+        key = count_key(sql, params)
+        if cache.add(f'{key}:fresh', 1, REFRESH_INTERVAL):
+            # Imported here: the task module imports this one.
+            from myApp.tasks import refresh_count
+            refresh_count.delay(key, queryset.model._meta.label, queryset.db, dump_query(queryset))
+
+        count = cache.get(key)
+        return count if count is not None else self.estimate
+
+    def validate_number(self, number):
+        if not self.is_estimated:
+            return super().validate_number(number)
+        try:
+            number = int(number)
+        except (TypeError, ValueError):
+            raise PageNotAnInteger(self.error_messages['invalid_page'])
+        if number < 1:
+            raise EmptyPage(self.error_messages['min_page'])
+        return number
+
+    def page(self, number):
+        if not self.is_estimated:
+            return super().page(number)
+        number = self.validate_number(number)
+        bottom = (number - 1) * self.per_page
+        return self._get_page(self.object_list[bottom:bottom + self.per_page], number, self)
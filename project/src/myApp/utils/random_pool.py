@@ -0,0 +1,136 @@
+import random
+import time
+
+from django.core.cache import cache
+
+LOCK_TIMEOUT = 30
+LOCK_ATTEMPTS = 50
+LOCK_WAIT = 0.01
+
+
+class RandomPool:
+    """
+    A uniform random sample of primary keys of a queryset, kept in the cache.
+
+    The sample is drawn once by `rotate` (and redrawn on schedule), then
+    kept uniform with reservoir sampling as rows are added and removed, so
+    picking a random row never scans or materializes the table. Updates of
+    the stored sample are serialized by a lock in the cache.
+
+    Attributes:
+        name (str): Unique name of the pool, used in the cache key.
+        queryset (QuerySet): Rows the pool samples from.
+        size (int): Maximum number of primary keys kept in the pool.
+    """
+
+    def __init__(self, name, queryset, size=100):
+        self.name = name
+        self.queryset = queryset
+        self.size = size
+
+    @property
+    def cache_key(self):
+        return f'random_pool:{self.name}'
+
+    @property
+    def lock_key(self):
+        return f'{self.cache_key}:lock'
+
+    def _update(self, change):
+        """
+        Applies `change` to the stored state under the pool's lock, so
+        concurrent updates aren't lost. `change` gets the state (None if
+        there is none) and returns the new state, or None to keep it. If
+        the lock can't be taken, the sample is dropped rather than left
+        inconsistent, and is redrawn by the next pick.
+        """
+        for _ in range(LOCK_ATTEMPTS):
+            if cache.add(self.lock_key, 1, LOCK_TIMEOUT):
+                try:
+                    state = change(cache.get(self.cache_key))
+                    if state is not None:
+                        cache.set(self.cache_key, state, None)
+                finally:
+                    cache.delete(self.lock_key)
+                return
+            time.sleep(LOCK_WAIT)
+        cache.delete(self.cache_key)
+
+    def rotate(self):
+        """Draws a fresh sample from the queryset and stores it in the cache."""
+        state = {
+            'pks': list(self.queryset.order_by('?').values_list('pk', flat=True)[:self.size]),
+            'total': self.queryset.count(),
+        }
+        self._update(lambda _: state)
+        return state
+
+    def get_state(self):
+        """
+        Returns the stored sample. On a miss only the request winning the
+        rotation lock draws a new one; the others get None meanwhile
+        instead of all scanning the table at once.
+        """
+        state = cache.get(self.cache_key)
+        if state is None and cache.add(f'{self.cache_key}:rotating', 1, LOCK_TIMEOUT):
+            try:
+                state = self.rotate()
+            finally:
+                cache.delete(f'{self.cache_key}:rotating')
+        return state
+
+    def pick_pk(self):
+        """Returns a random primary key of the pool, or None if it is empty (or being drawn)."""
+        state = self.get_state()
+        return random.choice(state['pks']) if state and state['pks'] else None
+
+    def pick(self, queryset=None):
+        """
+        Returns a random row of the pool, or None if the pool is empty (or
+        being drawn). Keys of rows that no longer match the queryset are
+        dropped on the way.
+        """
+        queryset = self.queryset if queryset is None else queryset
+        state = self.get_state()
+        if state is None:
+            return None
+
+        pks = list(state['pks'])
+        while pks:
+            pk = random.choice(pks)
+            obj = queryset.filter(pk=pk).first()
+            if obj is not None:
+                return obj
+            pks.remove(pk)
+            self.remove(pk)
+        return None
+
+    def add(self, pk):
+        """
+        Offers a new row to the pool. While the pool is full, the row
+        replaces a random key with probability size/total, which keeps
+        the sample uniform over all rows.
+        """
+        def change(state):
+            if state is None:
+                return None
+            state['total'] += 1
+            if len(state['pks']) < self.size:
+                state['pks'].append(pk)
+            elif random.randrange(state['total']) < self.size:
+                state['pks'][random.randrange(self.size)] = pk
+            return state
+
+        self._update(change)
+
+    def remove(self, pk):
+        """Removes a deleted row from the pool."""
+        def change(state):
+            if state is None:
+                return None
+            state['total'] = max(state['total'] - 1, 0)
+            if pk in state['pks']:
+                state['pks'].remove(pk)
+            return state
+
+        self._update(change)
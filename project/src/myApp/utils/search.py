@@ -0,0 +1,114 @@
+import re
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+from django.contrib.postgres.search import SearchQuery, SearchRank, TrigramWordSimilarity
+from django.db import connection
+from django.db.models import F, Q
+from django.db.models.functions import Greatest
+
+# Text search configuration of the stored search vectors. The migrations
+# create it as a copy of 'simple' when the server has no Polish dictionary.
+SEARCH_CONFIG = 'polish'
+
+WORD_RE = re.compile(r'\w+')
+
+
+def prefix_query(text):
+    """
+    Returns a tsquery matching all words of the text, each also as a
+    prefix (like the former icontains search), or None if the text has
+    no words.
+    """
+    words = WORD_RE.findall(text.lower())
+    if not words:
+        return None
+    return SearchQuery(' & '.join(f'{word}:*' for word in words), config=SEARCH_CONFIG, search_type='raw')
+
+
+def _similarity(text, fields):
+    similarities = [TrigramWordSimilarity(text, field) for field in fields]
+    return Greatest(*similarities) if len(similarities) > 1 else similarities[0]
+
+
+def full_text_search(queryset, text, fuzzy_fields=()):
+    """
+    Filters a queryset by its stored `search_vector` and annotates every
+    row with `search_rank` for ordering by relevance.
+
+    Rows whose `fuzzy_fields` contain a word similar to the text (by
+    trigrams, e.g. a misspelled place name) match as well; the
+    similarity is added to their rank.
+    """
+    query = prefix_query(text)
+    if query is None:
+        return queryset
+
+    condition = Q(search_vector=query)
+    rank = SearchRank(F('search_vector'), query)
+    if fuzzy_fields:
+        for field in fuzzy_fields:
+            condition |= Q(**{f'{field}__trigram_word_similar': text})
+        rank = rank + _similarity(text, fuzzy_fields)
+    return queryset.filter(condition).annotate(search_rank=rank)
+
+
+def suggest(queryset, text, fields):
+    """
+    Returns the value of one of the fields most similar to the text, as a
+    "did you mean" suggestion, or None. Every field is looked up through
+    its trigram index with one query.
+    """
+    best, best_similarity = None, 0
+    for field in fields:
+        row = (queryset
+               .filter(**{f'{field}__trigram_word_similar': text})
+               .annotate(similarity=TrigramWordSimilarity(text, field))
+               .order_by('-similarity')
+               .values_list(field, 'similarity')
+               .first())
+        if row and row[1] > best_similarity:
+            best, best_similarity = row
+
+    if best is None or best.casefold() == text.strip().casefold():
+        return None
+    return best
+
+
+class SearchSource:
+    """
+    One content type of the global search: a label shown next to its
+    results, the queryset of rows visible to users and the fields
+    matched fuzzily.
+    """
+
+    def __init__(self, label, queryset, fuzzy_fields=()):
+        self.label = label
+        self.queryset = queryset
+        self.fuzzy_fields = fuzzy_fields
+
+    def search(self, text, limit):
+        """Returns up to `limit` best matching rows, best first."""
+        queryset = full_text_search(self.queryset.all(), text, self.fuzzy_fields)
+        return list(queryset.order_by('-search_rank')[:limit])
+
+
+def _search_in_thread(source, text, limit):
+    try:
+        return source.search(text, limit)
+    finally:
+        # Every worker thread opens its own connection; don't leak it.
+        connection.close()
+
+
+def search_concurrently(sources, text, limit):
+    """
+    Searches all sources at once, each in its own thread and database
+    connection, and yields `(source, results)` pairs in the order the
+    sources finish, so a slow source doesn't hold back the others.
+    """
+    if prefix_query(text) is None:
+        return
+    with ThreadPoolExecutor(max_workers=len(sources)) as executor:
+        futures = {executor.submit(_search_in_thread, source, text, limit): source for source in sources}
+        for future in as_completed(futures):
+            yield futures[future], future.result()
@@ -1,29 +1,92 @@
+from django.http import StreamingHttpResponse
 from django.shortcuts import render
+from django.template.loader import render_to_string
+from django.views import View
 from django.views.generic import TemplateView
-from django.core.paginator import Paginator
+from django.utils.functional import SimpleLazyObject
 from events.models import Event
 from announcements.models import Announcement
+from photo_gallery.models import Gallery, Photo
+from polls.models import Poll
+from .utils.conditional_get import LAYOUT_ENGAGEMENT_DEPENDENCIES
+from .utils.page_cache import AnonymousPageCacheMixin
+from .utils.paginator import EstimatedCountPaginator
+from .utils.search import SearchSource, search_concurrently
 
+SEARCH_SOURCES = [
+    SearchSource('Wydarzenie', Event.objects.filter(is_verified=True), ['event_name', 'location']),
+    SearchSource('Ogłoszenie', Announcement.objects.filter(is_verified=True), ['title', 'place']),
+    SearchSource('Galeria', Gallery.objects.all(), ['title']),
+    SearchSource('Zdjęcie', Photo.objects.select_related('gallery')),
+    SearchSource('Ankieta', Poll.objects.all()),
+]
 
-class HomeView(TemplateView):
+
+class HomeView(AnonymousPageCacheMixin, TemplateView):
     template_name = 'layout.html'
     paginate_by = 5
 
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
 
+        # Pages are evaluated lazily, so cached pinned fragments skip the queries.
         pinned_events = Event.objects.filter(is_pinned=True).order_by('-created_at')
-        event_paginator = Paginator(pinned_events, self.paginate_by)
+        event_paginator = EstimatedCountPaginator(pinned_events, self.paginate_by)
         event_page_number = self.request.GET.get('event_page')
-        context['event_page_obj'] = event_paginator.get_page(event_page_number)
+        context['event_page_obj'] = SimpleLazyObject(
+            lambda: event_paginator.get_page(event_page_number)
+        )
 
         pinned_announcements = Announcement.objects.filter(is_pinned=True).order_by('-date')
-        announcement_paginator = Paginator(pinned_announcements, self.paginate_by)
+        announcement_paginator = EstimatedCountPaginator(pinned_announcements, self.paginate_by)
         announcement_page_number = self.request.GET.get('announcement_page')
-        context['announcement_page_obj'] = announcement_paginator.get_page(announcement_page_number)
+        context['announcement_page_obj'] = SimpleLazyObject(
+            lambda: announcement_paginator.get_page(announcement_page_number)
+        )
 
         return context
 
+    def get_surrogate_keys(self, context):
+        """
+        The home page shows the layout, including its poll results and
+        top-rated lists, and the pinned events and announcements.
+        """
+        return super().get_surrogate_keys(context) + [
+            *LAYOUT_ENGAGEMENT_DEPENDENCIES,
+            Event._meta.label_lower,
+            Announcement._meta.label_lower,
+        ]
+
+class GlobalSearchView(View):
+    """
+    Searches all content types at once. The page is streamed: the layout
+    goes out first and every source's results follow as soon as its query
+    finishes; the page script keeps them ordered by score.
+    """
+    template_name = 'search.html'
+    results_template_name = 'includes/search_results.html'
+    results_marker = '<!--search-results-->'
+    sources = SEARCH_SOURCES
+    results_per_source = 10
+
+    def get(self, request, *args, **kwargs):
+        query = request.GET.get('q', '').strip()
+        page = render_to_string(self.template_name, {'query': query}, request=request)
+        head, tail = page.split(self.results_marker)
+        return StreamingHttpResponse(self.stream(query, head, tail))
+
+    def stream(self, query, head, tail):
+        yield head
+        found = False
+        for source, results in search_concurrently(self.sources, query, self.results_per_source):
+            if results:
+                found = True
+                yield render_to_string(self.results_template_name, {'source': source, 'results': results})
+        if query and not found:
+            yield '<p class="text-muted" id="search-empty">Brak wyników</p>'
+        yield tail
+
+
 def about(request):
     return render(request, 'about.html')
 
@@ -5,11 +5,14 @@ allowing administrators to manage galleries/photos through the built-in admin in
 """
 
 from django.contrib import admin
+from myApp.utils.paginator import EstimatedCountPaginator
 from .models import Gallery, Photo
 
 
 @admin.register(Gallery)
 class EventAdmin(admin.ModelAdmin):
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
     list_display = ('title',
                     'description',
                     'created_at',
@@ -20,6 +23,8 @@ class EventAdmin(admin.ModelAdmin):
 
 @admin.register(Photo)
 class EventAdmin(admin.ModelAdmin):
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
     list_display = ('title',
                     'image',
                     'description',
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.18 on 2026-10-17 19:05
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('photo_gallery', '0002_gallery_photo_delete_announcement'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='photo',
+            name='updated_at',
+            field=models.DateTimeField(auto_now=True),
+        ),
+    ]
@@ -0,0 +1,65 @@
+# Generated by Django 5.2.18 on 2026-10-17 19:06
+
+import django.contrib.postgres.indexes
+import django.contrib.postgres.search
+from django.conf import settings
+from django.db import migrations
+
+
+# Polish is not a built-in text search configuration; fall back to
+# a copy of 'simple' when the server does not provide one.
+CREATE_SEARCH_CONFIG = """
+DO $$
+BEGIN
+    IF NOT EXISTS (SELECT 1 FROM pg_ts_config WHERE cfgname = 'polish') THEN
+        CREATE TEXT SEARCH CONFIGURATION polish (COPY = simple);
+    END IF;
+END
+$$;
+"""
+
+SEARCH_TRIGGER = """
+CREATE FUNCTION photo_gallery_gallery_search_vector_update() RETURNS trigger AS $$
+BEGIN
+    NEW.search_vector :=
+        setweight(to_tsvector('polish', coalesce(NEW.title, '')), 'A') ||
+        setweight(to_tsvector('polish', coalesce(NEW.description, '')), 'B');
+    RETURN NEW;
+END
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER photo_gallery_gallery_search_vector_update
+    BEFORE INSERT OR UPDATE ON photo_gallery_gallery
+    FOR EACH ROW EXECUTE FUNCTION photo_gallery_gallery_search_vector_update();
+
+UPDATE photo_gallery_gallery SET search_vector =
+    setweight(to_tsvector('polish', coalesce(title, '')), 'A') ||
+    setweight(to_tsvector('polish', coalesce(description, '')), 'B');
+"""
+
+DROP_SEARCH_TRIGGER = """
+DROP TRIGGER IF EXISTS photo_gallery_gallery_search_vector_update ON photo_gallery_gallery;
+DROP FUNCTION IF EXISTS photo_gallery_gallery_search_vector_update();
+"""
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('photo_gallery', '0003_photo_updated_at'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='gallery',
+            name='search_vector',
+            field=django.contrib.postgres.search.SearchVectorField(editable=False, null=True),
+        ),
+        migrations.AddIndex(
+            model_name='gallery',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['search_vector'], name='gallery_search_vector'),
+        ),
+        migrations.RunSQL(CREATE_SEARCH_CONFIG, migrations.RunSQL.noop),
+        migrations.RunSQL(SEARCH_TRIGGER, DROP_SEARCH_TRIGGER),
+    ]
@@ -1,11 +1,16 @@
 from django.contrib.auth import get_user_model
 from django.contrib.contenttypes.fields import GenericRelation
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import SearchVectorField
 from django.db import models
 from django.urls import reverse
+from django.utils.functional import cached_property
 from django.utils.text import slugify
 from PIL import Image
 
-from comments_and_ratings.models import Rating
+from comments_and_ratings.models import Rating, RatingSummary
+from myApp.utils.autocomplete import prefix_index
+from myApp.utils.excerpt import EXCERPT_LENGTH, update_excerpt
 from myApp.utils.upload_pather import dynamic_image_upload_pather
 
 
@@ -16,6 +21,7 @@ class Gallery(models.Model):
     Attributes:
     title (CharField): The title of the gallery (maximum 100 characters).
     description (TextField): A brief description of the gallery (maximum 500 characters).
+    excerpt (CharField): The beginning of the description shown on the list cards.
     created_at (DateTimeField): The date and time when the gallery was created.
     updated_at (DateTimeField): The date and time when the gallery was last updated.
     creator (ForeignKey): A reference to the user who created the gallery.
@@ -25,6 +31,7 @@ class Gallery(models.Model):
     """
     title = models.CharField(max_length=100, verbose_name="tytuł galerii")
     description = models.TextField(max_length=500, verbose_name="opis galerii")
+    excerpt = models.CharField(max_length=EXCERPT_LENGTH, blank=True, editable=False, verbose_name="skrót opisu")
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
     creator = models.ForeignKey(
@@ -37,25 +44,34 @@ class Gallery(models.Model):
         verbose_name="miniaturka galerii"
     )
     slug = models.SlugField(max_length=100, unique=True)
+    search_vector = SearchVectorField(null=True, editable=False)
 
     ratings = GenericRelation('comments_and_ratings.Rating')
     comments = GenericRelation('comments_and_ratings.Comment')
+    rating_summaries = GenericRelation('comments_and_ratings.RatingSummary')
 
     class Meta:
         verbose_name = "Galeria"
         verbose_name_plural = "Galerie"
         ordering = ['-created_at']
+        indexes = [
+            GinIndex(fields=['search_vector'], name='gallery_search_vector'),
+            GinIndex(fields=['title'], opclasses=['gin_trgm_ops'], name='gallery_title_trigram'),
+            prefix_index('title', 'gallery_title_prefix'),
+        ]
 
     def save(self, *args, **kwargs):
         """
         Overrides the default save method to automatically generate a slug and process the thumbnail image.
 
         If the slug is not already set, it is generated from the gallery title using Django's `slugify`.
+        The stored excerpt of the description is kept up to date.
         After saving, if a thumbnail image is provided, it is opened, converted to RGB,
         resized to a maximum of 400x300 pixels and saved as a JPEG with 85% quality.
         """
         if not self.slug:
             self.slug = slugify(self.title)
+        kwargs['update_fields'] = update_excerpt(self, kwargs.get('update_fields'))
         super().save(*args, **kwargs)
 
     def get_absolute_url(self):
@@ -79,10 +95,13 @@ class Gallery(models.Model):
         """
         return self.title
 
+    @cached_property
+    def rating_summary(self):
+        return RatingSummary.objects.for_object(self)
+
     @property
     def average_rating(self):
-        result = self.ratings.aggregate(models.Avg('rating'))
-        return round(result['rating__avg'], 1) if result['rating__avg'] else None
+        return self.rating_summary.average
 
     def get_user_rating(self, user):
         try:
@@ -111,14 +130,20 @@ class Photo(models.Model):
     image = models.ImageField(upload_to=dynamic_image_upload_pather)
     description = models.TextField(max_length=500, blank=True)
     uploaded_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+    search_vector = SearchVectorField(null=True, editable=False)
 
     ratings = GenericRelation('comments_and_ratings.Rating')
     comments = GenericRelation('comments_and_ratings.Comment')
+    rating_summaries = GenericRelation('comments_and_ratings.RatingSummary')
 
     class Meta:
         verbose_name = "Zdjęcie"
         verbose_name_plural = "Zdjęcia"
         ordering = ['-uploaded_at']
+        indexes = [
+            GinIndex(fields=['search_vector'], name='photo_search_vector'),
+        ]
 
     def save(self, *args, **kwargs):
         """
@@ -144,10 +169,13 @@ class Photo(models.Model):
         """
         return reverse('photo_gallery:photo_detail', kwargs={'slug': self.gallery.slug, 'pk': self.pk})
 
+    @cached_property
+    def rating_summary(self):
+        return RatingSummary.objects.for_object(self)
+
     @property
     def average_rating(self):
-        result = self.ratings.aggregate(models.Avg('rating'))
-        return round(result['rating__avg'], 1) if result['rating__avg'] else None
+        return self.rating_summary.average
 
     def get_user_rating(self, user):
         try:
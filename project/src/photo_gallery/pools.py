@@ -0,0 +1,4 @@
+from myApp.utils.random_pool import RandomPool
+from .models import Photo
+
+photo_pool = RandomPool('photo', Photo.objects.all())
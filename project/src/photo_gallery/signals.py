@@ -0,0 +1,26 @@
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from .models import Photo
+from .pools import photo_pool
+
+
+@receiver(post_save, sender=Photo)
+def add_photo_to_pool(sender, instance, created, **kwargs):
+    """
+    Signal receiver that offers every newly uploaded photo
+    to the random photo pool once it is committed.
+    """
+    if created:
+        transaction.on_commit(lambda: photo_pool.add(instance.pk))
+
+
+@receiver(post_delete, sender=Photo)
+def remove_photo_from_pool(sender, instance, **kwargs):
+    """
+    Signal receiver that removes a deleted photo
+    from the random photo pool.
+    """
+    pk = instance.pk
+    transaction.on_commit(lambda: photo_pool.remove(pk))
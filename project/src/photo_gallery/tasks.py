@@ -0,0 +1,9 @@
+from celery import shared_task
+
+from .pools import photo_pool
+
+
+@shared_task
+def rotate_photo_pool():
+    """Task to draw a fresh random sample for the random photo widget."""
+    photo_pool.rotate()
@@ -3,7 +3,7 @@ Urls for galleries and photos operations - showing gallery list for specific use
 editing, deleting user's galleries/photos and adding new galleries/photos.
 Directs users to the appropriate page where they can perform the activity they are interested in.
 """
-from django.urls import path
+from django.urls import path, re_path
 from . import views
 
 
@@ -12,6 +12,14 @@ app_name = 'photo_gallery'
 urlpatterns = [
     path('', views.GalleryListView.as_view(), name='gallery_list', kwargs={'filter': 'all'}),
     path('my-galleries/', views.GalleryListView.as_view(), name='user_gallery_list', kwargs={'filter': 'my'}),
+    # Only the known lists, so a gallery slugged 'cards' keeps its edit and delete pages.
+    re_path(
+        rf"^cards/(?P<filter>{'|'.join(views.GalleryCardsView.filters)})/$",
+        views.GalleryCardsView.as_view(),
+        name='gallery_cards',
+    ),
+    # Two segments, so it can't shadow a gallery slug.
+    path('search/autocomplete/', views.GalleryAutocompleteView.as_view(), name='gallery_autocomplete'),
     path('create/', views.GalleryCreateView.as_view(), name='gallery_create'),
     path('<slug:slug>/', views.GalleryDetailView.as_view(), name='gallery_detail'),
     path('<slug:slug>/edit/', views.GalleryUpdateView.as_view(), name='gallery_update'),
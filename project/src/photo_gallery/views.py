@@ -1,18 +1,23 @@
-from django.contrib.contenttypes.models import ContentType
-from django.core.paginator import Paginator
 from django.views.generic import ListView, CreateView, UpdateView, DeleteView, DetailView
 from django.contrib import messages
 from django.urls import reverse_lazy
 from django.contrib.auth.mixins import LoginRequiredMixin, AccessMixin
 from django.shortcuts import get_object_or_404
 
-from comments_and_ratings.forms import CommentForm
+from comments_and_ratings.views import EngagementContextMixin, EngagementListMixin
+from myApp.utils.autocomplete import AutocompleteView
+from myApp.utils.conditional_get import ConditionalGetMixin
+from myApp.utils.infinite_scroll import ListFragmentMixin
+from myApp.utils.keyset import KeysetPaginationMixin
+from myApp.utils.page_cache import AnonymousPageCacheMixin
+from myApp.utils.paginator import EstimatedCountPaginator
+from myApp.utils.search import full_text_search, suggest
 from .models import Gallery, Photo
 from .forms import GalleryForm, PhotoForm
-from django.db.models import Q
+from django.db.models import Count, Max
 
 
-class GalleryListView(ListView):
+class GalleryListView(AnonymousPageCacheMixin, ConditionalGetMixin, KeysetPaginationMixin, EngagementListMixin, ListView):
     """
     View showing galleries:
     - For logged-in users: all galleries or only user's galleries depending on URL
@@ -20,10 +25,13 @@ class GalleryListView(ListView):
     """
     model = Gallery
     context_object_name = 'galleries'
+    card_fields = ['title', 'slug', 'thumbnail', 'excerpt', 'created_at', 'updated_at']
     paginate_by = 10
+    paginator_class = EstimatedCountPaginator
+    fuzzy_search_fields = ['title']
 
     def get_queryset(self):
-        queryset = Gallery.objects.all()
+        queryset = super().get_queryset()
 
         match self.kwargs.get('filter'):
             case 'all':
@@ -35,19 +43,25 @@ class GalleryListView(ListView):
 
         search_query = self.request.GET.get('search')
         if search_query:
-            queryset = queryset.filter(
-                Q(title__icontains=search_query) |
-                Q(description__icontains=search_query)
-            )
+            self.unsearched_queryset = queryset
+            queryset = full_text_search(queryset, search_query, self.fuzzy_search_fields)
 
         sort_by = self.request.GET.get('sort_by')
         valid_sort_fields = ['-created_at', 'created_at', '-updated_at']
-        queryset = queryset.order_by(sort_by if sort_by in valid_sort_fields else '-created_at')
+        if sort_by in valid_sort_fields:
+            queryset = queryset.order_by(sort_by)
+        elif 'search_rank' in queryset.query.annotations:
+            # Search results are ordered by relevance first.
+            queryset = queryset.order_by('-search_rank', '-created_at')
+        else:
+            queryset = queryset.order_by('-created_at')
 
         return queryset
 
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
+        if (search_text := self.request.GET.get('search')) and not context['object_list']:
+            context['search_suggestion'] = suggest(self.unsearched_queryset, search_text, self.fuzzy_search_fields)
 
         current_filter = self.kwargs.get('filter', 'all')
         context['is_all_galleries'] = current_filter == 'all'
@@ -77,8 +91,18 @@ class GalleryListView(ListView):
         return context
 
 
+class GalleryCardsView(ListFragmentMixin, GalleryListView):
+    """Cards of the next page of a gallery list, appended while the list is scrolled."""
+    cards_template_name = 'photo_gallery/includes/gallery_cards.html'
+    filters = ('all', 'my')
+
+
+class GalleryAutocompleteView(AutocompleteView):
+    queryset = Gallery.objects.all()
+    fields = ['title']
 
-class GalleryDetailView(DetailView):
+
+class GalleryDetailView(AnonymousPageCacheMixin, ConditionalGetMixin, EngagementContextMixin, DetailView):
     """View showing gallery details"""
     model = Gallery
     context_object_name = 'gallery'
@@ -86,6 +110,19 @@ class GalleryDetailView(DetailView):
     slug_url_kwarg = 'slug'
     paginate_by = 4
 
+    def get_version_stamp(self):
+        """Add the photos of the gallery to its version stamp."""
+        last_modified, version = super().get_version_stamp()
+        if version is None:
+            return last_modified, version
+
+        photos = (Photo.objects
+                  .filter(gallery__slug=self.kwargs['slug'])
+                  .aggregate(latest=Max('updated_at'), count=Count('id')))
+        if photos['latest'] and (last_modified is None or photos['latest'] > last_modified):
+            last_modified = photos['latest']
+        return last_modified, version + [photos['latest'], photos['count']]
+
     def get_context_data(self, **kwargs):
         """Add context for template rendering:
         - gallery (Gallery): The current gallery object.
@@ -98,49 +135,10 @@ class GalleryDetailView(DetailView):
         context = super().get_context_data(**kwargs)
         photos = self.object.photos.all().order_by('-uploaded_at')
         context["page_param"] = "page"
-        paginator = Paginator(photos, self.paginate_by)
+        paginator = EstimatedCountPaginator(photos, self.paginate_by)
         page_number = self.request.GET.get('page')
         page_obj = paginator.get_page(page_number)
 
-        gallery = self.object
-
-        content_type = ContentType.objects.get_for_model(gallery)
-        object_id = gallery.id
-
-        context['content_type'] = content_type
-        context['object_id'] = object_id
-        context['comments'] = gallery.comments.filter(parent_comment__isnull=True).order_by('-created_at')
-        context['comment_form'] = CommentForm()
-        context['average_rating'] = gallery.average_rating
-        context['ratings_count'] = gallery.ratings.count()
-
-        if self.request.user.is_authenticated:
-            rating_obj = gallery.ratings.filter(user=self.request.user).first()
-            context['user_rating'] = rating_obj.rating if rating_obj else None
-            context['user_rating_id'] = rating_obj.id if rating_obj else None
-
-        if gallery.average_rating is not None:
-            average = float(context['average_rating'])
-            full_stars = int(average)
-            has_half = (average - full_stars) >= 0.5
-            empty_stars = 10 - full_stars - (1 if has_half else 0)
-
-            context.update({
-                'stars_data': {
-                    'full': full_stars,
-                    'half': has_half,
-                    'empty': empty_stars
-                }
-            })
-        else:
-            context.update({
-                'stars_data': {
-                    'full': 0,
-                    'half': False,
-                    'empty': 10
-                }
-            })
-
         context.update({
             'is_owner': self.request.user == self.object.creator,
             'is_all_galleries': False,
@@ -208,7 +206,7 @@ class GalleryDeleteView(LoginRequiredMixin, DeleteView):
         return super().form_valid(form)
 
 
-class PhotoDetailView(DetailView):
+class PhotoDetailView(AnonymousPageCacheMixin, ConditionalGetMixin, EngagementContextMixin, DetailView):
     """View showing photo details"""
     model = Photo
     context_object_name = 'photo'
@@ -218,46 +216,7 @@ class PhotoDetailView(DetailView):
 
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
-        photo = self.object
-
-        content_type = ContentType.objects.get_for_model(photo)
-        object_id = photo.id
-
-        context['content_type'] = content_type
-        context['object_id'] = object_id
-        context['comments'] = photo.comments.filter(parent_comment__isnull=True).order_by('-created_at')
-        context['comment_form'] = CommentForm()
-        context['average_rating'] = photo.average_rating
-        context['ratings_count'] = photo.ratings.count()
-        context['is_owner'] = self.request.user == photo.gallery.creator
-
-        if self.request.user.is_authenticated:
-            rating_obj = photo.ratings.filter(user=self.request.user).first()
-            context['user_rating'] = rating_obj.rating if rating_obj else None
-            context['user_rating_id'] = rating_obj.id if rating_obj else None
-
-        if photo.average_rating is not None:
-            average = float(context['average_rating'])
-            full_stars = int(average)
-            has_half = (average - full_stars) >= 0.5
-            empty_stars = 10 - full_stars - (1 if has_half else 0)
-
-            context.update({
-                'stars_data': {
-                    'full': full_stars,
-                    'half': has_half,
-                    'empty': empty_stars
-                }
-            })
-        else:
-            context.update({
-                'stars_data': {
-                    'full': 0,
-                    'half': False,
-                    'empty': 10
-                }
-            })
-
+        context['is_owner'] = self.request.user == self.object.gallery.creator
         return context
 
 
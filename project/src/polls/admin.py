@@ -9,7 +9,10 @@ from django.contrib import admin
 from django.utils import timezone
 from django.db.models import Count
 
+from myApp.utils import page_cache
+from myApp.utils.paginator import EstimatedCountPaginator
 from .models import Choice, Poll, Vote
+from .pools import poll_pool
 
 
 class ChoiceInline(admin.TabularInline):
@@ -34,6 +37,8 @@ class ChoiceInline(admin.TabularInline):
 
 @admin.register(Poll)
 class PollAdmin(admin.ModelAdmin):
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
     list_display = [
         'question',
         'creation_date',
@@ -67,7 +72,10 @@ class PollAdmin(admin.ModelAdmin):
         Sets the poll status to archived.
         Updates 'archive_date' only.
         """
+        keys = page_cache.queryset_keys(queryset)
         queryset.update(archive_date=timezone.now())
+        page_cache.purge(*keys)
+        poll_pool.rotate()
     archive_selected.short_description = 'Archiwizuj wybrane ogłoszenia'
 
     def unarchive_selected(self, request, queryset):
@@ -75,12 +83,17 @@ class PollAdmin(admin.ModelAdmin):
         Sets the poll status to unarchived.
         Updates 'archive_date' only
         """
+        keys = page_cache.queryset_keys(queryset)
         queryset.update(archive_date=None)
+        page_cache.purge(*keys)
+        poll_pool.rotate()
     unarchive_selected.short_description = 'Odarchiwizuj wybrane ankiety'
 
 
 @admin.register(Choice)
 class ChoiceAdmin(admin.ModelAdmin):
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
     list_display = ['text',
                     'poll',
                     'vote_count']
@@ -101,6 +114,8 @@ class ChoiceAdmin(admin.ModelAdmin):
 
 @admin.register(Vote)
 class VoteAdmin(admin.ModelAdmin):
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
     list_display = ['user',
                     'poll',
                     'choice',
@@ -0,0 +1,63 @@
+# Generated by Django 5.2.18 on 2026-10-17 19:09
+
+import django.contrib.postgres.indexes
+import django.contrib.postgres.search
+from django.conf import settings
+from django.db import migrations
+
+
+# Polish is not a built-in text search configuration; fall back to
+# a copy of 'simple' when the server does not provide one.
+CREATE_SEARCH_CONFIG = """
+DO $$
+BEGIN
+    IF NOT EXISTS (SELECT 1 FROM pg_ts_config WHERE cfgname = 'polish') THEN
+        CREATE TEXT SEARCH CONFIGURATION polish (COPY = simple);
+    END IF;
+END
+$$;
+"""
+
+SEARCH_TRIGGER = """
+CREATE FUNCTION polls_poll_search_vector_update() RETURNS trigger AS $$
+BEGIN
+    NEW.search_vector :=
+        setweight(to_tsvector('polish', coalesce(NEW.question, '')), 'A');
+    RETURN NEW;
+END
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER polls_poll_search_vector_update
+    BEFORE INSERT OR UPDATE ON polls_poll
+    FOR EACH ROW EXECUTE FUNCTION polls_poll_search_vector_update();
+
+UPDATE polls_poll SET search_vector =
+    setweight(to_tsvector('polish', coalesce(question, '')), 'A');
+"""
+
+DROP_SEARCH_TRIGGER = """
+DROP TRIGGER IF EXISTS polls_poll_search_vector_update ON polls_poll;
+DROP FUNCTION IF EXISTS polls_poll_search_vector_update();
+"""
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('polls', '0002_alter_vote_choice_alter_vote_poll'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='poll',
+            name='search_vector',
+            field=django.contrib.postgres.search.SearchVectorField(editable=False, null=True),
+        ),
+        migrations.AddIndex(
+            model_name='poll',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['search_vector'], name='poll_search_vector'),
+        ),
+        migrations.RunSQL(CREATE_SEARCH_CONFIG, migrations.RunSQL.noop),
+        migrations.RunSQL(SEARCH_TRIGGER, DROP_SEARCH_TRIGGER),
+    ]
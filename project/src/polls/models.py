@@ -1,5 +1,8 @@
 from django.contrib.auth import get_user_model
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import SearchVectorField
 from django.db import models
+from django.urls import reverse
 from django.utils import timezone
 
 
@@ -32,10 +35,14 @@ class Poll(models.Model):
         on_delete=models.CASCADE,
         verbose_name='twórca ankiety',
     )
+    search_vector = SearchVectorField(null=True, editable=False)
 
     def __str__(self):
         return self.question
 
+    def get_absolute_url(self):
+        return reverse('polls:poll_detail', kwargs={'pk': self.pk})
+
     def total_votes(self):
         """
         Method counting all votes within a poll, uses
@@ -54,6 +61,9 @@ class Poll(models.Model):
     class Meta:
         verbose_name = 'ankieta'
         verbose_name_plural = 'ankiety'
+        indexes = [
+            GinIndex(fields=['search_vector'], name='poll_search_vector'),
+        ]
 
 
 class Choice(models.Model):
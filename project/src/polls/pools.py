@@ -0,0 +1,4 @@
+from myApp.utils.random_pool import RandomPool
+from .models import Poll
+
+poll_pool = RandomPool('poll', Poll.objects.filter(archive_date__isnull=True))
@@ -0,0 +1,58 @@
+from django.core.cache import cache
+from django.db.models import Count
+
+from .models import Choice, Poll
+
+
+def results_cache_key(poll_id):
+    return f'poll_results:{poll_id}'
+
+
+def build_results(poll_id):
+    """
+    Computes the results snapshot of a poll: its question,
+    per-choice vote counts and percentages and the total number of votes.
+    Returns None if the poll does not exist.
+    """
+    poll = Poll.objects.filter(pk=poll_id).values('pk', 'question').first()
+    if poll is None:
+        return None
+
+    choices = list(
+        Choice.objects
+        .filter(poll_id=poll_id)
+        .annotate(votes_count=Count('choice_votes'))
+        .values('pk', 'text', 'votes_count')
+        .order_by('pk')
+    )
+    total_votes = sum(choice['votes_count'] for choice in choices)
+
+    for choice in choices:
+        if total_votes:
+            choice['percentage'] = round((choice['votes_count'] / total_votes) * 100, 1)
+        else:
+            choice['percentage'] = 0.0
+
+    return {
+        'poll': poll,
+        'choices': choices,
+        'total_votes': total_votes,
+    }
+
+
+def refresh_results(poll_id):
+    """Rebuilds the cached results snapshot of a poll."""
+    results = build_results(poll_id)
+    if results is None:
+        cache.delete(results_cache_key(poll_id))
+    else:
+        cache.set(results_cache_key(poll_id), results, None)
+    return results
+
+
+def get_results(poll_id):
+    """Returns the cached results snapshot of a poll, building it on a miss."""
+    results = cache.get(results_cache_key(poll_id))
+    if results is None:
+        results = refresh_results(poll_id)
+    return results
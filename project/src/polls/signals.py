@@ -0,0 +1,71 @@
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save, pre_save
+from django.dispatch import receiver
+
+from .models import Choice, Poll, Vote
+from .pools import poll_pool
+from .results import refresh_results, results_cache_key
+
+
+@receiver(pre_save, sender=Poll)
+def remember_archive_state(sender, instance, raw=False, update_fields=None, **kwargs):
+    """Signal receiver that remembers whether the stored poll was archived before a save."""
+    instance._was_archived = None
+    if raw or instance._state.adding or instance.pk is None:
+        return
+    if update_fields is not None and 'archive_date' not in update_fields:
+        instance._was_archived = instance.archive_date is not None
+        return
+    instance._was_archived = Poll.objects.filter(pk=instance.pk, archive_date__isnull=False).exists()
+
+
+@receiver(post_save, sender=Poll)
+def update_poll_pool(sender, instance, created, **kwargs):
+    """
+    Signal receiver that offers new and un-archived polls to the random
+    poll pool and removes polls from it when they get archived. Saves
+    not changing the archive status leave the pool alone.
+    """
+    pk = instance.pk
+    is_archived = instance.archive_date is not None
+    # A new poll wasn't in the pool, just like an archived one.
+    was_archived = True if created else getattr(instance, '_was_archived', None)
+    if was_archived is None or was_archived == is_archived:
+        return
+    if is_archived:
+        transaction.on_commit(lambda: poll_pool.remove(pk))
+    else:
+        transaction.on_commit(lambda: poll_pool.add(pk))
+
+
+@receiver(post_save, sender=Poll)
+def refresh_poll_snapshot(sender, instance, **kwargs):
+    """
+    Signal receiver that refreshes the results snapshot of a poll after
+    every save, so an edited question is shown by the widget.
+    """
+    pk = instance.pk
+    transaction.on_commit(lambda: refresh_results(pk))
+
+
+@receiver(post_delete, sender=Poll)
+def remove_poll_from_pool(sender, instance, **kwargs):
+    """
+    Signal receiver that drops a deleted poll from the random poll pool
+    together with its results snapshot.
+    """
+    pk = instance.pk
+    transaction.on_commit(lambda: poll_pool.remove(pk))
+    transaction.on_commit(lambda: cache.delete(results_cache_key(pk)))
+
+
+@receiver([post_save, post_delete], sender=Vote)
+@receiver([post_save, post_delete], sender=Choice)
+def refresh_poll_results(sender, instance, **kwargs):
+    """
+    Signal receiver that refreshes the results snapshot of a poll
+    whenever one of its votes or choices changes.
+    """
+    poll_id = instance.poll_id
+    transaction.on_commit(lambda: refresh_results(poll_id))
@@ -1,13 +1,26 @@
 from celery import shared_task
 from django.utils import timezone
 
+from myApp.utils import fragment_cache
 from .models import Poll
+from .pools import poll_pool
 
 
 @shared_task
 def archive_past_polls():
     """Task to archive all polls after end_date is reached."""
-    Poll.objects.filter(
+    archived = Poll.objects.filter(
         end_date__lt=timezone.now(),
         archive_date__isnull=True
     ).update(archive_date=timezone.now())
+
+    if archived:
+        # The bulk update bypasses the signals invalidating the poll lists.
+        fragment_cache.invalidate(Poll._meta.label_lower)
+        poll_pool.rotate()
+
+
+@shared_task
+def rotate_poll_pool():
+    """Task to draw a fresh random sample for the random poll widget."""
+    poll_pool.rotate()
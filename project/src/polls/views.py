@@ -8,11 +8,13 @@ from django.urls import reverse_lazy
 from django.views import View
 from django.views.generic import CreateView, DeleteView, DetailView, ListView
 
+from myApp.utils.keyset import KeysetPaginationMixin
+from myApp.utils.paginator import EstimatedCountPaginator
 from .forms import ChoiceFormSet, PollCreateForm
 from .models import Choice, Poll, Vote
 
 
-class PollListView(ListView):
+class PollListView(KeysetPaginationMixin, ListView):
     """
     View reponsible for listing all views.
     Uses filtering based on URL kwargs.
@@ -20,6 +22,7 @@ class PollListView(ListView):
     model = Poll
     context_object_name = 'polls'
     paginate_by = 10
+    paginator_class = EstimatedCountPaginator
 
     def get_queryset(self):
         user = self.request.user
@@ -45,7 +48,7 @@ class PollListView(ListView):
                 Vote.objects.filter(poll=OuterRef('pk'), user=user)
             )
 
-        return queryset.annotate(**annotations)
+        return queryset.annotate(**annotations).order_by('-creation_date')
 
     def get_context_data(self, **kwargs):
         """Context used for checking filter"""
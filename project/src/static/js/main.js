@@ -20,3 +20,88 @@ document.addEventListener('DOMContentLoaded', function() {
     });
 });
 
+
+// Search boxes with a data-autocomplete-url fill their datalist with
+// suggestions while the user types.
+document.addEventListener('DOMContentLoaded', function() {
+    document.querySelectorAll('input[data-autocomplete-url]').forEach(function(input) {
+        const datalist = document.getElementById(input.getAttribute('list'));
+        let timer = null;
+        let controller = null;
+
+        input.addEventListener('input', function() {
+            clearTimeout(timer);
+            timer = setTimeout(function() {
+                if (controller) {
+                    controller.abort();
+                }
+                controller = new AbortController();
+                const url = input.dataset.autocompleteUrl + '?q=' + encodeURIComponent(input.value);
+                fetch(url, {signal: controller.signal})
+                    .then(response => response.json())
+                    .then(function(suggestions) {
+                        datalist.replaceChildren(...suggestions.map(value => new Option(value)));
+                    })
+                    .catch(function() {});
+            }, 150);
+        });
+    });
+});
+
+
+// Lists with a "load more" button (a next cursor page) append the cards
+// of the next page as the button scrolls into view, instead of loading
+// the whole next page; the pagination links are kept as a fallback.
+document.addEventListener('DOMContentLoaded', function() {
+    const first = document.querySelector('.load-more-cards');
+    if (!first || !('IntersectionObserver' in window)) {
+        return;
+    }
+    const container = first.parentElement;
+    const pagination = document.querySelectorAll('.pagination');
+    pagination.forEach(function(element) { element.style.display = 'none'; });
+
+    const observer = new IntersectionObserver(function(entries) {
+        entries.forEach(function(entry) {
+            if (entry.isIntersecting) {
+                load(entry.target);
+            }
+        });
+    }, {rootMargin: '400px'});
+
+    function watch(button) {
+        button.hidden = false;
+        observer.observe(button);
+    }
+
+    function load(button) {
+        observer.unobserve(button);
+        button.disabled = true;
+        fetch(button.dataset.url, {headers: {'X-Requested-With': 'XMLHttpRequest'}})
+            .then(function(response) {
+                if (!response.ok) {
+                    throw new Error(response.statusText);
+                }
+                return response.text();
+            })
+            .then(function(html) {
+                button.outerHTML = html;
+                const next = container.querySelector('.load-more-cards');
+                if (next) {
+                    watch(next);
+                }
+            })
+            .catch(function() {
+                button.remove();
+                pagination.forEach(function(element) { element.style.display = ''; });
+            });
+    }
+
+    container.addEventListener('click', function(e) {
+        const button = e.target.closest('.load-more-cards');
+        if (button && !button.disabled) {
+            load(button);
+        }
+    });
+    watch(first);
+});
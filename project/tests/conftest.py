@@ -17,13 +17,13 @@ if not settings.configured:
     django.setup()
 
 import pytest
-from django.contrib.auth.models import User
+from django.contrib.auth import get_user_model
 from events.models import Event
 from django.utils import timezone
 
 @pytest.fixture
 def user(db):
-    return User.objects.create_user(
+    return get_user_model().objects.create_user(
         username='testuser',
         password='testpass123'
     )
@@ -38,4 +38,33 @@ def event(db, user):
         creator=user,
         is_verified=True,
         is_archived=False
-    )
\ No newline at end of file
+    )
+
+@pytest.fixture
+def make_event(db, user):
+    def make(location='Olsztyn', **kwargs):
+        kwargs.setdefault('event_name', 'Wydarzenie')
+        kwargs.setdefault('description', 'Opis')
+        kwargs.setdefault('event_date', timezone.now() + timezone.timedelta(days=1))
+        kwargs.setdefault('creator', user)
+        kwargs.setdefault('is_verified', True)
+        return Event.objects.create(location=location, **kwargs)
+    return make
+
+@pytest.fixture
+def events(db, user):
+    # All events share the date, so only the id tells them apart.
+    event_date = timezone.now() + timezone.timedelta(days=1)
+    return Event.objects.bulk_create(
+        Event(event_name=f'Wydarzenie {i}', description='Opis', location='Olsztyn',
+              event_date=event_date, creator=user, is_verified=True)
+        for i in range(25)
+    )
+
+@pytest.fixture(autouse=True)
+def local_cache(settings):
+    settings.CACHES = {
+        'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}
+    }
+    from django.core.cache import cache
+    cache.clear()
@@ -0,0 +1,90 @@
+# tests/test_api.py
+import pytest
+from django.urls import reverse
+from django.utils import timezone
+
+from polls.models import Poll
+
+pytestmark = pytest.mark.django_db
+
+
+class TestEventApi:
+    def test_sparse_fieldset(self, client, event):
+        """Test zwracania tylko wybranych pól"""
+        response = client.get(reverse('api:event_list'), {'fields': 'id,name,creator'})
+
+        assert response.status_code == 200
+        assert response.json()['results'] == [{'id': event.pk, 'name': 'Test Event', 'creator': 'testuser'}]
+
+    def test_all_fields(self, client, event):
+        """Test domyślnego zestawu pól z licznikami zaangażowania"""
+        result, = client.get(reverse('api:event_list')).json()['results']
+
+        assert result['location'] == 'Warsaw'
+        assert result['excerpt'] == 'Test Description'
+        assert result['image'] is None
+        assert (result['ratings_count'], result['comments_count']) == (0, 0)
+
+    def test_unknown_field(self, client, event):
+        """Test błędu dla nieznanego pola"""
+        response = client.get(reverse('api:event_list'), {'fields': 'id,description'})
+
+        assert response.status_code == 400
+        assert 'description' in response.json()['error']
+
+    def test_list_filters(self, client, event):
+        """Test filtrów i wyszukiwania jak na stronie listy"""
+        url = reverse('api:event_list')
+
+        assert len(client.get(url, {'location': 'Warsaw'}).json()['results']) == 1
+        assert client.get(url, {'location': 'Olsztyn'}).json()['results'] == []
+        assert client.get(reverse('api:archived_event_list')).json()['results'] == []
+
+    def test_cursor_pages(self, client, events):
+        """Test stronicowania kursorami"""
+        url = reverse('api:event_list')
+        first = client.get(url, {'fields': 'id', 'limit': 10}).json()
+        second = client.get(first['next']).json()
+        third = client.get(second['next']).json()
+
+        ids = [row['id'] for row in first['results'] + second['results'] + third['results']]
+        assert sorted(ids) == sorted(event.pk for event in events)
+        assert third['next'] is None
+        assert client.get(second['previous']).json()['results'] == first['results']
+
+    def test_invalid_cursor(self, client, events):
+        """Test błędu dla nieprawidłowego kursora"""
+        response = client.get(reverse('api:event_list'), {'after': 'zepsuty'})
+
+        assert response.status_code == 400
+
+    def test_my_events_unauthenticated(self, client):
+        """Test odmowy dostępu do własnych wydarzeń bez logowania"""
+        assert client.get(reverse('api:user_event_list')).status_code == 403
+
+    def test_etag_and_cache_headers(self, client, event):
+        """Test nagłówków ETag i Cache-Control"""
+        url = reverse('api:event_list')
+        response = client.get(url)
+
+        assert 'public' in response['Cache-Control']
+        assert 'max-age=60' in response['Cache-Control']
+        assert client.get(url, HTTP_IF_NONE_MATCH=response['ETag']).status_code == 304
+
+
+class TestOtherApis:
+    def test_photos_of_gallery(self, client):
+        """Test pustej listy zdjęć nieistniejącej galerii"""
+        response = client.get(reverse('api:photo_list', kwargs={'slug': 'brak'}))
+
+        assert response.json() == {'results': [], 'next': None, 'previous': None}
+
+    def test_polls_user_has_voted(self, client, user):
+        """Test pola głosowania dostępnego tylko dla zalogowanych"""
+        Poll.objects.create(question='Pytanie?', end_date=timezone.now() + timezone.timedelta(days=1), creator=user)
+        url = reverse('api:poll_list')
+
+        assert 'user_has_voted' not in client.get(url).json()['results'][0]
+        client.force_login(user)
+        result, = client.get(url).json()['results']
+        assert (result['question'], result['choice_count'], result['user_has_voted']) == ('Pytanie?', 0, False)
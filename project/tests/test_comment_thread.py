@@ -0,0 +1,87 @@
+# tests/test_comment_thread.py
+import pytest
+from django.contrib.contenttypes.models import ContentType
+from django.urls import reverse
+
+from comments_and_ratings.loaders import load_comment_page, load_comment_thread
+from comments_and_ratings.models import Comment
+from events.models import Event
+
+pytestmark = pytest.mark.django_db
+
+
+def comment(obj, user, content, parent=None, **kwargs):
+    return Comment.objects.create(
+        content_type=ContentType.objects.get_for_model(obj),
+        object_id=obj.pk,
+        user=user,
+        parent_comment=parent,
+        content=content,
+        **kwargs
+    )
+
+
+class TestCommentThread:
+    def test_tree_is_assembled_in_memory(self, event, user, django_assert_num_queries):
+        """Test zbudowania drzewa komentarzy jednym zapytaniem"""
+        first = comment(event, user, 'Pierwszy')
+        second = comment(event, user, 'Drugi')
+        reply = comment(event, user, 'Odpowiedź', parent=first)
+        comment(event, user, 'Ukryta', parent=first, is_active=False)
+        nested = comment(event, user, 'Zagnieżdżona', parent=reply)
+
+        with django_assert_num_queries(1):
+            thread = load_comment_thread(event)
+            assert thread == [second, first]
+            assert thread[1].get_replies() == [reply]
+            assert thread[1].get_replies()[0].get_replies() == [nested]
+            assert {c.user.username for c in thread} == {user.username}
+
+    def test_other_objects_are_skipped(self, event, user):
+        """Test pomijania komentarzy innych obiektów"""
+        comment(user, user, 'Nie dotyczy wydarzenia')
+
+        assert load_comment_thread(event) == []
+
+
+class TestCommentPages:
+    def test_cursor_walks_all_comments(self, event, user):
+        """Test przechodzenia kursorem przez kolejne strony komentarzy"""
+        created = [comment(event, user, f'Komentarz {i}') for i in range(5)]
+
+        first, cursor = load_comment_page(event, per_page=2)
+        second, cursor = load_comment_page(event, cursor, per_page=2)
+        third, cursor = load_comment_page(event, cursor, per_page=2)
+
+        assert first + second + third == created[::-1]
+        assert cursor is None
+
+    def test_load_more_endpoint(self, client, event, user):
+        """Test fragmentu HTML z kolejną stroną komentarzy"""
+        for i in range(3):
+            comment(event, user, f'Komentarz {i}')
+        _, cursor = load_comment_page(event, per_page=1)
+        url = reverse('comments_and_ratings:comment_page', kwargs={
+            'app_label': 'events', 'model_name': 'event', 'object_id': event.pk,
+        })
+
+        response = client.get(url, {'cursor': cursor})
+
+        assert response.status_code == 200
+        assert len(response.context['comments']) == 2
+        assert client.get(url, {'cursor': 'zepsuty'}).status_code == 400
+
+    def test_load_more_only_commentable_objects(self, client, event, user):
+        """Test błędu 404 dla obiektów spoza listy komentowanych i niezweryfikowanych"""
+        url = reverse('comments_and_ratings:comment_page', kwargs={
+            'app_label': 'auth', 'model_name': 'user', 'object_id': user.pk,
+        })
+        assert client.get(url).status_code == 404
+
+        Event.objects.filter(pk=event.pk).update(is_verified=False)
+        url = reverse('comments_and_ratings:comment_page', kwargs={
+            'app_label': 'events', 'model_name': 'event', 'object_id': event.pk,
+        })
+        assert client.get(url).status_code == 404
+        client.force_login(user)
+        assert client.get(url).status_code == 200
@@ -0,0 +1,85 @@
+# tests/test_conditional_get.py
+import pytest
+from django.contrib.contenttypes.models import ContentType
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from comments_and_ratings.models import Comment
+
+pytestmark = pytest.mark.django_db
+
+
+class TestConditionalGet:
+    def test_not_modified_on_matching_etag(self, client, event):
+        """Test odpowiedzi 304 dla niezmienionej strony szczegółów"""
+        url = event.get_absolute_url()
+        etag = client.get(url)['ETag']
+
+        response = client.get(url, HTTP_IF_NONE_MATCH=etag)
+
+        assert response.status_code == 304
+
+    def test_comment_changes_etag(self, client, user, event, django_capture_on_commit_callbacks):
+        """Test zmiany ETag po dodaniu komentarza"""
+        url = event.get_absolute_url()
+        etag = client.get(url)['ETag']
+
+        with django_capture_on_commit_callbacks(execute=True):
+            Comment.objects.create(
+                content_type=ContentType.objects.get_for_model(event),
+                object_id=event.pk,
+                user=user,
+                content='Nowy komentarz',
+            )
+
+        assert client.get(url, HTTP_IF_NONE_MATCH=etag).status_code == 200
+
+    def test_etag_depends_on_user(self, client, user, event):
+        """Test różnych ETag dla gościa i zalogowanego użytkownika"""
+        url = event.get_absolute_url()
+        anonymous_etag = client.get(url)['ETag']
+        client.force_login(user)
+
+        assert client.get(url, HTTP_IF_NONE_MATCH=anonymous_etag).status_code == 200
+
+    def test_list_not_modified(self, client, event):
+        """Test odpowiedzi 304 dla niezmienionej listy wydarzeń"""
+        client.force_login(event.creator)
+        url = reverse('events:list_event')
+        etag = client.get(url)['ETag']
+
+        assert client.get(url, HTTP_IF_NONE_MATCH=etag).status_code == 304
+
+    def test_list_stamp_without_list_query(self, client, user, event):
+        """Test odpowiedzi 304 dla listy bez zapytania o wydarzenia"""
+        client.force_login(user)
+        url = reverse('events:list_event')
+        etag = client.get(url)['ETag']
+
+        with CaptureQueriesContext(connection) as queries:
+            assert client.get(url, HTTP_IF_NONE_MATCH=etag).status_code == 304
+
+        assert not any('events_event' in query['sql'] for query in queries)
+
+    def test_list_changes_etag(self, client, event, django_capture_on_commit_callbacks):
+        """Test zmiany ETag listy po zmianie wydarzenia i parametrów"""
+        url = reverse('events:list_event')
+        etag = client.get(url)['ETag']
+
+        assert client.get(url, {'sort_by': 'created_at'}, HTTP_IF_NONE_MATCH=etag).status_code == 200
+        with django_capture_on_commit_callbacks(execute=True):
+            event.save()
+        assert client.get(url, HTTP_IF_NONE_MATCH=etag).status_code == 200
+
+    def test_pending_message_skips_not_modified(self, client, user, event):
+        """Test pełnej odpowiedzi, gdy czeka komunikat do wyświetlenia"""
+        client.force_login(user)
+        url = reverse('events:list_event')
+        etag = client.get(url)['ETag']
+        client.post(reverse('events:delete_event', kwargs={'pk': event.pk}))
+
+        response = client.get(url, HTTP_IF_NONE_MATCH=etag)
+
+        assert response.status_code == 200
+        assert len(response.context['messages'])
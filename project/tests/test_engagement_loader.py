@@ -0,0 +1,67 @@
+# tests/test_engagement_loader.py
+import pytest
+from django.contrib.contenttypes.models import ContentType
+from django.core.cache import cache
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from comments_and_ratings.loaders import engagement_for, with_engagement
+from comments_and_ratings.models import Comment, Rating
+from events.models import Event
+
+pytestmark = pytest.mark.django_db
+
+
+@pytest.fixture
+def rated_event(user, events):
+    """The newest of the events, first on the list, with a rating and a comment."""
+    event = events[-1]
+    content_type = ContentType.objects.get_for_model(Event)
+    Rating.objects.create(content_type=content_type, object_id=event.pk, user=user, rating=7)
+    Comment.objects.create(content_type=content_type, object_id=event.pk, user=user, content='Super')
+    return event
+
+
+class TestDetailEngagement:
+    def test_single_query_engagement(self, user, rated_event, django_assert_num_queries):
+        """Test pobrania oceny, rozkładu, oceny użytkownika i liczby komentarzy jednym zapytaniem"""
+        with django_assert_num_queries(1):
+            event = with_engagement(Event.objects.all(), user).get(pk=rated_event.pk)
+            engagement = engagement_for(event)
+
+        assert engagement['average_rating'] == 7.0
+        assert engagement['rating_histogram'][6] == 1
+        assert (engagement['user_rating'], engagement['comments_count']) == (7, 1)
+        assert event.average_rating == 7.0
+
+    def test_detail_view_context(self, client, user, rated_event):
+        """Test kontekstu widoku szczegółów budowanego z adnotacji"""
+        client.force_login(user)
+
+        response = client.get(rated_event.get_absolute_url())
+
+        assert response.context['user_rating'] == 7
+        assert response.context['ratings_count'] == 1
+        assert response.context['comments_count'] == 1
+
+
+class TestListEngagement:
+    def list_queries(self, client):
+        cache.clear()
+        with CaptureQueriesContext(connection) as queries:
+            response = client.get(reverse('events:list_event'))
+        return len(queries), response
+
+    def test_queries_independent_of_page_size(self, client, user, events, rated_event):
+        """Test stałej liczby zapytań listy niezależnie od liczby wydarzeń na stronie"""
+        client.force_login(user)
+        many, response = self.list_queries(client)
+        Event.objects.filter(pk__in=[event.pk for event in events[:-2]]).delete()
+        few, _ = self.list_queries(client)
+
+        assert many == few
+        listed = {event.pk: event for event in response.context['events']}
+        assert listed[rated_event.pk].engagement['ratings_count'] == 1
+        assert listed[rated_event.pk].engagement['comments_count'] == 1
+        assert 'Autor: ' in response.content.decode()
@@ -3,6 +3,7 @@ import pytest
 from django.urls import reverse
 from django.contrib.auth.models import User
 from events.models import Event
+from myApp.utils.excerpt import EXCERPT_LENGTH
 
 pytestmark = pytest.mark.django_db
 
@@ -81,6 +82,41 @@ class TestEventListView:
         assert 'sort_options' in context
         assert len(context['sort_options']) == 6
 
+    def test_card_fields_only(self, client, event):
+        """Test pobierania listy bez pełnego opisu wydarzeń"""
+        url = reverse('events:list_event', kwargs={'filter': 'all_non_archived'})
+        response = client.get(url)
+
+        listed = response.context['events'][0]
+        assert 'description' in listed.get_deferred_fields()
+        assert 'search_vector' in listed.get_deferred_fields()
+        assert 'Test Description' in response.content.decode()
+
+
+class TestEventExcerpt:
+    def test_excerpt_on_save(self, event):
+        """Test zapisywania skrótu opisu"""
+        assert event.excerpt == 'Test Description'
+
+    def test_long_description_shortened(self, event):
+        """Test skracania długiego opisu do jednej linii"""
+        event.description = 'słowo\n' * 100
+        event.save(update_fields=['description'])
+        event.refresh_from_db()
+
+        assert len(event.excerpt) == EXCERPT_LENGTH
+        assert event.excerpt.startswith('słowo słowo')
+        assert event.excerpt.endswith('…')
+
+    def test_other_fields_keep_excerpt(self, event):
+        """Test zapisu wybranych pól bez odczytu opisu"""
+        deferred = Event.objects.defer('description').get(pk=event.pk)
+        deferred.is_archived = True
+        deferred.save(update_fields=['is_archived'])
+
+        assert 'description' in deferred.get_deferred_fields()
+        assert Event.objects.get(pk=event.pk).excerpt == 'Test Description'
+
 
 class TestEventDetailView:
     def test_event_detail_display(self, client, event):
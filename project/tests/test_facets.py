@@ -0,0 +1,70 @@
+# tests/test_facets.py
+import pytest
+from django.urls import reverse
+from django.utils import timezone
+
+from announcements.models import Announcement
+from events.models import Event
+from events.tasks import archive_past_events
+from myApp.facets import FACETS
+from myApp.models import Facet
+
+pytestmark = pytest.mark.django_db
+
+
+class TestFacetCounts:
+    def test_counts_follow_saves_and_deletes(self, make_event):
+        """Test aktualizacji liczników przy zapisie, zmianie i usunięciu"""
+        first = make_event('Olsztyn')
+        second = make_event('Olsztyn')
+        make_event('Gdańsk', is_verified=False)
+
+        assert Facet.objects.counts(Event, archived=False) == [('Olsztyn', 2)]
+
+        second.location = 'Gdańsk'
+        second.save()
+        first.delete()
+
+        assert Facet.objects.counts(Event, archived=False) == [('Gdańsk', 1)]
+
+    def test_scopes(self, user, make_event, django_user_model):
+        """Test liczników aktywnych, zarchiwizowanych i własnych wydarzeń"""
+        other = django_user_model.objects.create_user(username='inny', password='haslo123')
+        make_event('Olsztyn')
+        make_event('Gdańsk', is_archived=True)
+        make_event('Olsztyn', creator=other)
+
+        assert Facet.objects.counts(Event, archived=False) == [('Olsztyn', 2)]
+        assert Facet.objects.counts(Event, archived=True) == [('Gdańsk', 1)]
+        assert Facet.objects.counts(Event, creator=user) == [('Gdańsk', 1), ('Olsztyn', 1)]
+
+    def test_bulk_archive_rebuilds(self, make_event):
+        """Test przeliczenia liczników po masowej archiwizacji"""
+        make_event('Olsztyn', event_date=timezone.now() - timezone.timedelta(days=1))
+
+        archive_past_events()
+
+        assert Facet.objects.counts(Event, archived=False) == []
+        assert Facet.objects.counts(Event, archived=True) == [('Olsztyn', 1)]
+
+    def test_rebuild_matches_signals(self, make_event):
+        """Test zgodności przebudowy z licznikami aktualizowanymi sygnałami"""
+        make_event('Olsztyn')
+        make_event('Olsztyn', is_archived=True)
+        Announcement.objects.create(title='Pokój', place='Sopot', rooms=1, price=100,
+                                    description='Opis', creator=None, is_verified=True)
+        expected = set(Facet.objects.values_list('content_type', 'value', 'is_archived', 'creator', 'count'))
+
+        for spec in FACETS.values():
+            spec.rebuild()
+
+        assert set(Facet.objects.values_list('content_type', 'value', 'is_archived', 'creator', 'count')) == expected
+
+    def test_dropdown_counts(self, client, make_event):
+        """Test listy miejsc z liczbą wydarzeń w filtrze"""
+        make_event('Olsztyn')
+
+        response = client.get(reverse('events:list_event'))
+
+        assert response.context['available_locations'] == [('Olsztyn', 1)]
+        assert 'Olsztyn (1)' in response.content.decode()
@@ -0,0 +1,76 @@
+# tests/test_fragment_cache.py
+import pytest
+from django.core.cache import cache
+from django.template import Context, Template
+from django.urls import reverse
+from django.utils import timezone
+
+from events.models import Event
+from myApp.utils import fragment_cache
+
+pytestmark = pytest.mark.django_db
+
+
+class Counter:
+    def __init__(self):
+        self.calls = 0
+
+    def __call__(self):
+        self.calls += 1
+        return f'<p>{self.calls}</p>'
+
+
+class TestFragmentCache:
+    def test_rendered_once_until_invalidated(self):
+        """Test ponownego renderowania dopiero po unieważnieniu"""
+        render = Counter()
+
+        fragment_cache.get_or_render('widget', ['events.event'], render)
+        fragment_cache.get_or_render('widget', ['events.event'], render)
+        assert render.calls == 1
+
+        fragment_cache.invalidate('events.event')
+        assert fragment_cache.get_or_render('widget', ['events.event'], render) == '<p>2</p>'
+
+    def test_locked_rebuild_serves_stale_copy(self):
+        """Test zwracania poprzedniej wersji, gdy inny proces odbudowuje fragment"""
+        render = Counter()
+        fragment_cache.get_or_render('widget', ['events.event'], render)
+        fragment_cache.invalidate('events.event')
+
+        cache.add('fragment:widget:lock', 1)
+        assert fragment_cache.get_or_render('widget', ['events.event'], render) == '<p>1</p>'
+        assert render.calls == 1
+
+    def test_event_save_invalidates_latest_events(self, user, django_capture_on_commit_callbacks):
+        """Test unieważnienia listy najnowszych wydarzeń po dodaniu wydarzenia"""
+        template = Template(
+            '{% load fragment_cache_tags events_and_announcements_tags %}'
+            '{% fragment "latest_events" "events.event" %}{% latest_events %}{% endfragment %}'
+        )
+        assert 'Nowe wydarzenie' not in template.render(Context())
+
+        with django_capture_on_commit_callbacks(execute=True):
+            Event.objects.create(
+                event_name='Nowe wydarzenie',
+                description='Opis',
+                location='Olsztyn',
+                event_date=timezone.now() + timezone.timedelta(days=1),
+                creator=user,
+                is_verified=True,
+            )
+
+        assert 'Nowe wydarzenie' in template.render(Context())
+
+    def test_pinned_pages_keep_other_list_page(self, client, user, make_event):
+        """Test linków stron przypiętych wydarzeń zachowujących stronę drugiej listy"""
+        for _ in range(6):
+            make_event(is_pinned=True)
+        client.force_login(user)
+        url = reverse('homepage')
+
+        client.get(url, {'event_page': 2, 'announcement_page': 3})
+        html = client.get(url, {'event_page': 2}).content.decode()
+
+        assert 'event_page=1' in html
+        assert 'announcement_page=3' not in html
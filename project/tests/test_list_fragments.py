@@ -0,0 +1,69 @@
+# tests/test_list_fragments.py
+import re
+
+import pytest
+from django.contrib.contenttypes.models import ContentType
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import resolve, reverse
+
+from events.models import Event
+
+pytestmark = pytest.mark.django_db
+
+
+def next_url(html):
+    match = re.search(r'data-url="([^"]+)"', html)
+    return match and match.group(1).replace('&amp;', '&')
+
+
+class TestListFragments:
+    def test_list_page_links_fragment(self, client, events):
+        """Test przycisku doładowania kart na stronie listy"""
+        html = client.get(reverse('events:list_event')).content.decode()
+
+        assert next_url(html).startswith(reverse('events:event_cards', kwargs={'filter': 'all_non_archived'}))
+
+    def test_fragments_cover_list(self, client, events):
+        """Test doładowania wszystkich kart kolejnymi fragmentami"""
+        page = client.get(reverse('events:list_event'))
+        shown = [event.pk for event in page.context['events']]
+        url = next_url(page.content.decode())
+
+        while url:
+            response = client.get(url)
+            assert '<html' not in response.content.decode()
+            shown += [event.pk for event in response.context['events']]
+            url = next_url(response.content.decode())
+
+        assert sorted(shown) == sorted(event.pk for event in events)
+
+    def test_fragment_single_query(self, client, events):
+        """Test fragmentu pobieranego jednym zapytaniem, bez kontekstu strony listy"""
+        url = reverse('events:event_cards', kwargs={'filter': 'all_non_archived'})
+        ContentType.objects.get_for_model(Event)
+        with CaptureQueriesContext(connection) as queries:
+            response = client.get(url)
+
+        assert response.status_code == 200
+        assert 'sort_options' not in response.context
+        assert len(queries) == 1
+        assert 'LIMIT 11' in queries[0]['sql']
+
+    def test_fragment_keeps_filters(self, client, events, event):
+        """Test zachowania filtrów listy we fragmencie"""
+        url = reverse('events:event_cards', kwargs={'filter': 'all_non_archived'})
+        response = client.get(url, {'location': 'Warsaw'})
+
+        assert [e.pk for e in response.context['events']] == [event.pk]
+
+    def test_unknown_filter(self, client):
+        """Test błędu 404 dla nieznanej listy"""
+        assert client.get(reverse('events:event_cards', kwargs={'filter': 'wszystko'})).status_code == 404
+
+    def test_gallery_slug_not_shadowed(self):
+        """Test, że adres fragmentów nie przesłania stron galerii o takiej nazwie"""
+        url = reverse('photo_gallery:gallery_update', kwargs={'slug': 'cards'})
+
+        assert resolve(url).url_name == 'gallery_update'
+        assert resolve(reverse('photo_gallery:gallery_cards', kwargs={'filter': 'my'})).url_name == 'gallery_cards'
@@ -0,0 +1,62 @@
+# tests/test_list_pagination.py
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+pytestmark = pytest.mark.django_db
+
+
+def walk(client, url):
+    """Follows the next-page cursors and returns the ids shown on every page."""
+    pages, params = [], {}
+    while True:
+        page = client.get(url, params).context['page_obj']
+        pages.append([event.pk for event in page])
+        if not page.has_next():
+            return pages
+        params = {'after': page.next_cursor}
+
+
+class TestKeysetPagination:
+    def test_pages_cover_list_once(self, client, events):
+        """Test przejścia przez wszystkie strony bez powtórzeń i pominięć"""
+        pages = walk(client, reverse('events:list_event'))
+
+        assert [len(page) for page in pages] == [10, 10, 5]
+        assert sorted(sum(pages, [])) == sorted(event.pk for event in events)
+
+    def test_previous_page(self, client, events):
+        """Test powrotu do poprzedniej strony"""
+        url = reverse('events:list_event')
+        first = client.get(url).context['page_obj']
+        second = client.get(url, {'after': first.next_cursor}).context['page_obj']
+
+        previous = client.get(url, {'before': second.previous_cursor}).context['page_obj']
+
+        assert list(previous) == list(first)
+        assert not client.get(url).context['page_obj'].has_previous()
+
+    def test_single_limited_query(self, client, events):
+        """Test pobierania strony jednym zapytaniem bez OFFSET"""
+        page = client.get(reverse('events:list_event')).context['page_obj']
+
+        with CaptureQueriesContext(connection) as queries:
+            client.get(reverse('events:list_event'), {'after': page.next_cursor})
+
+        sql = [query['sql'] for query in queries.captured_queries]
+        assert not any('OFFSET' in query for query in sql)
+        assert len([query for query in sql if query.endswith('LIMIT 11')]) == 1
+
+    def test_invalid_cursor(self, client, events):
+        """Test odpowiedzi 404 dla błędnego kursora"""
+        response = client.get(reverse('events:list_event'), {'after': 'zepsuty'})
+
+        assert response.status_code == 404
+
+    def test_page_number_fallback(self, client, events):
+        """Test obsługi numeru strony w starych odnośnikach"""
+        page = client.get(reverse('events:list_event'), {'page': 2}).context['page_obj']
+
+        assert page.number == 2
+        assert len(page) == 10
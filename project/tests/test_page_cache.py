@@ -0,0 +1,98 @@
+# tests/test_page_cache.py
+import pytest
+from django.contrib.contenttypes.models import ContentType
+from django.test import RequestFactory
+from django.urls import reverse
+from django.utils import timezone
+
+from announcements.models import Announcement
+from comments_and_ratings.models import Comment
+from myApp.utils import page_cache
+from polls.models import Choice, Poll, Vote
+
+pytestmark = pytest.mark.django_db
+
+
+class TestPageCache:
+    def test_anonymous_page_served_from_cache(self, client, event, django_assert_num_queries):
+        """Test serwowania strony z pamięci podręcznej bez zapytań do bazy"""
+        url = event.get_absolute_url()
+        first = client.get(url)
+
+        with django_assert_num_queries(0):
+            second = client.get(url)
+
+        assert second.content == first.content
+        assert page_cache.CSRF_PLACEHOLDER.encode() not in second.content
+
+    def test_comment_purges_only_its_object(self, client, user, event, django_capture_on_commit_callbacks):
+        """Test usunięcia z pamięci tylko stron pokazujących komentowany obiekt"""
+        url = event.get_absolute_url()
+        client.get(url)
+
+        with django_capture_on_commit_callbacks(execute=True):
+            Comment.objects.create(
+                content_type=ContentType.objects.get_for_model(event),
+                object_id=event.pk,
+                user=user,
+                content='Nowy komentarz',
+            )
+
+        assert 'Nowy komentarz' in client.get(url).content.decode()
+
+    def test_sidebar_change_purges_pages(self, client, user, event, django_capture_on_commit_callbacks):
+        """Test usunięcia z pamięci stron po zmianie treści panelu bocznego"""
+        url = event.get_absolute_url()
+        client.get(url)
+
+        with django_capture_on_commit_callbacks(execute=True):
+            Announcement.objects.create(title='Nowe ogłoszenie', place='Olsztyn', rooms=2, price=1500,
+                                        description='Opis', creator=user, is_verified=True)
+
+        assert 'Nowe ogłoszenie' in client.get(url).content.decode()
+
+    def test_vote_purges_home_page(self, client, user, django_user_model, django_capture_on_commit_callbacks):
+        """Test usunięcia z pamięci strony głównej po oddaniu głosu w ankiecie"""
+        with django_capture_on_commit_callbacks(execute=True):
+            poll = Poll.objects.create(question='Gdzie na weekend?',
+                                       end_date=timezone.now() + timezone.timedelta(days=7), creator=user)
+            choice = Choice.objects.create(poll=poll, text='Morze')
+        url = reverse('homepage')
+        assert 'Łączne głosy: 0' in client.get(url).content.decode()
+
+        voter = django_user_model.objects.create_user(username='glosujacy', password='haslo123')
+        with django_capture_on_commit_callbacks(execute=True):
+            Vote.objects.create(poll=poll, choice=choice, user=voter)
+
+        assert 'Łączne głosy: 1' in client.get(url).content.decode()
+
+    def test_vote_keeps_other_pages(self, client, user, event, django_user_model,
+                                    django_capture_on_commit_callbacks, django_assert_num_queries):
+        """Test, że głos w ankiecie nie usuwa z pamięci stron poza stroną główną"""
+        with django_capture_on_commit_callbacks(execute=True):
+            poll = Poll.objects.create(question='Gdzie na weekend?',
+                                       end_date=timezone.now() + timezone.timedelta(days=7), creator=user)
+            choice = Choice.objects.create(poll=poll, text='Morze')
+        url = event.get_absolute_url()
+        client.get(url)
+
+        voter = django_user_model.objects.create_user(username='glosujacy', password='haslo123')
+        with django_capture_on_commit_callbacks(execute=True):
+            Vote.objects.create(poll=poll, choice=choice, user=voter)
+
+        with django_assert_num_queries(0):
+            client.get(url)
+
+    def test_logged_in_users_are_not_cached(self, client, user, event):
+        """Test pomijania pamięci podręcznej dla zalogowanych użytkowników"""
+        client.get(event.get_absolute_url())
+        client.force_login(user)
+
+        assert 'Jesteś zalogowany' in client.get(event.get_absolute_url()).content.decode()
+
+    def test_query_string_is_normalized(self):
+        """Test normalizacji parametrów adresu w kluczu strony"""
+        factory = RequestFactory()
+
+        assert (page_cache.page_key(factory.get('/events/', {'b': '2', 'a': '1', 'utm_source': 'x', 'c': ''}))
+                == page_cache.page_key(factory.get('/events/?a=1&b=2')))
@@ -0,0 +1,88 @@
+# tests/test_paginator.py
+import json
+
+import pytest
+from django.core.signing import BadSignature
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+from events.models import Event
+from myApp import tasks
+from myApp.utils.paginator import EstimatedCountPaginator
+
+pytestmark = pytest.mark.django_db
+
+
+class SmallLimitPaginator(EstimatedCountPaginator):
+    exact_count_limit = 20
+
+
+@pytest.fixture
+def analyzed_events(events):
+    with connection.cursor() as cursor:
+        cursor.execute(f'ANALYZE {connection.ops.quote_name(Event._meta.db_table)}')
+    return events
+
+
+@pytest.fixture
+def queued(monkeypatch):
+    calls = []
+    monkeypatch.setattr(tasks.refresh_count, 'delay', lambda *args: calls.append(args))
+    return calls
+
+
+class TestEstimatedCountPaginator:
+    def test_small_querysets_counted_exactly(self, analyzed_events, queued):
+        """Test dokładnego zliczania małych zbiorów"""
+        paginator = SmallLimitPaginator(Event.objects.filter(pk__in=[e.pk for e in analyzed_events[:5]]).order_by('pk'), 2)
+
+        assert not paginator.is_estimated
+        assert paginator.count == 5
+        assert not queued
+
+    def test_big_querysets_use_estimate(self, analyzed_events, queued):
+        """Test użycia szacunku planisty bez zapytania COUNT"""
+        paginator = SmallLimitPaginator(Event.objects.order_by('pk'), 10)
+
+        with CaptureQueriesContext(connection) as queries:
+            count = paginator.count
+
+        assert paginator.is_estimated
+        assert count > 20
+        assert not any('COUNT(' in query['sql'] for query in queries.captured_queries)
+        assert len(queued) == 1
+
+    def test_cached_exact_count(self, analyzed_events, queued):
+        """Test użycia dokładnej liczby zapisanej przez zadanie w tle"""
+        SmallLimitPaginator(Event.objects.order_by('pk'), 10).count
+        tasks.refresh_count(*queued[0])
+
+        paginator = SmallLimitPaginator(Event.objects.order_by('pk'), 10)
+
+        assert paginator.count == 25
+        assert len(queued) == 1
+
+    def test_pages_past_estimate(self, analyzed_events, queued):
+        """Test obsługi stron spoza szacowanej liczby"""
+        paginator = SmallLimitPaginator(Event.objects.order_by('pk'), 10)
+
+        assert list(paginator.page(3)) == analyzed_events[20:]
+        assert list(paginator.page(100)) == []
+
+    def test_task_message_without_sql(self, analyzed_events, queued):
+        """Test wiadomości zadania bez treści SQL, zgodnej z serializatorem JSON"""
+        SmallLimitPaginator(Event.objects.filter(event_date__lte=timezone.now()).order_by('pk'), 10).count
+        key, model_label, db, query = queued[0]
+
+        assert json.loads(json.dumps(queued[0])) == list(queued[0])
+        assert model_label == 'events.Event'
+        assert 'SELECT' not in query
+
+    def test_task_rejects_unsigned_query(self, analyzed_events, queued):
+        """Test odrzucenia zapytania bez poprawnego podpisu"""
+        SmallLimitPaginator(Event.objects.order_by('pk'), 10).count
+        key, model_label, db, query = queued[0]
+
+        with pytest.raises(BadSignature):
+            tasks.refresh_count(key, model_label, db, query + 'x')
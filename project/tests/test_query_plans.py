@@ -0,0 +1,191 @@
+# tests/test_query_plans.py
+import pytest
+from django.contrib.auth import get_user_model
+from django.contrib.contenttypes.models import ContentType
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+
+from announcements.models import Announcement
+from comments_and_ratings.loaders import comment_list_context, load_comment_page, with_engagement
+from comments_and_ratings.models import Comment, Rating, RatingSummary
+from events.models import Event
+from myApp.utils.autocomplete import complete
+
+pytestmark = pytest.mark.django_db
+
+OBJECTS = 2000
+USERS = 10
+
+GENERIC_TABLES = [Comment._meta.db_table, Rating._meta.db_table, RatingSummary._meta.db_table]
+
+
+@pytest.fixture
+def seeded(event):
+    """Seeds ratings and comments of many objects, so the planner prefers indexes."""
+    User = get_user_model()
+    users = User.objects.bulk_create(
+        User(username=f'seed{i}', email=f'seed{i}@example.com') for i in range(USERS)
+    )
+    content_type = ContentType.objects.get_for_model(Event)
+    object_ids = [event.pk] + list(range(event.pk + 1, event.pk + OBJECTS))
+
+    Rating.objects.bulk_create(
+        Rating(content_type=content_type, object_id=object_id, user=user, rating=i % 10 + 1)
+        for object_id in object_ids
+        for i, user in enumerate(users)
+    )
+    comments = Comment.objects.bulk_create(
+        Comment(content_type=content_type, object_id=object_id, user=user, content='Komentarz')
+        for object_id in object_ids
+        for user in users
+    )
+    Comment.objects.bulk_create(
+        Comment(content_type=content_type, object_id=parent.object_id, user=parent.user,
+                parent_comment=parent, content='Odpowiedź')
+        for parent in comments[::3]
+    )
+    RatingSummary.objects.rebuild()
+
+    with connection.cursor() as cursor:
+        for table in GENERIC_TABLES:
+            cursor.execute(f'ANALYZE {connection.ops.quote_name(table)}')
+    return event
+
+
+def explain(func):
+    """Runs func and returns the EXPLAIN output of every SELECT it issued."""
+    with CaptureQueriesContext(connection) as queries:
+        func()
+
+    plans = []
+    with connection.cursor() as cursor:
+        for query in queries.captured_queries:
+            sql = query['sql'].lstrip()
+            if not sql.upper().startswith(('SELECT', 'WITH')):
+                continue
+            cursor.execute('EXPLAIN ' + sql)
+            plans.append('\n'.join(row[0] for row in cursor.fetchall()))
+    assert plans, "Nie wykonano żadnego zapytania"
+    return plans
+
+
+def assert_no_seq_scans(plans):
+    for plan in plans:
+        for table in GENERIC_TABLES:
+            assert f'Seq Scan on {table}' not in plan, plan
+
+
+class TestQueryPlans:
+    def test_engagement_counters(self, seeded, user):
+        """Test użycia indeksów przez liczniki ocen i komentarzy list"""
+        assert_no_seq_scans(explain(lambda: list(with_engagement(Event.objects.filter(pk=seeded.pk), user))))
+
+    def test_comment_thread_pages(self, seeded):
+        """Test użycia indeksów przez stronicowanie wątku komentarzy"""
+        _, cursor = load_comment_page(seeded, per_page=3)
+
+        plans = explain(lambda: load_comment_page(seeded, cursor, per_page=3))
+        assert_no_seq_scans(plans)
+        assert 'comment_top_level_page' in plans[0]
+
+    def test_comment_list_context(self, seeded):
+        """Test użycia indeksów przez kontekst listy komentarzy"""
+        assert_no_seq_scans(explain(lambda: comment_list_context(seeded)))
+
+    def test_rating_summary_and_replies(self, seeded):
+        """Test użycia indeksów przez podsumowanie ocen i odpowiedzi"""
+        comment = Comment.objects.filter(object_id=seeded.pk, parent_comment__isnull=True).first()
+
+        def load():
+            RatingSummary.objects.for_object(seeded)
+            list(comment.get_replies())
+
+        assert_no_seq_scans(explain(load))
+
+    def test_autocomplete_prefix(self, user):
+        """Test użycia indeksów prefiksowych przez podpowiedzi wyszukiwania"""
+        Event.objects.bulk_create(
+            Event(event_name=f'Wydarzenie {i}', description='Opis', location=f'Miasto {i}',
+                  event_date=timezone.now(), creator=user, is_verified=True)
+            for i in range(OBJECTS)
+        )
+        with connection.cursor() as cursor:
+            cursor.execute(f'ANALYZE {connection.ops.quote_name(Event._meta.db_table)}')
+
+        plans = explain(lambda: complete(Event.objects.all(), ['event_name', 'location'], 'wydarzenie 12'))
+
+        assert 'event_name_prefix' in plans[0]
+        assert 'event_location_prefix' in plans[1]
+
+
+@pytest.fixture
+def listed(user):
+    """Seeds verified, unverified and archived events and announcements."""
+    now = timezone.now()
+    Event.objects.bulk_create(
+        Event(event_name=f'Wydarzenie {i}', description='Opis', location='Olsztyn',
+              event_date=now + timezone.timedelta(hours=i), creator=user,
+              is_verified=i % 5 != 0, is_archived=i % 3 == 0)
+        for i in range(OBJECTS)
+    )
+    Announcement.objects.bulk_create(
+        Announcement(title=f'Ogłoszenie {i}', place='Sopot', rooms=i % 7 + 1, price=100 + i % 50,
+                     description='Opis', creator=user, is_verified=i % 5 != 0,
+                     archive_date=now if i % 3 == 0 else None)
+        for i in range(OBJECTS)
+    )
+    with connection.cursor() as cursor:
+        for model in [Event, Announcement]:
+            cursor.execute(f'ANALYZE {connection.ops.quote_name(model._meta.db_table)}')
+
+
+def page_plans(client, url, params):
+    """Returns the plans of the page query of a list, on its first and second page."""
+    plans = []
+    for _ in range(2):
+        with CaptureQueriesContext(connection) as queries:
+            response = client.get(url, params)
+        sql = [query['sql'] for query in queries.captured_queries if query['sql'].endswith('LIMIT 11')]
+        assert len(sql) == 1
+        with connection.cursor() as cursor:
+            cursor.execute('EXPLAIN ' + sql[0])
+            plans.append('\n'.join(row[0] for row in cursor.fetchall()))
+        params = {**params, 'after': response.context['page_obj'].next_cursor}
+    return plans
+
+
+class TestListIndexes:
+    @pytest.mark.parametrize('url_name, scope', [
+        ('events:list_event', 'active'),
+        ('events:list_archived_event', 'archived'),
+    ])
+    @pytest.mark.parametrize('sort_by, column', [
+        (None, 'event_date'),
+        ('event_date', 'event_date'),
+        ('-created_at', 'created_at'),
+        ('updated_at', 'updated_at'),
+    ])
+    def test_event_lists(self, client, listed, url_name, scope, sort_by, column):
+        """Test użycia indeksów częściowych przez listy wydarzeń"""
+        params = {'sort_by': sort_by} if sort_by else {}
+
+        for plan in page_plans(client, reverse(url_name), params):
+            assert f'event_{scope}_{column}' in plan, plan
+
+    @pytest.mark.parametrize('url_name, scope', [
+        ('announcements:list_announcement', 'active'),
+        ('announcements:list_archived_announcement', 'archived'),
+    ])
+    @pytest.mark.parametrize('sort_by, column', [
+        (None, 'date'),
+        ('price', 'price'),
+        ('-rooms', 'rooms'),
+    ])
+    def test_announcement_lists(self, client, listed, url_name, scope, sort_by, column):
+        """Test użycia indeksów częściowych przez listy ogłoszeń"""
+        params = {'sort_by': sort_by} if sort_by else {}
+
+        for plan in page_plans(client, reverse(url_name), params):
+            assert f'announcement_{scope}_{column}' in plan, plan
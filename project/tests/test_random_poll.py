@@ -0,0 +1,92 @@
+# tests/test_random_poll.py
+import pytest
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.utils import timezone
+
+from myApp.templatetags.polls_tags import random_poll
+from polls.models import Choice, Poll, Vote
+from polls.pools import poll_pool
+
+pytestmark = pytest.mark.django_db
+
+
+@pytest.fixture
+def poll(user, django_capture_on_commit_callbacks):
+    with django_capture_on_commit_callbacks(execute=True):
+        poll = Poll.objects.create(
+            question='Gdzie na weekend?',
+            end_date=timezone.now() + timezone.timedelta(days=7),
+            creator=user,
+        )
+        Choice.objects.create(poll=poll, text='Morze')
+        Choice.objects.create(poll=poll, text='Góry')
+    return poll
+
+
+class TestRandomPoll:
+    def test_results_snapshot(self, poll, django_capture_on_commit_callbacks):
+        """Test wyników ankiety odświeżanych po oddaniu głosu"""
+        voter = get_user_model().objects.create_user(
+            username='voter', email='voter@example.com', password='pass'
+        )
+        with django_capture_on_commit_callbacks(execute=True):
+            Vote.objects.create(poll=poll, choice=poll.choices.first(), user=voter)
+
+        context = random_poll()
+
+        assert context['poll']['pk'] == poll.pk
+        assert context['total_votes'] == 1
+        assert [choice['percentage'] for choice in context['choices']] == [100.0, 0.0]
+
+    def test_edited_question_refreshes_snapshot(self, poll, django_capture_on_commit_callbacks):
+        """Test odświeżenia wyników po zmianie pytania ankiety"""
+        random_poll()
+        with django_capture_on_commit_callbacks(execute=True):
+            poll.question = 'Gdzie na urlop?'
+            poll.save()
+
+        assert random_poll()['poll']['question'] == 'Gdzie na urlop?'
+
+    def test_archived_poll_leaves_pool(self, poll, django_capture_on_commit_callbacks):
+        """Test usunięcia zarchiwizowanej ankiety z puli"""
+        with django_capture_on_commit_callbacks(execute=True):
+            poll.archive_poll()
+
+        assert random_poll()['poll'] is None
+
+    def test_unarchived_poll_returns_to_pool(self, poll, django_capture_on_commit_callbacks):
+        """Test powrotu przywróconej ankiety do puli"""
+        poll_pool.rotate()
+        with django_capture_on_commit_callbacks(execute=True):
+            poll.archive_poll()
+            poll.archive_date = None
+            poll.save()
+
+        assert random_poll()['poll']['pk'] == poll.pk
+
+    def test_saving_archived_poll_keeps_total(self, poll, django_capture_on_commit_callbacks):
+        """Test, że zapis zarchiwizowanej ankiety nie zmienia liczności puli"""
+        poll_pool.rotate()
+        with django_capture_on_commit_callbacks(execute=True):
+            poll.archive_poll()
+        total = cache.get(poll_pool.cache_key)['total']
+
+        with django_capture_on_commit_callbacks(execute=True):
+            poll.question = 'Gdzie na urlop?'
+            poll.save()
+            poll.archive_poll()
+
+        assert cache.get(poll_pool.cache_key)['total'] == total
+
+    def test_widget_served_from_cache(self, poll, django_assert_num_queries):
+        """Test, że rozgrzany widżet nie wykonuje zapytań"""
+        random_poll()
+
+        with django_assert_num_queries(0):
+            random_poll()
+
+    def test_no_polls(self):
+        """Test widżetu bez dostępnych ankiet"""
+        poll_pool.rotate()
+        assert random_poll() == {'poll': None, 'choices': None, 'total_votes': 0}
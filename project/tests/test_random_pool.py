@@ -0,0 +1,71 @@
+# tests/test_random_pool.py
+import pytest
+from django.core.cache import cache
+
+from events.models import Event
+from myApp.utils.random_pool import RandomPool
+
+pytestmark = pytest.mark.django_db
+
+
+class TestRandomPool:
+    def test_rotate_limits_sample_size(self, events):
+        """Test losowania próbki o ograniczonym rozmiarze"""
+        pool = RandomPool('events', Event.objects.all(), size=3)
+        state = pool.rotate()
+
+        assert len(state['pks']) == 3
+        assert state['total'] == 25
+        assert set(state['pks']) <= {event.pk for event in events}
+
+    def test_pick_skips_deleted_rows(self, events):
+        """Test pomijania usuniętych wierszy podczas losowania"""
+        pool = RandomPool('events', Event.objects.all())
+        pool.rotate()
+        Event.objects.exclude(pk=events[0].pk).delete()
+
+        assert pool.pick() == events[0]
+
+    def test_pick_on_empty_table(self):
+        """Test losowania z pustej tabeli"""
+        assert RandomPool('events', Event.objects.all()).pick() is None
+
+    def test_add_and_remove(self, events):
+        """Test dodawania i usuwania kluczy z puli"""
+        pool = RandomPool('events', Event.objects.all(), size=30)
+        pool.rotate()
+
+        pool.add(999)
+        pool.remove(events[0].pk)
+
+        state = cache.get(pool.cache_key)
+        assert 999 in state['pks']
+        assert events[0].pk not in state['pks']
+        assert state['total'] == 25
+
+    def test_pick_does_not_scan_table(self, events, django_assert_num_queries):
+        """Test, że losowanie z gotowej puli to jedno zapytanie po kluczu"""
+        pool = RandomPool('events', Event.objects.all())
+        pool.rotate()
+
+        with django_assert_num_queries(1):
+            pool.pick()
+
+    def test_single_rotation_on_miss(self, events, django_assert_num_queries):
+        """Test losowania próbki tylko przez jedno żądanie przy braku w pamięci"""
+        pool = RandomPool('events', Event.objects.all())
+        cache.add(f'{pool.cache_key}:rotating', 1)
+
+        with django_assert_num_queries(0):
+            assert pool.pick_pk() is None
+
+    def test_update_without_lock_drops_sample(self, events, monkeypatch):
+        """Test porzucenia próbki, gdy nie można jej zablokować do zmiany"""
+        monkeypatch.setattr('myApp.utils.random_pool.LOCK_WAIT', 0)
+        pool = RandomPool('events', Event.objects.all())
+        pool.rotate()
+        cache.add(pool.lock_key, 1)
+
+        pool.add(999)
+
+        assert cache.get(pool.cache_key) is None
@@ -0,0 +1,121 @@
+# tests/test_rating_summary.py
+import pytest
+from django.contrib.auth import get_user_model
+from django.contrib.contenttypes.models import ContentType
+
+from comments_and_ratings.models import Rating, RatingSummary
+from myApp.templatetags.events_and_announcements_tags import top_rated_events
+
+pytestmark = pytest.mark.django_db
+
+
+def rate(obj, user, value):
+    return Rating.objects.create(
+        content_type=ContentType.objects.get_for_model(obj),
+        object_id=obj.pk,
+        user=user,
+        rating=value
+    )
+
+
+@pytest.fixture
+def voters(db):
+    User = get_user_model()
+    return [
+        User.objects.create_user(username=f'voter{i}', email=f'voter{i}@example.com', password='pass')
+        for i in range(4)
+    ]
+
+
+class TestRatingSummary:
+    def test_summary_follows_writes_and_deletes(self, event, voters):
+        """Test aktualizacji podsumowania przy dodaniu, edycji i usunięciu oceny"""
+        first = rate(event, voters[0], 8)
+        rate(event, voters[1], 4)
+
+        summary = RatingSummary.objects.get(object_id=event.pk)
+        assert (summary.rating_count, summary.rating_sum) == (2, 12)
+
+        first.rating = 10
+        first.save()
+        summary.refresh_from_db()
+        assert summary.rating_sum == 14
+
+        Rating.objects.filter(object_id=event.pk).delete()
+        assert not RatingSummary.objects.filter(object_id=event.pk).exists()
+
+    def test_histogram_and_stars(self, event, voters):
+        """Test rozkładu ocen i gwiazdek liczonych z podsumowania"""
+        rate(event, voters[0], 7)
+        rate(event, voters[1], 8)
+
+        summary = RatingSummary.objects.for_object(event)
+        assert summary.histogram[6:8] == [1, 1]
+        assert summary.average == 7.5
+        assert summary.stars_data == {'full': 7, 'half': True, 'empty': 2}
+
+    def test_rebuild_matches_incremental_state(self, event, voters):
+        """Test, że przebudowa odtwarza podsumowania utrzymywane przyrostowo"""
+        for voter, value in zip(voters, [3, 3, 9, 10]):
+            rate(event, voter, value)
+        expected = RatingSummary.objects.get(object_id=event.pk)
+
+        RatingSummary.objects.all().update(rating_count=0, rating_sum=0)
+        assert RatingSummary.objects.rebuild() == 1
+
+        rebuilt = RatingSummary.objects.get(object_id=event.pk)
+        assert (rebuilt.rating_count, rebuilt.rating_sum, rebuilt.histogram) == \
+            (expected.rating_count, expected.rating_sum, expected.histogram)
+
+    def test_unrated_object_has_empty_summary(self, event):
+        """Test pustego podsumowania dla obiektu bez ocen"""
+        summary = RatingSummary.objects.for_object(event)
+        assert summary.pk is None
+        assert event.average_rating is None
+
+    def test_bayesian_score_prefers_many_ratings(self):
+        """Test, że jedna dziesiątka nie wyprzedza wielu dziewiątek"""
+        assert RatingSummary.bayesian_score(1, 10) < RatingSummary.bayesian_score(4, 36)
+
+
+class TestRatingUpsert:
+    def test_upsert_reports_created_and_previous(self, event, voters):
+        """Test zapisu oceny jednym zapytaniem z informacją o poprzedniej wartości"""
+        content_type = ContentType.objects.get_for_model(event)
+
+        rating, created, previous = Rating.objects.upsert(content_type, event.pk, voters[0], 6)
+        assert (created, previous) == (True, None)
+
+        again, created, previous = Rating.objects.upsert(content_type, event.pk, voters[0], 9)
+        assert (again.pk, created, previous) == (rating.pk, False, 6)
+        assert Rating.objects.get(pk=rating.pk).rating == 9
+
+        summary = RatingSummary.objects.get(object_id=event.pk)
+        assert (summary.rating_count, summary.rating_sum) == (1, 9)
+        assert summary.histogram[5] == 0 and summary.histogram[8] == 1
+
+
+class TestTopRatedEvents:
+    def test_ranking_and_verification(self, make_event, voters):
+        """Test kolejności i pomijania niezweryfikowanych wydarzeń"""
+        single = make_event(event_name='Jedna ocena')
+        popular = make_event(event_name='Wiele ocen')
+        hidden = make_event(event_name='Ukryte', is_verified=False)
+
+        rate(single, voters[0], 10)
+        for voter in voters:
+            rate(popular, voter, 9)
+            rate(hidden, voter, 10)
+
+        items = top_rated_events()['events']
+
+        assert [item['event'] for item in items] == [popular, single]
+        assert items[0]['rating'] == 9.0
+
+    def test_query_count_does_not_grow(self, make_event, voters, django_assert_max_num_queries):
+        """Test stałej liczby zapytań niezależnie od liczby wydarzeń"""
+        for i in range(10):
+            rate(make_event(event_name=f'Wydarzenie {i}'), voters[0], i % 10 + 1)
+
+        with django_assert_max_num_queries(2):
+            top_rated_events()
@@ -0,0 +1,126 @@
+# tests/test_search.py
+import pytest
+from django.urls import resolve, reverse
+from django.utils import timezone
+
+from events.models import Event
+from polls.models import Poll
+from myApp.utils.search import full_text_search, suggest
+
+pytestmark = pytest.mark.django_db
+
+
+class TestFullTextSearch:
+    def test_prefix_match_and_rank(self, make_event):
+        """Test wyszukiwania po początku słowa i kolejności wg trafności"""
+        in_description = make_event(event_name='Spotkanie', description='Wieczór z koncertem jazzowym')
+        in_name = make_event(event_name='Koncert jazzowy')
+        make_event(event_name='Wystawa')
+
+        results = full_text_search(Event.objects.all(), 'konc jazz').order_by('-search_rank')
+
+        assert list(results) == [in_name, in_description]
+
+    def test_vector_follows_updates(self, make_event):
+        """Test aktualizacji wektora wyszukiwania przez wyzwalacz"""
+        event = make_event(event_name='Wystawa')
+        event.event_name = 'Festiwal'
+        event.save()
+
+        assert list(full_text_search(Event.objects.all(), 'festiwal')) == [event]
+
+    def test_list_view_keyword(self, client, make_event):
+        """Test parametru keyword listy wydarzeń"""
+        found = make_event(event_name='Koncert')
+        make_event(event_name='Wystawa')
+
+        response = client.get(reverse('events:list_event'), {'keyword': 'koncert'})
+
+        assert list(response.context['events']) == [found]
+
+
+class TestFuzzySearch:
+    def test_misspelled_location_matches(self, make_event):
+        """Test dopasowania miejsca wpisanego z literówką"""
+        event = make_event(event_name='Koncert', location='Olsztyn')
+
+        results = full_text_search(Event.objects.all(), 'Olsztin', fuzzy_fields=['event_name', 'location'])
+
+        assert list(results) == [event]
+
+    def test_did_you_mean(self, make_event):
+        """Test podpowiedzi dla błędnie wpisanej nazwy"""
+        make_event(event_name='Festiwal filmowy')
+
+        assert suggest(Event.objects.all(), 'festiwak', ['event_name', 'location']) == 'Festiwal filmowy'
+        assert suggest(Event.objects.all(), 'festiwal filmowy', ['event_name']) is None
+
+
+class TestGlobalSearch:
+    # Every source is searched in its own thread and connection, which
+    # does not see rows of an open test transaction.
+    @pytest.mark.django_db(transaction=True)
+    def test_streams_results_from_all_sources(self, client, user, make_event):
+        """Test strumieniowania wyników z wielu typów treści"""
+        event = make_event(event_name='Festiwal muzyki')
+        poll = Poll.objects.create(
+            question='Który festiwal był najlepszy?',
+            end_date=timezone.now() + timezone.timedelta(days=1),
+            creator=user,
+        )
+        make_event(event_name='Wystawa')
+
+        response = client.get(reverse('search'), {'q': 'festiwal'})
+        content = b''.join(response.streaming_content).decode()
+
+        assert response.streaming
+        assert event.get_absolute_url() in content
+        assert poll.get_absolute_url() in content
+        assert 'Wystawa' not in content
+
+    def test_empty_query(self, client):
+        """Test strony wyszukiwania bez frazy"""
+        response = client.get(reverse('search'))
+        content = b''.join(response.streaming_content).decode()
+
+        assert 'search-results' in content
+        assert 'Brak wyników' not in content
+
+
+class TestAutocomplete:
+    def test_suggestions(self, client, make_event):
+        """Test podpowiedzi nazw i miejsc zaczynających się od wpisanego tekstu"""
+        make_event(event_name='Koncert jazzowy', location='Kołobrzeg')
+        make_event(event_name='koncert rockowy')
+        make_event(event_name='Wystawa')
+
+        response = client.get(reverse('events:autocomplete_event'), {'q': 'ko'})
+
+        assert response.json() == ['Koncert jazzowy', 'koncert rockowy', 'Kołobrzeg']
+
+    def test_short_prefix(self, client, make_event):
+        """Test braku podpowiedzi dla zbyt krótkiego tekstu"""
+        make_event(event_name='Koncert')
+
+        assert client.get(reverse('events:autocomplete_event'), {'q': 'k'}).json() == []
+
+    def test_cached_until_save(self, client, django_assert_num_queries, django_capture_on_commit_callbacks, make_event):
+        """Test buforowania podpowiedzi i ich unieważnienia po zapisie"""
+        event = make_event(event_name='Koncert')
+        url = reverse('events:autocomplete_event')
+        client.get(url, {'q': 'kon'})
+
+        with django_assert_num_queries(0):
+            assert client.get(url, {'q': 'Kon '}).json() == ['Koncert']
+
+        with django_capture_on_commit_callbacks(execute=True):
+            event.event_name = 'Konkurs'
+            event.save()
+
+        assert client.get(url, {'q': 'kon'}).json() == ['Konkurs']
+
+    def test_gallery_slug_not_shadowed(self):
+        """Test, że adres podpowiedzi nie przesłania galerii o takiej nazwie"""
+        url = reverse('photo_gallery:gallery_detail', kwargs={'slug': 'autocomplete'})
+
+        assert resolve(url).url_name == 'gallery_detail'